@@ -59,22 +59,21 @@ def match_amount_rule(
     and some use whole_dollar matching instead of amount ranges.
     """
     desc_upper = description.upper()
-    amount_rules = config.rules.get("amount_rules", [])
 
-    for rule_set in amount_rules:
-        pattern = rule_set.get("merchant_pattern", "")
-        # Skip empty patterns - they would match everything
-        if not pattern:
-            continue
-        if pattern.upper() not in desc_upper:
+    # Most descriptions match no merchant pattern: reject with one scan
+    prefilter = config.amount_rule_prefilter
+    if prefilter is None or prefilter.search(desc_upper) is None:
+        return None
+
+    for pattern, allowed_accounts, rules in config.amount_rule_sets:
+        if pattern not in desc_upper:
             continue
 
         # Account scoping: skip rule set if it requires specific accounts
-        allowed_accounts = rule_set.get("accounts")
         if allowed_accounts and (account_id is None or account_id not in allowed_accounts):
             continue
 
-        for rule in rule_set.get("rules", []):
+        for rule in rules:
             # Whole-dollar check (e.g., Amazon participant compensation)
             if rule.get("whole_dollar"):
                 if not _is_whole_dollar(amount):
@@ -11,6 +11,7 @@
 
 import json
 import logging
+import re
 from dataclasses import dataclass
 
 from src.config import Config
@@ -26,6 +27,9 @@
 # Cost estimate per Claude categorization call (in cents)
 CLAUDE_CATEGORIZE_COST_CENTS = 2  # ~$0.02 per call
 
+# Opening ```/```json line and closing ``` of a markdown-fenced response
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|\n?```\s*\Z")
+
 
 @dataclass
 class ClaudeCategorizationResult:
@@ -37,19 +41,7 @@ class ClaudeCategorizationResult:
 
 def _build_category_list(config: Config) -> str:
     """Build a flat list of category IDs from config for the prompt."""
-    ids: list[str] = []
-
-    def _walk(nodes: list[dict]) -> None:
-        for node in nodes:
-            cat_id = node.get("id", "")
-            if cat_id:
-                ids.append(cat_id)
-            children = node.get("children", [])
-            if children:
-                _walk(children)
-
-    _walk(config.categories)
-    return ", ".join(ids)
+    return ", ".join(config.category_ids)
 
 
 def categorize_single(
@@ -123,11 +115,7 @@ def categorize_single(
 
 def _parse_response(response: str, config: Config) -> ClaudeCategorizationResult | None:
     """Parse Claude's JSON response into a categorization result."""
-    text = response.strip()
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [line for line in lines if not line.strip().startswith("```")]
-        text = "\n".join(lines)
+    text = _FENCE_RE.sub("", response.strip())
 
     try:
         data = json.loads(text)
@@ -169,18 +157,6 @@ def _parse_response(response: str, config: Config) -> ClaudeCategorizationResult
     )
 
 
-def _get_valid_category_ids(config: Config) -> set[str]:
-    """Build a set of all valid category IDs from config."""
-    ids: set[str] = set()
-
-    def _walk(nodes: list[dict]) -> None:
-        for node in nodes:
-            cat_id = node.get("id", "")
-            if cat_id:
-                ids.add(cat_id)
-            children = node.get("children", [])
-            if children:
-                _walk(children)
-
-    _walk(config.categories)
-    return ids
+def _get_valid_category_ids(config: Config) -> frozenset[str]:
+    """Return the set of all valid category IDs from config."""
+    return config.category_id_set
@@ -43,16 +43,27 @@ def match_historical(
     normalized_description: str | None,
     amount: float,
     repo: Repository | None,
+    history: dict[str, list[dict]] | None = None,
 ) -> HistoricalMatch | None:
     """Find a historical categorization pattern for a transaction.
 
     Returns a HistoricalMatch if past transactions with the same
     normalized_description show a clear pattern, else None.
+
+    If a ``history`` dict is given, the category counts are cached in it
+    per description, so callers matching a batch against an unchanged
+    database query each description once.
     """
     if not normalized_description or repo is None:
         return None
 
-    rows = repo.get_historical_category_counts(normalized_description)
+    if history is None:
+        rows = repo.get_historical_category_counts(normalized_description)
+    else:
+        rows = history.get(normalized_description)
+        if rows is None:
+            rows = repo.get_historical_category_counts(normalized_description)
+            history[normalized_description] = rows
     if not rows:
         return None
 
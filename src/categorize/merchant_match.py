@@ -34,8 +34,7 @@ def match_merchant_auto(
       - contains: case-insensitive substring
       - exact: case-insensitive full string match
     """
-    auto_merchants = config.merchants.get("auto", [])
-    return _match_against_rules(description, auto_merchants, "auto", 1.0)
+    return _match_against_rules(description, config, "auto", 1.0)
 
 
 def match_merchant_high(
@@ -48,31 +47,33 @@ def match_merchant_high(
     occasionally be wrong (e.g., Philz is usually coffee but sometimes
     groceries for beans).
     """
-    high_merchants = config.merchants.get("high_confidence", [])
-    return _match_against_rules(description, high_merchants, "high_confidence", None)
+    return _match_against_rules(description, config, "high_confidence", None)
 
 
 def _match_against_rules(
     description: str,
-    rules: list[dict],
+    config: Config,
     tier: str,
     override_confidence: float | None,
 ) -> MerchantMatch | None:
-    """Match a description against a list of merchant rules."""
-    desc_upper = description.upper()
+    """Match a description against a tier's merchant rules, first rule wins.
 
-    for rule in rules:
-        match_type = rule.get("match", "contains")
-        pattern = rule.get("pattern", "")
-        pattern_upper = pattern.upper()
+    The tier's prefilter rejects descriptions no rule can match with one
+    regex scan; otherwise the rules are checked in file order.
+    """
+    rules, prefilter = config.merchant_rule_index.get(tier, ((), None))
+    desc_upper = description.upper()
+    if prefilter is not None and prefilter.search(desc_upper) is None:
+        return None
 
-        matched = False
+    for match_type, pattern_upper, rule in rules:
         if match_type == "exact":
             matched = desc_upper == pattern_upper
-        elif match_type == "contains":
+        else:
             matched = pattern_upper in desc_upper
 
         if matched:
+            pattern = rule.get("pattern", "")
             category_id = rule.get("category_id")
             if not category_id:
                 logger.warning(
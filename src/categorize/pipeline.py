@@ -84,6 +84,7 @@ def categorize_transaction(
     receipt_lookup: ReceiptLookup | None = None,
     claude_fn=None,
     repo: Repository | None = None,
+    history: dict[str, list[dict]] | None = None,
 ) -> CategorizeResult:
     """Run the 8-step categorization pipeline on a single transaction.
 
@@ -95,6 +96,8 @@ def categorize_transaction(
         claude_fn: Optional callable (system: str, prompt: str) -> str for
             Step 7 Claude AI categorization. If None, Step 7 is skipped.
         repo: Repository for Step 2.5 (historical patterns) and Step 7 (budget tracking).
+        history: Optional per-batch cache of historical category counts,
+            passed through to match_historical.
 
     Returns the first matching result. Falls through to manual review
     if no step matches.
@@ -156,7 +159,9 @@ def categorize_transaction(
 
     # Step 2.5: Historical pattern matching
     if repo is not None and txn.normalized_description:
-        hist = match_historical(txn.normalized_description, txn.amount, repo)
+        hist = match_historical(
+            txn.normalized_description, txn.amount, repo, history=history,
+        )
         if hist is not None:
             cat_id = _apply_filter(hist.category_id, cat_filter)
             return CategorizeResult(
@@ -232,6 +237,70 @@ def categorize_transaction(
     )
 
 
+# Methods whose result depends only on the transaction's description,
+# type, amount and account (historical matches read the database, which
+# isn't written until the whole batch is categorized).
+_MEMOIZABLE_METHODS = frozenset({
+    "transfer", "transfer_inferred", "merchant_auto", "historical_pattern",
+    "amount_rule", "account_rule", "merchant_high",
+})
+
+
+def categorize_transactions(
+    txns: list[Transaction],
+    config: Config,
+    receipt_lookup: ReceiptLookup | None = None,
+    claude_fn=None,
+    repo: Repository | None = None,
+) -> list[tuple[Transaction, CategorizeResult]]:
+    """Categorize a batch, reusing results for repeated transactions.
+
+    Statements repeat the same merchant at the same amount (subscriptions,
+    regular purchases), so a result from a rule step is reused for later
+    transactions with the same description, type, amount and account.
+    Receipt, Claude and manual-review outcomes depend on more than that
+    and are never reused, nor are transactions whose FITID marks them as
+    interest. Historical category counts are likewise fetched once per
+    description. The batch must not be written to the database until this
+    returns.
+    """
+    memo: dict[tuple, CategorizeResult] = {}
+    history: dict[str, list[dict]] = {}
+    results = []
+    for txn in txns:
+        key = None
+        if detect_interest(txn.external_id, txn.account_id, config) is None:
+            key = (
+                txn.raw_description, txn.normalized_description, txn.txn_type,
+                round(txn.amount, 2), txn.account_id,
+            )
+        result = memo.get(key) if key is not None else None
+        if result is None:
+            result = categorize_transaction(
+                txn, config, receipt_lookup=receipt_lookup,
+                claude_fn=claude_fn, repo=repo, history=history,
+            )
+            if key is not None and result.method in _MEMOIZABLE_METHODS:
+                memo[key] = result
+        results.append((txn, result))
+    return results
+
+
+def _auto_allocation(
+    txn: Transaction, result: CategorizeResult,
+) -> tuple[Allocation, str]:
+    """Build the auto allocation and resulting status for a result."""
+    status = "categorized" if result.method != "manual_review" else "flagged"
+    allocation = Allocation(
+        transaction_id=txn.id,
+        category_id=result.category_id,
+        amount=txn.amount,
+        source="auto",
+        confidence=result.confidence,
+    )
+    return allocation, status
+
+
 def apply_categorization(
     txn: Transaction,
     result: CategorizeResult,
@@ -252,16 +321,8 @@ def apply_categorization(
             receipt_lookup.apply_result(txn, result._receipt_result)
             return
 
-    status = "categorized" if result.method != "manual_review" else "flagged"
-
     # Insert allocation FIRST - if this fails, status remains unchanged
-    allocation = Allocation(
-        transaction_id=txn.id,
-        category_id=result.category_id,
-        amount=txn.amount,
-        source="auto",
-        confidence=result.confidence,
-    )
+    allocation, status = _auto_allocation(txn, result)
     repo.insert_allocation(allocation)
 
     # Only update status AFTER allocation succeeds
@@ -281,6 +342,53 @@ def apply_categorization(
             logger.warning("Failed to link transfer for %s: %s", txn.id, e)
 
 
+def apply_categorizations(
+    results: list[tuple[Transaction, CategorizeResult]],
+    repo: Repository,
+    receipt_lookup: ReceiptLookup | None = None,
+) -> list[Allocation]:
+    """Apply a batch of categorization results with one DB transaction.
+
+    Same effect as apply_categorization per pair, but the rule-based
+    allocations and status updates are written together (all or nothing).
+    Receipt splits are not part of that transaction: they go through
+    ReceiptLookup.apply_result, which commits each one before the bulk
+    write, so they stay written even if the bulk write fails. Transfer
+    counterparts are linked after the batch is written.
+
+    Returns every allocation written, receipt splits included, so callers
+    need not read them back.
+    """
+    receipt_allocs: list[Allocation] = []
+    allocs: list[Allocation] = []
+    status_updates: list[tuple[str, str, float | None, str | None]] = []
+    transfers: list[tuple[Transaction, CategorizeResult]] = []
+
+    for txn, result in results:
+        if (result.method == "gmail_receipt" and result._receipt_result is not None
+                and receipt_lookup is not None):
+            receipt_allocs.extend(
+                receipt_lookup.apply_result(txn, result._receipt_result)
+            )
+            continue
+        allocation, status = _auto_allocation(txn, result)
+        allocs.append(allocation)
+        status_updates.append((txn.id, status, result.confidence, result.method))
+        if result.is_transfer and result.transfer_type:
+            transfers.append((txn, result))
+
+    if allocs:
+        repo.apply_categorizations_bulk(allocs, status_updates)
+
+    for txn, result in transfers:
+        try:
+            _try_link_transfer(txn, result, repo)
+        except Exception as e:
+            logger.warning("Failed to link transfer for %s: %s", txn.id, e)
+
+    return receipt_allocs + allocs
+
+
 def categorize_pending(
     repo: Repository,
     config: Config,
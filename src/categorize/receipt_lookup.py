@@ -180,15 +180,17 @@ def resolve(self, txn: Transaction) -> ReceiptResult | None:
 
     def apply_result(
         self, txn: Transaction, result: ReceiptResult,
-    ) -> None:
+    ) -> list[Allocation]:
         """Apply a successful receipt match: create allocations and record match.
 
         Args:
             txn: The transaction being categorized.
             result: The ReceiptResult from resolve().
+
+        Returns the transaction's allocations (empty if nothing matched).
         """
         if not result.matched or not result.items:
-            return
+            return []
 
         # Save receipt match record
         match_record = ReceiptMatch(
@@ -210,11 +212,12 @@ def apply_result(
                 "Transaction %s already has %d allocation(s), skipping receipt allocation creation",
                 txn.id, len(existing_allocs),
             )
-            return
+            return existing_allocs
 
         # Create allocations for each item
         # Match the sign of the original transaction (negative for charges, positive for refunds)
         sign = -1 if txn.amount < 0 else 1
+        allocs = []
         for item in result.items:
             alloc = Allocation(
                 transaction_id=txn.id,
@@ -225,6 +228,7 @@ def apply_result(
                 confidence=result.confidence,
             )
             self.repo.insert_allocation(alloc)
+            allocs.append(alloc)
 
         # Update transaction status
         self.repo.update_transaction_status(
@@ -233,6 +237,7 @@ def apply_result(
             confidence=result.confidence,
             method="gmail_receipt",
         )
+        return allocs
 
     # ── Candidate detection ──────────────────────────────
 
@@ -27,32 +27,25 @@ def detect_transfer(
     Matches are case-insensitive substring checks against the normalized
     or raw description. The account_id is used to verify directionality.
     """
+    # Only rules with this account on either side can match
+    indexed = config.transfer_rule_index.get(account_id)
+    if indexed is None:
+        return None
+    rules, prefilter = indexed
+
+    # Most descriptions are not transfers: reject with one scan
     desc_upper = description.upper()
-    transfers = config.rules.get("transfers", [])
-
-    for rule in transfers:
-        # Skip Golden1 INT special rule (handled separately)
-        if "pattern_fitid_suffix" in rule:
-            continue
-
-        pattern = rule.get("pattern", "")
-        # Skip empty patterns - they would match everything
-        if not pattern:
-            continue
-        if pattern.upper() in desc_upper:
-            from_acct = rule.get("from_account", "")
-            to_acct = rule.get("to_account", "")
-            # Skip rules with empty accounts - they would match incorrectly
-            if not from_acct or not to_acct:
-                continue
-            # Match if the transaction's account is either side
-            if account_id in (from_acct, to_acct):
-                return TransferMatch(
-                    from_account=from_acct,
-                    to_account=to_acct,
-                    transfer_type=rule.get("type", "transfer") or "internal-transfer",
-                    pattern=pattern,
-                )
+    if prefilter.search(desc_upper) is None:
+        return None
+
+    for pattern, rule in rules:
+        if pattern in desc_upper:
+            return TransferMatch(
+                from_account=rule["from_account"],
+                to_account=rule["to_account"],
+                transfer_type=rule.get("type", "transfer") or "internal-transfer",
+                pattern=rule["pattern"],
+            )
     return None
 
 
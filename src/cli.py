@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -163,6 +164,18 @@ def _get_watch_dir() -> Path:
     return Path(os.environ.get("FINANCE_WATCH_DIR", "import"))
 
 
+def _get_watch_dirs() -> list[Path]:
+    """Get the directories to watch: FINANCE_WATCH_DIRS, else the watch dir.
+
+    FINANCE_WATCH_DIRS is an os.pathsep-separated list (e.g. one folder
+    for small CSV exports, one for large QFX downloads). Each folder gets
+    its own watcher and worker pool, so slow files in one don't hold up
+    files dropped in another.
+    """
+    dirs = os.environ.get("FINANCE_WATCH_DIRS", "")
+    return [Path(d) for d in dirs.split(os.pathsep) if d] or [_get_watch_dir()]
+
+
 def _get_migrations_dir() -> Path:
     """Get the migrations directory path."""
     return Path(os.environ.get(
@@ -240,12 +253,21 @@ def cmd_import(args: argparse.Namespace) -> int:
         print(f"\nProcessed {len(files)} files: {total_new} new, {total_dup} duplicates, {errors} errors")
         return 1 if errors else 0
     finally:
+        pipeline.close()
         repo.close()
 
 
 def cmd_watch(args: argparse.Namespace) -> int:
     """Start the file watcher daemon."""
-    from src.watcher.observer import FileWatcher, ImportPipeline
+    from src.watcher.observer import OBSERVER_MODES, FileWatcher, ImportPipeline
+
+    observer_mode = os.environ.get("FINANCE_WATCH_OBSERVER", "polling")
+    if observer_mode not in OBSERVER_MODES:
+        print(
+            f"Error: FINANCE_WATCH_OBSERVER must be one of"
+            f" {', '.join(OBSERVER_MODES)} (got {observer_mode!r})"
+        )
+        return 1
 
     config = _get_config()
     repo = _get_repo()
@@ -260,21 +282,30 @@ def cmd_watch(args: argparse.Namespace) -> int:
         receipt_lookup=receipt_lookup, claude_fn=claude_fn,
     )
 
-    watcher = FileWatcher(
-        watch_dir=_get_watch_dir(),
-        pipeline=pipeline,
-    )
+    # The watchers share one pipeline, whose lock serializes the database
+    # stages; parsing and stability waits run independently per folder.
+    watchers = [
+        FileWatcher(watch_dir=d, pipeline=pipeline, observer_mode=observer_mode)
+        for d in _get_watch_dirs()
+    ]
 
-    print(f"Watching {watcher.watch_dir} for bank files... (Ctrl+C to stop)")
-    watcher.start()
+    dirs = ", ".join(str(w.watch_dir) for w in watchers)
+    print(f"Watching {dirs} for bank files... (Ctrl+C to stop)")
 
+    started = []
     try:
+        for watcher in watchers:
+            watcher.start()
+            started.append(watcher)
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
         print("\nStopping watcher...")
     finally:
-        watcher.stop()
+        # A watcher whose start() failed has nothing to stop
+        for watcher in started:
+            watcher.stop()
+        pipeline.close()
         repo.close()
 
     return 0
@@ -581,13 +612,10 @@ def cmd_import_budget_app(args: argparse.Namespace) -> int:
             if sheets is not None:
                 try:
                     fresh_txns = repo.get_transactions_by_import_id(imp.id)
-                    sheets.push_transactions(fresh_txns, repo)
                     txn_ids = [t.id for t in fresh_txns]
                     alloc_map = repo.get_allocations_by_transaction_ids(txn_ids)
                     allocs = [a for al in alloc_map.values() for a in al]
-                    if allocs:
-                        sheets.push_allocations(allocs)
-                    sheets.push_review(fresh_txns, repo)
+                    sheets.push_bulk(fresh_txns, allocs, repo)
                     # Push transfers
                     from src.database.models import Transfer
                     xfer_rows = repo.conn.execute(
@@ -939,9 +967,9 @@ def _cmd_category_move(config, tree: list[dict], args: argparse.Namespace) -> in
 }
 
 
-def main(argv: list[str] | None = None):
-    _setup_logging()
-
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args() leaves it unchanged."""
     parser = argparse.ArgumentParser(
         prog="momoney",
         description="MoMoney personal finance tracker",
@@ -990,6 +1018,13 @@ def main(argv: list[str] | None = None):
     cat_move_p.add_argument("id", help="Category ID to move")
     cat_move_p.add_argument("new_parent_id", help="New parent category ID")
 
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    _setup_logging()
+
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     if args.command is None:
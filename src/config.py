@@ -5,10 +5,33 @@
   rules.yaml, parsers.yaml, budget_app_category_map.yaml
 """
 
+import re
+import sys
 from pathlib import Path
 
 import yaml
 
+# Keys whose string values are identifiers compared throughout the pipeline
+_INTERNED_KEYS = frozenset({"id", "category_id", "from_account", "to_account"})
+
+
+def _intern_ids(node) -> None:
+    """Intern identifier values in loaded YAML, in place.
+
+    Category and account IDs are compared and used as dict keys on every
+    transaction; interned strings let equal IDs from different files,
+    and the literals in code, share one object.
+    """
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in _INTERNED_KEYS and isinstance(value, str):
+                node[key] = sys.intern(value)
+            else:
+                _intern_ids(value)
+    elif isinstance(node, list):
+        for item in node:
+            _intern_ids(item)
+
 
 class Config:
     """Loads and provides access to all YAML configuration files."""
@@ -24,6 +47,20 @@ def __init__(self, config_dir: Path | str = "config"):
         self._rules: dict | None = None
         self._parsers: dict | None = None
         self._budget_app_category_map: dict | None = None
+        self._qfx_acctid_index: dict[str, str] | None = None
+        self._account_index: dict[str, dict] | None = None
+        self._amount_rule_sets: list[tuple[str, set[str] | None, list[dict]]] | None = None
+        self._amount_rule_prefilter: re.Pattern | None = None
+        self._merchant_rule_index: dict[
+            str, tuple[list[tuple[str, str, dict]], re.Pattern | None]
+        ] | None = None
+        self._transfer_rule_sets: list[tuple[str, dict]] | None = None
+        self._transfer_rule_index: dict[
+            str, tuple[list[tuple[str, dict]], re.Pattern]
+        ] | None = None
+        self._transfer_name_map: dict[str, str] | None = None
+        self._category_ids: tuple[str, ...] | None = None
+        self._category_id_set: frozenset[str] | None = None
 
     def _load(self, filename: str) -> dict | list:
         path = self.config_dir / filename
@@ -36,6 +73,7 @@ def _load(self, filename: str) -> dict | list:
                 raise ValueError(f"Invalid YAML in {path}: {e}") from e
         if data is None:
             raise ValueError(f"Empty config file: {path}")
+        _intern_ids(data)
         return data
 
     @property
@@ -105,11 +143,172 @@ def budget_app_category_map(self) -> dict[str, str]:
                     flat[budget_app_name] = category_id
         return flat
 
+    @property
+    def qfx_acctid_index(self) -> dict[str, str]:
+        """Map QFX ACCTID → account_id, built once from accounts."""
+        if self._qfx_acctid_index is None:
+            index: dict[str, str] = {}
+            for acct in self.accounts:
+                acctid = acct.get("qfx_acctid")
+                if acctid:
+                    index.setdefault(acctid, acct["id"])  # First entry wins
+            self._qfx_acctid_index = index
+        return self._qfx_acctid_index
+
+    @property
+    def amount_rule_sets(self) -> list[tuple[str, set[str] | None, list[dict]]]:
+        """amount_rules from rules.yaml, prepared once for matching.
+
+        Each entry is (uppercased merchant_pattern, allowed account set or
+        None, rules), in file order. Empty patterns are dropped since they
+        would match everything.
+        """
+        if self._amount_rule_sets is None:
+            sets = []
+            for rule_set in self.rules.get("amount_rules", []):
+                pattern = rule_set.get("merchant_pattern", "")
+                if not pattern:
+                    continue
+                accounts = rule_set.get("accounts")
+                sets.append((
+                    pattern.upper(),
+                    set(accounts) if accounts else None,
+                    rule_set.get("rules", []),
+                ))
+            self._amount_rule_sets = sets
+            self._amount_rule_prefilter = re.compile(
+                "|".join(re.escape(p) for p, _, _ in sets)
+            ) if sets else None
+        return self._amount_rule_sets
+
+    @property
+    def amount_rule_prefilter(self) -> re.Pattern | None:
+        """One regex matching any amount-rule merchant pattern (uppercase).
+
+        Lets callers reject descriptions no rule could match with a
+        single scan. None if there are no amount rules.
+        """
+        self.amount_rule_sets  # Builds the prefilter alongside the sets
+        return self._amount_rule_prefilter
+
+    @property
+    def merchant_rule_index(
+        self,
+    ) -> dict[str, tuple[list[tuple[str, str, dict]], re.Pattern | None]]:
+        """merchants.yaml tiers, prepared once for matching.
+
+        Each tier maps to (rules, prefilter). rules holds (match type,
+        uppercased pattern, rule) in file order, leaving out rules whose
+        match type is neither "contains" nor "exact". prefilter is one
+        regex over the uppercased description that matches whenever some
+        rule could (contains patterns anywhere, exact patterns as the
+        whole string); None when an empty contains pattern matches
+        everything.
+        """
+        if self._merchant_rule_index is None:
+            index = {}
+            for tier, rules in self.merchants.items():
+                if not isinstance(rules, list):
+                    continue
+                prepared = []
+                for rule in rules:
+                    match_type = rule.get("match", "contains")
+                    if match_type in ("contains", "exact"):
+                        prepared.append((match_type, rule.get("pattern", "").upper(), rule))
+                contains = [re.escape(p) for t, p, _ in prepared if t == "contains"]
+                exact = [re.escape(p) for t, p, _ in prepared if t == "exact"]
+                alternatives = []
+                if contains:
+                    alternatives.append("|".join(contains))
+                if exact:
+                    alternatives.append(r"\A(?:" + "|".join(exact) + r")\Z")
+                prefilter = None
+                if "" not in contains:
+                    prefilter = re.compile("|".join(alternatives) or "(?!)")
+                index[tier] = (prepared, prefilter)
+            self._merchant_rule_index = index
+        return self._merchant_rule_index
+
+    @property
+    def transfer_rule_sets(self) -> list[tuple[str, dict]]:
+        """transfers from rules.yaml, prepared once for matching.
+
+        Each entry is (uppercased pattern, rule), in file order. FITID
+        suffix rules are left out (interest detection handles those), as
+        are rules with an empty pattern or a missing account, which
+        would match incorrectly.
+        """
+        if self._transfer_rule_sets is None:
+            sets = []
+            for rule in self.rules.get("transfers", []):
+                if "pattern_fitid_suffix" in rule:
+                    continue
+                pattern = rule.get("pattern", "")
+                if not pattern:
+                    continue
+                if not rule.get("from_account") or not rule.get("to_account"):
+                    continue
+                sets.append((pattern.upper(), rule))
+            self._transfer_rule_sets = sets
+        return self._transfer_rule_sets
+
+    @property
+    def transfer_rule_index(
+        self,
+    ) -> dict[str, tuple[list[tuple[str, dict]], re.Pattern]]:
+        """transfer_rule_sets grouped by the accounts each rule joins.
+
+        Maps an account ID to (rules, prefilter): the (uppercased
+        pattern, rule) entries with that account on either side, in file
+        order, and one regex matching any of their patterns. Accounts no
+        rule mentions are absent.
+        """
+        if self._transfer_rule_index is None:
+            grouped: dict[str, list[tuple[str, dict]]] = {}
+            for pattern, rule in self.transfer_rule_sets:
+                for acct in {rule["from_account"], rule["to_account"]}:
+                    grouped.setdefault(acct, []).append((pattern, rule))
+            self._transfer_rule_index = {
+                acct: (rules, re.compile("|".join(re.escape(p) for p, _ in rules)))
+                for acct, rules in grouped.items()
+            }
+        return self._transfer_rule_index
+
+    @property
+    def category_ids(self) -> tuple[str, ...]:
+        """Every category ID in the tree, depth-first in file order."""
+        if self._category_ids is None:
+            ids: list[str] = []
+
+            def _walk(nodes: list[dict]) -> None:
+                for node in nodes:
+                    cat_id = node.get("id", "")
+                    if cat_id:
+                        ids.append(cat_id)
+                    children = node.get("children", [])
+                    if children:
+                        _walk(children)
+
+            _walk(self.categories)
+            self._category_ids = tuple(ids)
+            self._category_id_set = frozenset(ids)
+        return self._category_ids
+
+    @property
+    def category_id_set(self) -> frozenset[str]:
+        """category_ids as a set, for membership checks."""
+        self.category_ids  # Builds the set alongside the tuple
+        return self._category_id_set
+
     def account_by_id(self, account_id: str) -> dict | None:
-        for acct in self.accounts:
-            if acct.get("id") == account_id:
-                return acct
-        return None
+        if self._account_index is None:
+            index: dict[str, dict] = {}
+            for acct in self.accounts:
+                acct_id = acct.get("id")
+                if acct_id:
+                    index.setdefault(acct_id, acct)  # First entry wins
+            self._account_index = index
+        return self._account_index.get(account_id)
 
     def category_filter_for(self, account_id: str) -> dict | None:
         """Return the category_filter config for an account, or None.
@@ -167,21 +366,23 @@ def transfer_name_map(self) -> dict[str, str]:
         """Map uppercased account display names to account IDs.
 
         Used by detect_transfer_by_txn_type() to resolve the target account
-        from 'Transfer : <name>' descriptions in QFX files.
+        from 'Transfer : <name>' descriptions in QFX files. Built once.
         """
-        name_map: dict[str, str] = {}
-        for acct in self.accounts:
-            acct_id = acct.get("id", "")
-            if not acct_id:
-                continue
-            for key in ("name", "budget_app_name"):
-                val = acct.get(key, "")
-                if val:
-                    name_map[val.upper()] = acct_id
-            for alias in acct.get("transfer_aliases", []):
-                if alias:
-                    name_map[alias.upper()] = acct_id
-        return name_map
+        if self._transfer_name_map is None:
+            name_map: dict[str, str] = {}
+            for acct in self.accounts:
+                acct_id = acct.get("id", "")
+                if not acct_id:
+                    continue
+                for key in ("name", "budget_app_name"):
+                    val = acct.get(key, "")
+                    if val:
+                        name_map[val.upper()] = acct_id
+                for alias in acct.get("transfer_aliases", []):
+                    if alias:
+                        name_map[alias.upper()] = acct_id
+            self._transfer_name_map = name_map
+        return self._transfer_name_map
 
     @property
     def budget_app_account_routing(self) -> dict[str, str]:
@@ -62,9 +62,15 @@ def __init__(self, repo: Repository):
 
     # ── Tier 1: File hash ─────────────────────────────────
 
-    def check_file_duplicate(self, file_path: Path) -> bool:
-        """Return True if this exact file has already been imported."""
-        file_hash = compute_file_hash(file_path)
+    def check_file_duplicate(
+        self, file_path: Path, file_hash: str | None = None,
+    ) -> bool:
+        """Return True if this exact file has already been imported.
+
+        Pass file_hash if the caller already computed it.
+        """
+        if file_hash is None:
+            file_hash = compute_file_hash(file_path)
         existing = self.repo.get_import_by_hash(file_hash)
         return existing is not None
 
@@ -0,0 +1,11 @@
+-- Migration 004: Covering indexes for historical pattern matching
+-- Step 2.5 looks up categorized transactions by normalized_description and
+-- joins their allocations. With these, both sides are answered from the
+-- indexes alone, without reading table rows.
+
+CREATE INDEX IF NOT EXISTS idx_txn_normdesc_status
+    ON transactions(normalized_description, status, amount, id)
+    WHERE normalized_description IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_alloc_txn_category
+    ON allocations(transaction_id, category_id, source);
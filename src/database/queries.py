@@ -91,6 +91,32 @@ def get_category_summary(
     return [dict(r) for r in rows]
 
 
+def get_all_category_summaries(conn: sqlite3.Connection) -> dict[str, list[dict]]:
+    """Spending by category for every month, in one grouped query.
+
+    Returns a dict mapping 'YYYY-MM' to that month's rows, in month
+    order, each month ordered like get_category_summary (total ASC).
+    """
+    rows = conn.execute(
+        "SELECT SUBSTR(t.date, 1, 7) AS month,"
+        "  a.category_id,"
+        "  SUM(a.amount) AS total,"
+        "  COUNT(*) AS txn_count"
+        " FROM allocations a"
+        " JOIN transactions t ON a.transaction_id = t.id"
+        " GROUP BY month, a.category_id"
+        " ORDER BY month, total ASC"
+    ).fetchall()
+    result: dict[str, list[dict]] = {}
+    for r in rows:
+        result.setdefault(r["month"], []).append({
+            "category_id": r["category_id"],
+            "total": r["total"],
+            "txn_count": r["txn_count"],
+        })
+    return result
+
+
 def get_reconciliation_data(
     conn: sqlite3.Connection, account_id: str
 ) -> dict:
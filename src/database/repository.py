@@ -19,6 +19,19 @@
     Transfer,
 )
 
+# Category counts per (category, amount) for one normalized_description,
+# served from idx_txn_normdesc_status and idx_alloc_txn_category
+HISTORICAL_CATEGORY_COUNTS_SQL = (
+    "SELECT a.category_id, t.amount,"
+    "  COUNT(*) AS cnt,"
+    "  SUM(CASE WHEN a.source = 'user' THEN 1 ELSE 0 END) AS user_cnt"
+    " FROM transactions t"
+    " JOIN allocations a ON a.transaction_id = t.id"
+    " WHERE t.normalized_description = ?"
+    "   AND t.status = 'categorized'"
+    " GROUP BY a.category_id, t.amount"
+)
+
 
 class DuplicateImportError(Exception):
     """Raised when attempting to import a file with a hash that already exists."""
@@ -350,6 +363,43 @@ def insert_allocations_batch(self, allocs: list[Allocation]):
             self.conn.rollback()
             raise
 
+    def apply_categorizations_bulk(
+        self,
+        allocs: list[Allocation],
+        status_updates: list[tuple[str, str, float | None, str | None]],
+    ):
+        """Insert allocations and update transaction statuses atomically.
+
+        status_updates rows are (txn_id, status, confidence, method).
+        One transaction and one commit for the whole batch.
+        """
+        try:
+            self.conn.execute("BEGIN")
+            self.conn.executemany(
+                "INSERT INTO allocations"
+                " (id, transaction_id, category_id, amount, memo, tags,"
+                "  source, confidence, created_at)"
+                " VALUES (?,?,?,?,?,?,?,?,?)",
+                [
+                    (a.id, a.transaction_id, a.category_id, a.amount,
+                     a.memo, a.tags, a.source, a.confidence, a.created_at)
+                    for a in allocs
+                ],
+            )
+            self.conn.executemany(
+                "UPDATE transactions SET status = ?, confidence = ?,"
+                " categorization_method = ?, updated_at = CURRENT_TIMESTAMP"
+                " WHERE id = ?",
+                [
+                    (status, confidence, method, txn_id)
+                    for txn_id, status, confidence, method in status_updates
+                ],
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
     def get_allocations_by_transaction(
         self, txn_id: str
     ) -> list[Allocation]:
@@ -485,15 +535,7 @@ def get_historical_category_counts(
         Only considers transactions with status='categorized'.
         """
         rows = self.conn.execute(
-            "SELECT a.category_id, t.amount,"
-            "  COUNT(*) AS cnt,"
-            "  SUM(CASE WHEN a.source = 'user' THEN 1 ELSE 0 END) AS user_cnt"
-            " FROM transactions t"
-            " JOIN allocations a ON a.transaction_id = t.id"
-            " WHERE t.normalized_description = ?"
-            "   AND t.status = 'categorized'"
-            " GROUP BY a.category_id, t.amount",
-            (normalized_description,),
+            HISTORICAL_CATEGORY_COUNTS_SQL, (normalized_description,),
         ).fetchall()
         return [
             {
@@ -8,6 +8,9 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+# Bytes read from the start of a file for format detection
+HEAD_BYTES = 65536
+
 
 @dataclass
 class RawTransaction:
@@ -44,9 +47,23 @@ def parse(self, file_path: Path) -> list[RawTransaction]:
         skipped due to validation failures, missing account routing, etc.
         """
 
+    def detect(self, file_path: Path, head: bytes | None = None) -> bool:
+        """Return True if this parser can handle the given file.
+
+        head: Optional pre-read start of the file (see read_head) so
+            several detect() calls can share one read.
+        """
+        try:
+            if head is None:
+                head = read_head(file_path)
+            return self.sniff(head)
+        except OSError:
+            return False
+
+    @classmethod
     @abstractmethod
-    def detect(self, file_path: Path) -> bool:
-        """Return True if this parser can handle the given file."""
+    def sniff(cls, head: bytes) -> bool:
+        """Return True if the file's leading bytes match this format."""
 
 
 def normalize_description(desc: str) -> str:
@@ -80,6 +97,12 @@ def compute_dedup_key(account_id: str, date: str, amount: float) -> str:
     return f"{account_id}:{date}:{cents}"
 
 
+def read_head(file_path: Path, size: int = HEAD_BYTES) -> bytes:
+    """Read the first `size` bytes of a file for format detection."""
+    with open(file_path, "rb") as f:
+        return f.read(size)
+
+
 def compute_file_hash(file_path: Path) -> str:
     """Tier 1 dedup: SHA256 of entire file contents."""
     h = hashlib.sha256()
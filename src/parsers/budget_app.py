@@ -41,14 +41,11 @@ def __init__(
         self.category_map = category_map or {}
         self.account_routing = account_routing or {}
 
-    def detect(self, file_path: Path) -> bool:
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
         """Budget app CSVs have 'Category Group/Category' and 'Outflow' columns."""
-        try:
-            with open(file_path, "r", encoding="utf-8-sig", errors="replace") as f:
-                header = f.readline()
-            return "Category Group/Category" in header and "Outflow" in header
-        except (OSError, UnicodeDecodeError):
-            return False
+        header = head.split(b"\n", 1)[0].decode("utf-8-sig", errors="replace")
+        return "Category Group/Category" in header and "Outflow" in header
 
     def parse(self, file_path: Path) -> list[RawTransaction]:
         transactions: list[RawTransaction] = []
@@ -34,14 +34,11 @@ def __init__(self, account_routing: dict[str, str] | None = None):
         super().__init__()
         self.account_routing = account_routing or {}
 
-    def detect(self, file_path: Path) -> bool:
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
         """Mercury CSVs have 'Source Account' and 'Mercury Category' columns."""
-        try:
-            with open(file_path, "r", errors="replace") as f:
-                header = f.readline()
-            return "Source Account" in header and "Mercury Category" in header
-        except (OSError, UnicodeDecodeError):
-            return False
+        header = head.split(b"\n", 1)[0].decode(errors="replace")
+        return "Source Account" in header and "Mercury Category" in header
 
     def parse(self, file_path: Path) -> list[RawTransaction]:
         transactions: list[RawTransaction] = []
@@ -23,14 +23,11 @@ def __init__(self, account_id: str):
         super().__init__()
         self.account_id = account_id
 
-    def detect(self, file_path: Path) -> bool:
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
         """SGML files start with OFXHEADER:100 (no <?xml)."""
-        try:
-            with open(file_path, "r", errors="replace") as f:
-                head = f.read(200)
-            return "OFXHEADER:100" in head and "<?xml" not in head.lower()
-        except (OSError, UnicodeDecodeError):
-            return False
+        start = head[:200]
+        return b"OFXHEADER:100" in start and b"<?xml" not in start.lower()
 
     def parse(self, file_path: Path) -> list[RawTransaction]:
         with open(file_path, "r", errors="replace") as f:
@@ -24,14 +24,11 @@ def __init__(self, account_id: str):
         super().__init__()
         self.account_id = account_id
 
-    def detect(self, file_path: Path) -> bool:
+    @classmethod
+    def sniff(cls, head: bytes) -> bool:
         """XML files have <?xml or <?OFX header."""
-        try:
-            with open(file_path, "r", errors="replace") as f:
-                head = f.read(200)
-            return ("<?xml" in head.lower() or "<?OFX" in head) and "<OFX>" in head
-        except (OSError, UnicodeDecodeError):
-            return False
+        start = head[:200]
+        return (b"<?xml" in start.lower() or b"<?OFX" in start) and b"<OFX>" in start
 
     def parse(self, file_path: Path) -> list[RawTransaction]:
         content = self._read_and_clean(file_path)
@@ -10,12 +10,19 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from src.database.models import Allocation, Transaction, Transfer
-from src.database.queries import batch_is_transfer, get_category_summary
+from src.database.queries import (
+    batch_is_transfer,
+    get_all_category_summaries,
+    get_category_summary,
+)
 from src.database.repository import Repository
 
 try:
@@ -91,16 +98,23 @@
 # Rate limiting
 MAX_WRITES_PER_MINUTE = 50
 BATCH_SIZE = 100
+REPLACE_BATCH_SIZE = 5000
+MAX_PARALLEL_SHEETS = 6
 
 
 # ── Data transformation ──────────────────────────────────
 
 
-def _val(v: object) -> str | float | int:
-    """Convert a value for Sheets: None → empty string, else pass through."""
-    if v is None:
-        return ""
-    return v
+# Row builders run once per row on every push, so None → "" is written
+# inline at each optional field rather than through a helper call.
+
+# Transactions without allocations still get one Review row (alloc=None)
+_NO_ALLOCATION: tuple[None] = (None,)
+
+
+def _first_category(allocs: Sequence[Allocation] | None) -> str | None:
+    """Category of a transaction's first allocation, or None if it has none."""
+    return allocs[0].category_id if allocs else None
 
 
 def txn_to_row(txn: Transaction, transfer_flag: bool, category_id: str | None = None) -> list:
@@ -110,17 +124,17 @@ def txn_to_row(txn: Transaction, transfer_flag: bool, category_id: str | None =
         txn.date,
         txn.amount,
         txn.raw_description,
-        _val(txn.normalized_description),
-        _val(txn.memo),
-        _val(txn.txn_type),
-        _val(txn.check_num),
+        "" if txn.normalized_description is None else txn.normalized_description,
+        "" if txn.memo is None else txn.memo,
+        "" if txn.txn_type is None else txn.txn_type,
+        "" if txn.check_num is None else txn.check_num,
         txn.account_id,
         txn.status,
-        _val(txn.confidence),
-        _val(txn.categorization_method),
+        "" if txn.confidence is None else txn.confidence,
+        "" if txn.categorization_method is None else txn.categorization_method,
         transfer_flag,
-        _val(txn.receipt_lookup_status),
-        _val(category_id),
+        "" if txn.receipt_lookup_status is None else txn.receipt_lookup_status,
+        "" if category_id is None else category_id,
     ]
 
 
@@ -131,10 +145,10 @@ def alloc_to_row(alloc: Allocation) -> list:
         alloc.transaction_id,
         alloc.category_id,
         alloc.amount,
-        _val(alloc.memo),
-        _val(alloc.tags),
+        "" if alloc.memo is None else alloc.memo,
+        "" if alloc.tags is None else alloc.tags,
         alloc.source,
-        _val(alloc.confidence),
+        "" if alloc.confidence is None else alloc.confidence,
     ]
 
 
@@ -146,14 +160,18 @@ def transfer_to_row(xfer: Transfer) -> list:
         xfer.to_transaction_id,
         xfer.transfer_type,
         xfer.match_method,
-        _val(xfer.confidence),
+        "" if xfer.confidence is None else xfer.confidence,
     ]
 
 
+# Shared read-only fallback for categories missing from the lookup
+_NO_META: dict = {}
+
+
 def summary_to_row(month: str, row: dict, cat_lookup: dict[str, dict] | None = None) -> list:
     """Convert a category summary dict to a Sheets row with hierarchy."""
     cat_id = row["category_id"]
-    meta = (cat_lookup or {}).get(cat_id, {})
+    meta = cat_lookup.get(cat_id, _NO_META) if cat_lookup else _NO_META
     return [
         month,
         cat_id,
@@ -194,24 +212,24 @@ def review_to_row(
         txn.date,
         txn.account_id,
         txn.amount,
-        _val(txn.normalized_description),
+        "" if txn.normalized_description is None else txn.normalized_description,
         alloc.category_id if alloc else "",
         alloc.amount if alloc else txn.amount,
-        _val(txn.confidence),
-        _val(txn.categorization_method),
+        "" if txn.confidence is None else txn.confidence,
+        "" if txn.categorization_method is None else txn.categorization_method,
         alloc.source if alloc else "",
         txn.status,
         transfer_flag,
         txn.raw_description,
-        _val(txn.memo),
-        _val(txn.receipt_lookup_status),
-        _val(txn.txn_type),
-        _val(txn.check_num),
-        _val(alloc.memo) if alloc else "",
-        _val(alloc.tags) if alloc else "",
+        "" if txn.memo is None else txn.memo,
+        "" if txn.receipt_lookup_status is None else txn.receipt_lookup_status,
+        "" if txn.txn_type is None else txn.txn_type,
+        "" if txn.check_num is None else txn.check_num,
+        alloc.memo if alloc and alloc.memo is not None else "",
+        alloc.tags if alloc and alloc.tags is not None else "",
         txn.id,
         alloc.id if alloc else "",
-        _val(alloc.confidence) if alloc else "",
+        alloc.confidence if alloc and alloc.confidence is not None else "",
     ]
 
 
@@ -240,83 +258,223 @@ def __init__(self, spreadsheet: object):
         self.spreadsheet = spreadsheet
         self.pending_appends: dict[str, list[list]] = {}
         self.pending_clears: set[str] = set()
+        self.pending_replaces: dict[str, list[list]] = {}
         self._write_times: deque[float] = deque()
+        # Sheets upload in parallel, so the rate limiter is shared across
+        # worker threads. In-flight writes count against the quota until
+        # they are recorded, so concurrent callers can't overshoot it.
+        self._rate_lock = threading.Lock()
+        self._writes_in_flight = 0
+        # Worksheet handles by tab name; worksheet() scans the spreadsheet
+        # metadata (and may refetch it) on every call.
+        self._ws_cache: dict[str, object] = {}
+        # Sheets confirmed empty before a replace; their clear is skipped
+        self._empty_sheets: set[str] = set()
 
     # ── Queue operations ─────────────────────────────────
 
     def queue_append(self, sheet_name: str, rows: list[list]) -> None:
-        """Queue rows for append to a sheet. Call flush() to execute."""
-        if sheet_name not in self.pending_appends:
-            self.pending_appends[sheet_name] = []
-        self.pending_appends[sheet_name].extend(rows)
+        """Queue rows for append to a sheet. Call flush() to execute.
+
+        If the sheet has a pending replace, the rows join that write.
+        The first list queued for a sheet is kept as the queue buffer
+        rather than copied, so callers must not reuse it afterwards.
+        """
+        if sheet_name in self.pending_replaces:
+            self.pending_replaces[sheet_name].extend(rows)
+            return
+        pending = self.pending_appends.get(sheet_name)
+        if pending is None:
+            self.pending_appends[sheet_name] = rows
+        else:
+            pending.extend(rows)
 
     def queue_clear(self, sheet_name: str) -> None:
         """Queue a sheet for clearing (used by full_rebuild)."""
         self.pending_clears.add(sheet_name)
 
+    def queue_replace(self, sheet_name: str, rows: list[list]) -> None:
+        """Queue a sheet to be cleared and rewritten from A1 with rows.
+
+        Costs one clear plus one update per REPLACE_BATCH_SIZE rows,
+        instead of one append per BATCH_SIZE rows (used by full_rebuild).
+        Like queue_append, the rows list is kept rather than copied.
+        Appends already queued for the sheet are dropped: the replace
+        rows are its full contents, and a concurrent append would race
+        the clear.
+        """
+        dropped = self.pending_appends.pop(sheet_name, None)
+        if dropped:
+            logger.info(
+                "Dropping %d queued row(s) for '%s', superseded by a replace",
+                len(dropped), sheet_name,
+            )
+        self.pending_replaces[sheet_name] = rows
+
+    def _get_ws(self, sheet_name: str) -> object:
+        """Return the worksheet for sheet_name, looking it up only once."""
+        ws = self._ws_cache.get(sheet_name)
+        if ws is None:
+            ws = self.spreadsheet.worksheet(sheet_name)
+            self._ws_cache[sheet_name] = ws
+        return ws
+
+    def _find_empty_sheets(self, sheet_names: list[str]) -> set[str]:
+        """Return the sheets whose A1 cell is empty, using one read request.
+
+        Every push writes headers at A1, so an empty A1 means there is
+        nothing to clear. Reads don't count against the write quota. On
+        any failure returns an empty set, so every sheet is still cleared.
+        """
+        try:
+            resp = self.spreadsheet.values_batch_get(
+                [f"'{name}'!A1" for name in sheet_names]
+            )
+            value_ranges = resp.get("valueRanges", [])
+        except Exception as e:
+            logger.warning("Could not check for empty sheets: %s", e)
+            return set()
+        return {
+            name for name, vr in zip(sheet_names, value_ranges)
+            if not vr.get("values")
+        }
+
     # ── Rate limiting ────────────────────────────────────
 
     def _wait_for_rate_limit(self) -> None:
-        """Sleep if we're approaching the write rate limit."""
-        now = time.monotonic()
-        cutoff = now - 60.0
-        # Purge timestamps older than 60 seconds
-        while self._write_times and self._write_times[0] <= cutoff:
-            self._write_times.popleft()
+        """Sleep if we're approaching the write rate limit.
 
-        if len(self._write_times) >= MAX_WRITES_PER_MINUTE:
-            sleep_until = self._write_times[0] + 60.0
-            time.sleep(sleep_until - now)
+        Reserves a write slot; every call must be paired with _record_write().
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            cutoff = now - 60.0
+            # Purge timestamps older than 60 seconds
+            while self._write_times and self._write_times[0] <= cutoff:
+                self._write_times.popleft()
+
+            pending = len(self._write_times) + self._writes_in_flight
+            if self._write_times and pending >= MAX_WRITES_PER_MINUTE:
+                sleep_until = self._write_times[0] + 60.0
+                time.sleep(sleep_until - now)
+            self._writes_in_flight += 1
 
     def _record_write(self) -> None:
-        """Record a write operation timestamp."""
-        self._write_times.append(time.monotonic())
+        """Record a write operation timestamp, releasing its reserved slot."""
+        with self._rate_lock:
+            self._writes_in_flight -= 1
+            self._write_times.append(time.monotonic())
+
+    def _rate_limited_write(self, fn, *args, **kwargs):
+        """Call a Sheets write method inside a reserved rate-limit slot."""
+        self._wait_for_rate_limit()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            # A failed request still counts against the quota
+            self._record_write()
 
     # ── Flush ────────────────────────────────────────────
 
+    def _upload_sheet(
+        self, sheet_name: str, rows: list[list], replace: bool = False,
+    ) -> PushResult:
+        """Write one sheet's pending rows (runs in a worker thread).
+
+        Appends go out in BATCH_SIZE chunks. Replaces clear the sheet
+        (unless it is known to be empty), grow its grid if it has fewer
+        rows than the data, since values.update doesn't add rows, then
+        write rows from A1 in REPLACE_BATCH_SIZE chunks.
+        """
+        ws = self._get_ws(sheet_name)
+        api_calls = 0
+        if replace:
+            if sheet_name in self._empty_sheets:
+                # Only skip once: a retry after a failed update must clear
+                self._empty_sheets.discard(sheet_name)
+            else:
+                self._rate_limited_write(ws.clear)
+                api_calls += 1
+            if len(rows) > ws.row_count:
+                self._rate_limited_write(ws.resize, rows=len(rows))
+                api_calls += 1
+            for i in range(0, len(rows), REPLACE_BATCH_SIZE):
+                chunk = rows[i : i + REPLACE_BATCH_SIZE]
+                self._rate_limited_write(
+                    ws.update, values=chunk, range_name=f"A{i + 1}",
+                    value_input_option="RAW",
+                )
+                api_calls += 1
+        else:
+            for i in range(0, len(rows), BATCH_SIZE):
+                chunk = rows[i : i + BATCH_SIZE]
+                self._rate_limited_write(
+                    ws.append_rows, chunk, value_input_option="RAW",
+                )
+                api_calls += 1
+        return PushResult(
+            sheet=sheet_name,
+            rows_pushed=len(rows),
+            api_calls=api_calls,
+        )
+
     def flush(self) -> list[PushResult]:
         """Execute all pending operations with rate limiting and batching.
 
-        Returns a list of PushResult for each sheet that was written to.
-        Continues processing remaining sheets if one fails.
+        Clears run first, then each sheet's replace or appends are
+        uploaded in parallel (up to MAX_PARALLEL_SHEETS at once) sharing
+        one rate limiter. Returns a list of PushResult for each sheet that
+        was written to. Continues processing remaining sheets if one fails.
         """
         results: list[PushResult] = []
         errors: list[str] = []
 
+        # Take ownership of the queues up front; failed work is re-queued
+        clears, self.pending_clears = self.pending_clears, set()
+        replaces, self.pending_replaces = self.pending_replaces, {}
+        appends, self.pending_appends = self.pending_appends, {}
+
         # Process clears first
-        for sheet_name in list(self.pending_clears):
+        for sheet_name in clears:
             try:
-                self._wait_for_rate_limit()
-                ws = self.spreadsheet.worksheet(sheet_name)
-                ws.clear()
-                self._record_write()
-                self.pending_clears.discard(sheet_name)
+                ws = self._get_ws(sheet_name)
+                self._rate_limited_write(ws.clear)
             except Exception as e:
                 logger.error("Failed to clear sheet '%s': %s", sheet_name, e)
+                # The tab may have been renamed or deleted; look it up again
+                self._ws_cache.pop(sheet_name, None)
                 errors.append(f"clear:{sheet_name}")
-
-        # Process appends
-        for sheet_name, rows in list(self.pending_appends.items()):
-            if not rows:
-                continue
-            try:
-                ws = self.spreadsheet.worksheet(sheet_name)
-                api_calls = 0
-                for i in range(0, len(rows), BATCH_SIZE):
-                    chunk = rows[i : i + BATCH_SIZE]
-                    self._wait_for_rate_limit()
-                    ws.append_rows(chunk, value_input_option="RAW")
-                    self._record_write()
-                    api_calls += 1
-                results.append(PushResult(
-                    sheet=sheet_name,
-                    rows_pushed=len(rows),
-                    api_calls=api_calls,
-                ))
-                del self.pending_appends[sheet_name]
-            except Exception as e:
-                logger.error("Failed to push to sheet '%s': %s", sheet_name, e)
-                errors.append(f"push:{sheet_name}")
+                self.pending_clears.add(sheet_name)
+
+        # Process replaces and appends, one worker per sheet. A replace
+        # and an append for one sheet would race, so the replace wins
+        for name in replaces.keys() & appends.keys():
+            logger.warning(
+                "Dropping %d queued row(s) for '%s', superseded by a replace",
+                len(appends.pop(name)), name,
+            )
+        work = [(name, rows, True) for name, rows in replaces.items()]
+        work += [(name, rows, False) for name, rows in appends.items() if rows]
+        if work:
+            max_workers = min(MAX_PARALLEL_SHEETS, len(work))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    (name, rows, replace,
+                     pool.submit(self._upload_sheet, name, rows, replace))
+                    for name, rows, replace in work
+                ]
+                for sheet_name, rows, replace, future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        op = "replace" if replace else "push"
+                        logger.error("Failed to %s sheet '%s': %s", op, sheet_name, e)
+                        self._ws_cache.pop(sheet_name, None)
+                        errors.append(f"{op}:{sheet_name}")
+                        if replace:
+                            self.pending_replaces[sheet_name] = rows
+                        else:
+                            self.pending_appends[sheet_name] = rows
 
         if errors:
             logger.warning("Sheets push completed with %d error(s): %s", len(errors), errors)
@@ -332,12 +490,11 @@ def push_transactions(self, txns: list[Transaction], repo: Repository) -> PushRe
         txn_ids = [t.id for t in txns]
         transfer_ids = batch_is_transfer(repo.conn, txn_ids)
         alloc_map = repo.get_allocations_by_transaction_ids(txn_ids)
-        rows = []
-        for txn in txns:
-            flag = txn.id in transfer_ids
-            allocs = alloc_map.get(txn.id, [])
-            cat = allocs[0].category_id if allocs else None
-            rows.append(txn_to_row(txn, flag, category_id=cat))
+        rows = [
+            txn_to_row(t, t.id in transfer_ids,
+                       category_id=_first_category(alloc_map.get(t.id)))
+            for t in txns
+        ]
         self.queue_append(SHEET_TRANSACTIONS, rows)
         results = self.flush()
         return results[0] if results else None
@@ -367,19 +524,46 @@ def push_review(self, txns: list[Transaction], repo: Repository) -> PushResult |
         txn_ids = [t.id for t in txns]
         transfer_ids = batch_is_transfer(repo.conn, txn_ids)
         alloc_map = repo.get_allocations_by_transaction_ids(txn_ids)
-        rows = []
-        for txn in txns:
-            flag = txn.id in transfer_ids
-            allocs = alloc_map.get(txn.id, [])
-            if allocs:
-                for a in allocs:
-                    rows.append(review_to_row(txn, a, flag))
-            else:
-                rows.append(review_to_row(txn, None, flag))
+        rows = [
+            review_to_row(t, a, t.id in transfer_ids)
+            for t in txns
+            for a in alloc_map.get(t.id) or _NO_ALLOCATION
+        ]
         self.queue_append(SHEET_REVIEW, rows)
         results = self.flush()
         return results[0] if results else None
 
+    def push_bulk(
+        self, txns: list[Transaction], allocs: list[Allocation], repo: Repository,
+    ) -> list[PushResult]:
+        """Push transactions, their allocations and review rows in one flush.
+
+        Same rows as push_transactions + push_allocations + push_review,
+        but the three sheets upload in parallel under one rate limiter
+        instead of three sequential flushes. allocs must hold every
+        allocation of txns; the category and review columns are built
+        from it rather than queried again.
+        """
+        if not txns:
+            return []
+        transfer_ids = batch_is_transfer(repo.conn, [t.id for t in txns])
+        alloc_map: dict[str, list[Allocation]] = {}
+        for a in allocs:
+            alloc_map.setdefault(a.transaction_id, []).append(a)
+        self.queue_append(SHEET_TRANSACTIONS, [
+            txn_to_row(t, t.id in transfer_ids,
+                       category_id=_first_category(alloc_map.get(t.id)))
+            for t in txns
+        ])
+        if allocs:
+            self.queue_append(SHEET_ALLOCATIONS, [alloc_to_row(a) for a in allocs])
+        self.queue_append(SHEET_REVIEW, [
+            review_to_row(t, a, t.id in transfer_ids)
+            for t in txns
+            for a in alloc_map.get(t.id) or _NO_ALLOCATION
+        ])
+        return self.flush()
+
     def push_summary(self, month: str, repo: Repository) -> PushResult | None:
         """Compute and push monthly category summary."""
         summary = get_category_summary(repo.conn, month)
@@ -393,79 +577,76 @@ def push_summary(self, month: str, repo: Repository) -> PushResult | None:
     def full_rebuild(self, repo: Repository, config=None) -> list[PushResult]:
         """Truncate all sheets and re-push all data from SQLite.
 
-        Clears all six sheets, writes headers, then pushes all
+        Replaces all six sheets with headers followed by all
         transactions, allocations, transfers, summary, review, and
-        category hierarchy data.
+        category hierarchy data. Each sheet costs one clear plus one
+        update, rather than a clear and one append per BATCH_SIZE rows;
+        the clear is skipped for sheets that are already empty.
         """
-        sheet_names = [
-            SHEET_TRANSACTIONS, SHEET_ALLOCATIONS,
-            SHEET_TRANSFERS, SHEET_SUMMARY, SHEET_REVIEW,
-            SHEET_CATEGORIES,
-        ]
-        for name in sheet_names:
-            self.queue_clear(name)
-
-        # Write headers
-        self.queue_append(SHEET_TRANSACTIONS, [TXN_HEADERS])
-        self.queue_append(SHEET_ALLOCATIONS, [ALLOC_HEADERS])
-        self.queue_append(SHEET_TRANSFERS, [TRANSFER_HEADERS])
-        self.queue_append(SHEET_SUMMARY, [SUMMARY_HEADERS])
-        self.queue_append(SHEET_REVIEW, [REVIEW_HEADERS])
-        self.queue_append(SHEET_CATEGORIES, [CATEGORY_HEADERS])
-
         # Build category hierarchy lookup
         cat_lookup: dict[str, dict] = {}
         if config is not None:
             cat_lookup = config.flatten_category_tree()
-            cat_rows = [category_to_row(e) for e in cat_lookup.values()]
-            self.queue_append(SHEET_CATEGORIES, cat_rows)
-
-        # Fetch all data with batch queries (avoids N+1 per-transaction lookups)
-        all_txn_rows = repo.conn.execute(
-            "SELECT * FROM transactions ORDER BY date, rowid"
-        ).fetchall()
-        all_txns = [Repository._row_to_transaction(r) for r in all_txn_rows]
+        # Each sheet's payload is built in place, headers first
+        cat_rows = [CATEGORY_HEADERS]
+        cat_rows.extend(category_to_row(e) for e in cat_lookup.values())
+
+        # Fetch all data with batch queries (avoids N+1 per-transaction lookups).
+        # The transfer flag is derived in the same SELECT rather than by
+        # binding every id back into batch_is_transfer, and the cursor is
+        # consumed row by row so the raw sqlite3.Row list is never held
+        # alongside the Transaction objects.
+        cursor = repo.conn.execute(
+            "SELECT t.*,"
+            "  EXISTS(SELECT 1 FROM transfers tr"
+            "    WHERE tr.from_transaction_id = t.id"
+            "       OR tr.to_transaction_id = t.id"
+            "  ) AS is_transfer"
+            " FROM transactions t ORDER BY t.date, t.rowid"
+        )
+        all_txns: list[Transaction] = []
+        transfer_ids: set[str] = set()
+        for r in cursor:
+            all_txns.append(Repository._row_to_transaction(r))
+            if r["is_transfer"]:
+                transfer_ids.add(r["id"])
 
         txn_ids = [t.id for t in all_txns]
-        transfer_ids = batch_is_transfer(repo.conn, txn_ids)
         alloc_map = repo.get_allocations_by_transaction_ids(txn_ids)
 
-        txn_rows = []
-        alloc_rows = []
-        review_rows = []
-        for txn in all_txns:
-            flag = txn.id in transfer_ids
-            allocs = alloc_map.get(txn.id, [])
-            cat = allocs[0].category_id if allocs else None
-            txn_rows.append(txn_to_row(txn, flag, category_id=cat))
-            if allocs:
-                for a in allocs:
-                    alloc_rows.append(alloc_to_row(a))
-                    review_rows.append(review_to_row(txn, a, flag))
-            else:
-                review_rows.append(review_to_row(txn, None, flag))
-
-        self.queue_append(SHEET_TRANSACTIONS, txn_rows)
-        self.queue_append(SHEET_ALLOCATIONS, alloc_rows)
-        self.queue_append(SHEET_REVIEW, review_rows)
-
-        all_xfers = repo.conn.execute(
-            "SELECT * FROM transfers ORDER BY created_at"
-        ).fetchall()
-        xfer_rows = [transfer_to_row(Repository._row_to_transfer(r)) for r in all_xfers]
-        self.queue_append(SHEET_TRANSFERS, xfer_rows)
-
-        # Push summary for all months that have data
-        months = repo.conn.execute(
-            "SELECT DISTINCT SUBSTR(date, 1, 7) AS month"
-            " FROM transactions ORDER BY month"
-        ).fetchall()
-        for month_row in months:
-            month = month_row[0]
-            summary = get_category_summary(repo.conn, month)
+        # Resolve each transaction's transfer flag, category and allocations
+        # once, appending to all three sheets in the same pass
+        txn_rows = [TXN_HEADERS]
+        alloc_rows = [ALLOC_HEADERS]
+        review_rows = [REVIEW_HEADERS]
+        for t in all_txns:
+            flag = t.id in transfer_ids
+            allocs = alloc_map.get(t.id, ())
+            txn_rows.append(txn_to_row(t, flag, category_id=_first_category(allocs)))
+            for a in allocs:
+                alloc_rows.append(alloc_to_row(a))
+            for a in allocs or _NO_ALLOCATION:
+                review_rows.append(review_to_row(t, a, flag))
+
+        xfer_rows = [TRANSFER_HEADERS]
+        for r in repo.conn.execute("SELECT * FROM transfers ORDER BY created_at"):
+            xfer_rows.append(transfer_to_row(Repository._row_to_transfer(r)))
+
+        # Push summary for all months that have data (one grouped query)
+        summary_rows = [SUMMARY_HEADERS]
+        for month, summary in get_all_category_summaries(repo.conn).items():
             for s in summary:
-                self.queue_append(SHEET_SUMMARY,
-                                  [summary_to_row(month, s, cat_lookup)])
+                summary_rows.append(summary_to_row(month, s, cat_lookup))
+
+        self.queue_replace(SHEET_TRANSACTIONS, txn_rows)
+        self.queue_replace(SHEET_ALLOCATIONS, alloc_rows)
+        self.queue_replace(SHEET_TRANSFERS, xfer_rows)
+        self.queue_replace(SHEET_SUMMARY, summary_rows)
+        self.queue_replace(SHEET_REVIEW, review_rows)
+        self.queue_replace(SHEET_CATEGORIES, cat_rows)
+
+        # One read request spares a clear (a write) on already-empty sheets
+        self._empty_sheets = self._find_empty_sheets(list(self.pending_replaces))
 
         results = self.flush()
 
@@ -497,7 +678,7 @@ def _apply_category_validation(self) -> None:
 
         for sheet_name, col_letter in validation_targets:
             try:
-                ws = self.spreadsheet.worksheet(sheet_name)
+                ws = self._get_ws(sheet_name)
                 ws.add_validation(
                     f"{col_letter}2:{col_letter}100000",
                     ValidationConditionType.one_of_range,
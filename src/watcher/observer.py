@@ -6,14 +6,19 @@
   detect → stable → parse → dedup → categorize → push
 
 Uses PollingObserver as primary (not fallback) due to NAS/Docker volume
-unreliability with inotify. 30-second polling interval.
+unreliability with inotify. 30-second polling interval. observer_mode
+"auto" switches to the native (inotify/FSEvents) observer when the watch
+directory is on a local filesystem; "native" forces it.
 """
 
 from __future__ import annotations
 
 import logging
-import time
+import os
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,14 +26,19 @@
 from watchdog.events import FileSystemEventHandler
 
 from src.categorize.pipeline import (
-    apply_categorization,
-    categorize_transaction,
+    apply_categorizations,
+    categorize_transactions,
 )
 from src.config import Config
 from src.database.dedup import DedupEngine
 from src.database.models import Import
 from src.database.repository import DuplicateImportError
-from src.parsers.base import BaseParser, compute_file_hash
+from src.parsers.base import (
+    BaseParser,
+    RawTransaction,
+    compute_file_hash,
+    read_head,
+)
 from src.parsers.csv_parser import MercuryCsvParser
 from src.parsers.qfx_sgml import QfxSgmlParser
 from src.parsers.qfx_xml import QfxXmlParser
@@ -47,9 +57,32 @@
 DEFAULT_STABILITY_SECONDS = 10
 DEFAULT_CHECK_INTERVAL = 2.0
 
+# Stability polling starts this fast and backs off (x1.5) to check_interval
+INITIAL_CHECK_INTERVAL = 0.25
+BACKOFF_FACTOR = 1.5
+
 # Default polling interval for PollingObserver
 DEFAULT_POLL_INTERVAL = 30
 
+# FileWatcher observer selection: polling (default), native, or auto
+OBSERVER_MODES = ("polling", "native", "auto")
+
+# Filesystems where native change notification is reliable ("auto" mode).
+# Network and VM-shared mounts (nfs, cifs, 9p, virtiofs, grpcfuse...) poll.
+LOCAL_FILESYSTEMS = frozenset({
+    "ext2", "ext3", "ext4", "xfs", "btrfs", "zfs", "f2fs", "jfs",
+    "reiserfs", "tmpfs",
+})
+
+# Files waited on / imported concurrently by FileWatcher
+DEFAULT_MAX_WORKERS = 4
+
+# Bytes read from the end of a QFX/OFX file when looking for </OFX>
+OFX_TAIL_BYTES = 4096
+
+# ACCTID value in both SGML and XML QFX (value ends at newline or next tag)
+_ACCTID_RE = re.compile(rb'<ACCTID>([^<\n\r]+)')
+
 
 @dataclass
 class ImportResult:
@@ -76,15 +109,21 @@ def wait_for_stable(
     stability_seconds: int = DEFAULT_STABILITY_SECONDS,
     check_interval: float = DEFAULT_CHECK_INTERVAL,
     max_wait: float = 300.0,
-) -> None:
+) -> os.stat_result:
     """Wait until file size and mtime are stable for stability_seconds.
 
+    Polls quickly at first and backs off to check_interval, restarting
+    the backoff whenever the file changes.
+
     Args:
         filepath: Path to the file to monitor.
         stability_seconds: Seconds of no change required.
-        check_interval: How often to poll the file stats.
+        check_interval: Longest wait between polls of the file stats.
         max_wait: Maximum total seconds to wait before raising.
 
+    Returns:
+        The final (stable) stat result, so callers needn't stat again.
+
     Raises:
         TimeoutError: If file doesn't stabilize within max_wait.
     """
@@ -92,6 +131,9 @@ def wait_for_stable(
     prev_mtime = -1.0
     stable_since: float | None = None
     start = time.monotonic()
+    path = os.fspath(filepath)  # stat the str path directly on each poll
+    first_interval = min(INITIAL_CHECK_INTERVAL, check_interval)
+    interval = first_interval
 
     while True:
         if time.monotonic() - start > max_wait:
@@ -99,18 +141,33 @@ def wait_for_stable(
                 f"File did not stabilize within {max_wait}s: {filepath}"
             )
 
-        stat = filepath.stat()
+        stat = os.stat(path)
         if stat.st_size == prev_size and stat.st_mtime == prev_mtime:
             if stable_since is None:
                 stable_since = time.monotonic()
             elif time.monotonic() - stable_since >= stability_seconds:
-                return  # File is stable
+                return stat  # File is stable
         else:
             stable_since = None
+            interval = first_interval
 
         prev_size = stat.st_size
         prev_mtime = stat.st_mtime
-        time.sleep(check_interval)
+        time.sleep(interval)
+        interval = min(interval * BACKOFF_FACTOR, check_interval)
+
+
+def _read_tail(filepath: Path, nbytes: int) -> tuple[int, bytes]:
+    """Return the file size and its last nbytes (fewer if the file is smaller).
+
+    Uses fstat + pread on one descriptor rather than seek/tell/seek/read.
+    """
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return size, os.pread(fd, nbytes, max(0, size - nbytes))
+    finally:
+        os.close(fd)
 
 
 def validate_file_completeness(filepath: Path) -> None:
@@ -125,22 +182,19 @@ def validate_file_completeness(filepath: Path) -> None:
     suffix = filepath.suffix.lower()
 
     if suffix == ".csv":
-        with open(filepath, "rb") as f:
-            # Check last byte is newline
-            f.seek(0, 2)  # Seek to end
-            size = f.tell()
-            if size == 0:
-                raise FileStabilityError(f"Empty CSV file: {filepath}")
-            f.seek(size - 1)
-            last_byte = f.read(1)
-            if last_byte not in (b"\n", b"\r"):
-                raise FileStabilityError(
-                    f"CSV file does not end with newline: {filepath}"
-                )
+        # Check last byte is newline
+        size, last_byte = _read_tail(filepath, 1)
+        if size == 0:
+            raise FileStabilityError(f"Empty CSV file: {filepath}")
+        if last_byte not in (b"\n", b"\r"):
+            raise FileStabilityError(
+                f"CSV file does not end with newline: {filepath}"
+            )
 
     elif suffix in (".qfx", ".ofx"):
-        content = filepath.read_text(errors="replace")
-        if "</OFX>" not in content.upper():
+        # The closing tag lives at the end; only the tail needs scanning
+        _, tail = _read_tail(filepath, OFX_TAIL_BYTES)
+        if tail.upper().find(b"</OFX>") == -1:
             raise FileStabilityError(
                 f"QFX/OFX file missing closing </OFX> tag: {filepath}"
             )
@@ -149,16 +203,19 @@ def validate_file_completeness(filepath: Path) -> None:
 # ── Parser auto-detection ─────────────────────────────────
 
 
-def _extract_acctid(filepath: Path) -> str | None:
+def _extract_acctid(filepath: Path, head: bytes | None = None) -> str | None:
     """Extract ACCTID from a QFX/OFX file.
 
-    Works for both SGML and XML formats.
+    Works for both SGML and XML formats. Only the start of the file is
+    searched (`head` if given, else the first 64KB read as bytes);
+    ACCTID sits in the statement header ahead of the transaction list.
     """
     try:
-        content = filepath.read_text(errors="replace")
-        match = re.search(r'<ACCTID>([^<\n\r]+)', content)
+        if head is None:
+            head = read_head(filepath)
+        match = _ACCTID_RE.search(head)
         if match:
-            return match.group(1).strip()
+            return match.group(1).decode("latin-1").strip()
     except OSError:
         pass
     return None
@@ -172,25 +229,77 @@ def _resolve_account_id(acctid: str, config: Config | None) -> str:
     if config is None:
         return acctid
 
-    for acct in config.accounts:
-        if acct.get("qfx_acctid") == acctid:
-            return acct["id"]
+    account_id = config.qfx_acctid_index.get(acctid)
+    if account_id is not None:
+        return account_id
 
     # Don't log the actual ACCTID as it's a sensitive bank account identifier
     logger.warning("No account mapping found for ACCTID (masked for security)")
     return acctid
 
 
-def detect_parser(filepath: Path, config: Config | None = None) -> BaseParser:
+def _make_parser(
+    parser_cls: type[BaseParser], account_id: str | None, config: Config | None,
+) -> BaseParser:
+    """Instantiate a detected parser class with its config-derived arguments."""
+    if parser_cls is MercuryCsvParser:
+        return MercuryCsvParser(
+            account_routing=config.mercury_account_routing if config else None,
+        )
+    if parser_cls is BudgetAppCsvParser:
+        return BudgetAppCsvParser(
+            category_map=config.budget_app_category_map if config else None,
+            account_routing=config.budget_app_account_routing if config else None,
+        )
+    return parser_cls(account_id=account_id)
+
+
+# Candidate parsers per extension, in priority order: SGML first (Wells
+# Fargo, Golden1), then XML (Capital One, Amex); Mercury before budget app.
+_PARSERS_BY_SUFFIX: dict[str, tuple[type[BaseParser], ...]] = {
+    ".csv": (MercuryCsvParser, BudgetAppCsvParser),
+    ".qfx": (QfxSgmlParser, QfxXmlParser),
+    ".ofx": (QfxSgmlParser, QfxXmlParser),
+}
+
+
+def _detect_kind(
+    filepath: Path, config: Config | None, head: bytes, suffix: str,
+) -> tuple[type[BaseParser], str | None]:
+    """Pick the parser class from the file head; return (class, account_id).
+
+    Only the matching parser is constructed later, and the ACCTID lookup
+    only runs for QFX/OFX files.
+    """
+    for parser_cls in _PARSERS_BY_SUFFIX.get(suffix, ()):
+        if parser_cls.sniff(head):
+            break
+    else:
+        raise ValueError(f"No parser found for file: {filepath}")
+
+    account_id = None
+    if suffix in (".qfx", ".ofx"):
+        # Extract account ID from file content
+        acctid = _extract_acctid(filepath, head)
+        account_id = _resolve_account_id(acctid, config) if acctid else "unknown"
+    return parser_cls, account_id
+
+
+def detect_parser(
+    filepath: Path, config: Config | None = None, head: bytes | None = None,
+) -> BaseParser:
     """Auto-detect the appropriate parser for a bank file.
 
-    Tries each parser's detect() method. For QFX parsers, extracts the
-    ACCTID from the file and maps it to an internal account_id using
+    Sniffs the file head against each candidate parser for the extension
+    and constructs only the one that matches. For QFX parsers, extracts
+    the ACCTID from the file and maps it to an internal account_id using
     the accounts config.
 
     Args:
         filepath: Path to the bank file.
         config: Optional Config for budget app category map and account mapping.
+        head: Optional pre-read start of the file. Read once here if not
+            given, then shared by every detect() call and ACCTID lookup.
 
     Returns:
         An instantiated parser ready to parse the file.
@@ -199,39 +308,13 @@ def detect_parser(filepath: Path, config: Config | None = None) -> BaseParser:
         ValueError: If no parser can handle the file.
     """
     suffix = filepath.suffix.lower()
+    if suffix not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f"No parser found for file: {filepath}")
+    if head is None:
+        head = read_head(filepath)
 
-    # CSV detection: Mercury vs budget app
-    if suffix == ".csv":
-        mercury = MercuryCsvParser(
-            account_routing=config.mercury_account_routing if config else None,
-        )
-        if mercury.detect(filepath):
-            return mercury
-
-        budget_app = BudgetAppCsvParser(
-            category_map=config.budget_app_category_map if config else None,
-            account_routing=config.budget_app_account_routing if config else None,
-        )
-        if budget_app.detect(filepath):
-            return budget_app
-
-    # QFX/OFX detection: SGML vs XML
-    if suffix in (".qfx", ".ofx"):
-        # Extract account ID from file content
-        acctid = _extract_acctid(filepath)
-        account_id = _resolve_account_id(acctid, config) if acctid else "unknown"
-
-        # Try SGML first (Wells Fargo, Golden1)
-        sgml = QfxSgmlParser(account_id=account_id)
-        if sgml.detect(filepath):
-            return sgml
-
-        # Try XML (Capital One, Amex)
-        xml = QfxXmlParser(account_id=account_id)
-        if xml.detect(filepath):
-            return xml
-
-    raise ValueError(f"No parser found for file: {filepath}")
+    parser_cls, account_id = _detect_kind(filepath, config, head, suffix)
+    return _make_parser(parser_cls, account_id, config)
 
 
 # ── Import pipeline ──────────────────────────────────────
@@ -240,12 +323,18 @@ def detect_parser(filepath: Path, config: Config | None = None) -> BaseParser:
 class ImportPipeline:
     """Orchestrate: detect → stable → parse → dedup → categorize → push.
 
+    Safe to call process_file from several threads: hashing, detection
+    and parsing run concurrently, while every step that touches the
+    database (or Sheets) is serialized on an internal lock.
+
     Args:
         repo: Database repository.
         config: Application config.
         dedup: Dedup engine.
         sheets: Optional SheetsPush for Google Sheets sync.
         receipt_lookup: Optional ReceiptLookup for Step 6.
+        parse_workers: Size of the shared pool that parses files while
+            they are hashed.
     """
 
     def __init__(
@@ -256,6 +345,7 @@ def __init__(
         sheets: SheetsPush | None = None,
         receipt_lookup=None,
         claude_fn=None,
+        parse_workers: int = DEFAULT_MAX_WORKERS,
     ):
         self.repo = repo
         self.config = config
@@ -263,8 +353,33 @@ def __init__(
         self.sheets = sheets
         self.receipt_lookup = receipt_lookup
         self.claude_fn = claude_fn
+        self._db_lock = threading.Lock()
+        self.parse_workers = parse_workers
+        self._parse_pool: ThreadPoolExecutor | None = None
+        self._parse_pool_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Shut down the parse pool, waiting for in-flight parses."""
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _submit_parse(self, filepath: Path, head: bytes | None) -> Future:
+        """Queue steps 4-5 on the shared parse pool, creating it on first use."""
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ThreadPoolExecutor(
+                    max_workers=self.parse_workers, thread_name_prefix="parse",
+                )
+            return self._parse_pool.submit(self._detect_and_parse, filepath, head)
 
-    def process_file(self, filepath: Path) -> ImportResult:
+    def process_file(
+        self,
+        filepath: Path,
+        head: bytes | None = None,
+        stat: os.stat_result | None = None,
+    ) -> ImportResult:
         """Run the full import pipeline on a single file.
 
         Steps:
@@ -277,6 +392,15 @@ def process_file(self, filepath: Path) -> ImportResult:
         7. Categorize new transactions
         8. Push to Sheets (if configured)
 
+        Steps 4-5 start speculatively on the pipeline's shared parse pool
+        so parsing overlaps the file hash; for a duplicate file the parse
+        is cancelled if it hasn't started, and its result is discarded.
+
+        head is the optional pre-read start of the file, passed on to
+        detect_parser so detection doesn't re-read it. stat is the file's
+        stat result if the caller already has one (e.g. from
+        wait_for_stable).
+
         Returns ImportResult with counts.
         """
         file_name = filepath.name
@@ -289,32 +413,40 @@ def process_file(self, filepath: Path) -> ImportResult:
                 error_message=f"Unsupported file extension: {filepath.suffix}",
             )
 
-        # Step 2: File hash dedup (Tier 1)
-        file_hash = compute_file_hash(filepath)
-        if self.dedup.check_file_duplicate(filepath):
-            logger.info("Duplicate file skipped: %s", file_name)
-            return ImportResult(file_name=file_name, status="duplicate")
-
-        # Step 3: Record import (handles race condition via unique constraint)
-        imp = Import(
-            file_name=file_name,
-            file_hash=file_hash,
-            file_size=filepath.stat().st_size,
-        )
-        try:
-            self.repo.insert_import(imp)
-        except DuplicateImportError:
-            # Race condition: another process imported this file between
-            # our check and insert. This is the same as a duplicate.
-            logger.info("Duplicate file (race): %s", file_name)
-            return ImportResult(file_name=file_name, status="duplicate")
+        # Steps 4-5 (no DB access) overlap with hashing the file
+        parsed = self._submit_parse(filepath, head)
 
         try:
-            # Step 4: Auto-detect parser
-            parser = detect_parser(filepath, self.config)
+            # Step 2: File hash dedup (Tier 1)
+            file_hash = compute_file_hash(filepath)
+            file_size = (stat or os.stat(filepath)).st_size
+            with self._db_lock:
+                if self.dedup.check_file_duplicate(filepath, file_hash):
+                    logger.info("Duplicate file skipped: %s", file_name)
+                    parsed.cancel()
+                    return ImportResult(file_name=file_name, status="duplicate")
+
+                # Step 3: Record import (handles race condition via unique constraint)
+                imp = Import(
+                    file_name=file_name,
+                    file_hash=file_hash,
+                    file_size=file_size,
+                )
+                try:
+                    self.repo.insert_import(imp)
+                except DuplicateImportError:
+                    # Race condition: another process imported this file between
+                    # our check and insert. This is the same as a duplicate.
+                    logger.info("Duplicate file (race): %s", file_name)
+                    parsed.cancel()
+                    return ImportResult(file_name=file_name, status="duplicate")
+        except BaseException:
+            parsed.cancel()
+            raise
 
-            # Step 5: Parse
-            raw_txns = parser.parse(filepath)
+        try:
+            # Steps 4-5: Auto-detect parser and parse (started above)
+            parser, raw_txns = parsed.result()
             skipped_count = parser.skipped_count
 
             if skipped_count > 0:
@@ -323,56 +455,54 @@ def process_file(self, filepath: Path) -> ImportResult:
                     skipped_count, file_name,
                 )
 
-            if not raw_txns:
-                self.repo.update_import_status(
-                    imp.id, "completed", record_count=0,
-                )
-                return ImportResult(
-                    file_name=file_name, status="success", skipped_count=skipped_count,
-                )
-
-            # Step 6: Dedup + insert
-            batch_result = self.dedup.process_batch(
-                raw_txns, imp.id, source="bank",
-            )
-
-            # Step 7: Categorize new transactions
-            # Include both pending and flagged (fuzzy dedup matches need categorization too)
-            categorized_count = 0
-            for txn in batch_result.transactions:
-                if txn.status in ("pending", "flagged"):
-                    result = categorize_transaction(
-                        txn, self.config,
-                        receipt_lookup=self.receipt_lookup,
-                        claude_fn=self.claude_fn,
-                        repo=self.repo,
+            with self._db_lock:
+                if not raw_txns:
+                    self.repo.update_import_status(
+                        imp.id, "completed", record_count=0,
                     )
-                    apply_categorization(
-                        txn, result, self.repo,
-                        receipt_lookup=self.receipt_lookup,
+                    return ImportResult(
+                        file_name=file_name, status="success", skipped_count=skipped_count,
                     )
-                    categorized_count += 1
 
-            # Step 8: Push to Sheets
-            # Re-fetch transactions from DB so status/confidence/method are current
-            if self.sheets is not None:
-                try:
-                    fresh_txns = self.repo.get_transactions_by_import_id(imp.id)
-                    self.sheets.push_transactions(fresh_txns, self.repo)
-                    txn_ids = [t.id for t in fresh_txns]
-                    alloc_map = self.repo.get_allocations_by_transaction_ids(txn_ids)
-                    allocs = [a for al in alloc_map.values() for a in al]
-                    if allocs:
-                        self.sheets.push_allocations(allocs)
-                    self.sheets.push_review(fresh_txns, self.repo)
-                except Exception:
-                    logger.exception("Sheets push failed for %s", file_name)
-
-            # Update import status
-            self.repo.update_import_status(
-                imp.id, "completed",
-                record_count=len(raw_txns),
-            )
+                # Step 6: Dedup + insert
+                batch_result = self.dedup.process_batch(
+                    raw_txns, imp.id, source="bank",
+                )
+
+                # Step 7: Categorize new transactions, then write all results
+                # in one DB transaction.
+                # Include both pending and flagged (fuzzy dedup matches need categorization too)
+                results = categorize_transactions(
+                    [
+                        txn for txn in batch_result.transactions
+                        if txn.status in ("pending", "flagged")
+                    ],
+                    self.config,
+                    receipt_lookup=self.receipt_lookup,
+                    claude_fn=self.claude_fn,
+                    repo=self.repo,
+                )
+                allocs = apply_categorizations(
+                    results, self.repo, receipt_lookup=self.receipt_lookup,
+                )
+                categorized_count = len(results)
+
+                # Step 8: Push to Sheets
+                # Re-fetch transactions from DB so status/confidence/method are current
+                if self.sheets is not None:
+                    try:
+                        # Every transaction of this import was just categorized,
+                        # so allocs already holds all of their allocations
+                        fresh_txns = self.repo.get_transactions_by_import_id(imp.id)
+                        self.sheets.push_bulk(fresh_txns, allocs, self.repo)
+                    except Exception:
+                        logger.exception("Sheets push failed for %s", file_name)
+
+                # Update import status
+                self.repo.update_import_status(
+                    imp.id, "completed",
+                    record_count=len(raw_txns),
+                )
 
             return ImportResult(
                 file_name=file_name,
@@ -386,31 +516,91 @@ def process_file(self, filepath: Path) -> ImportResult:
 
         except Exception as e:
             logger.exception("Import failed for %s", file_name)
-            self.repo.update_import_status(
-                imp.id, "error",
-                error_message=str(e),
-            )
+            self._mark_import_error(imp, str(e))
             return ImportResult(
                 file_name=file_name,
                 status="error",
                 error_message=str(e),
             )
 
+    def _mark_import_error(self, imp: Import, message: str) -> None:
+        """Record a failed import, once, without letting this write raise.
+
+        The failure may have come from the database itself (e.g. a locked
+        or unreachable file); a second error here is logged rather than
+        replacing the original one in the returned ImportResult.
+        """
+        try:
+            with self._db_lock:
+                self.repo.update_import_status(
+                    imp.id, "error", error_message=message,
+                )
+        except Exception:
+            logger.exception("Could not record error status for %s", imp.file_name)
+
+    def _detect_and_parse(
+        self, filepath: Path, head: bytes | None,
+    ) -> tuple[BaseParser, list[RawTransaction]]:
+        """Steps 4-5: auto-detect the parser and parse the file."""
+        parser = detect_parser(filepath, self.config, head)
+        return parser, parser.parse(filepath)
+
 
 # ── File watcher ─────────────────────────────────────────
 
 
+def _filesystem_type(
+    path: Path, mounts_file: Path = Path("/proc/mounts"),
+) -> str | None:
+    """Return the filesystem type of the mount holding `path`.
+
+    Reads the Linux mount table and picks the longest mount point that
+    contains the path. Returns None if the table is unavailable.
+    """
+    try:
+        lines = mounts_file.read_text().splitlines()
+    except OSError:
+        return None
+    target = os.path.realpath(path)
+    best_len = -1
+    fstype = None
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Mount points escape spaces as \040
+        mount_point = fields[1].replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) \
+                and len(mount_point) > best_len:
+            best_len = len(mount_point)
+            fstype = fields[2]
+    return fstype
+
+
 class FileWatcher(FileSystemEventHandler):
-    """Watch a drop folder for new bank files using PollingObserver.
+    """Watch a drop folder for new bank files.
 
-    Primary watcher (not fallback). 30-second polling interval.
-    Processes files sequentially to avoid database contention.
+    observer_mode picks how changes are seen: "polling" rescans the
+    folder every DEFAULT_POLL_INTERVAL seconds, "native" uses OS file
+    system events (inotify and the like), and "auto" uses native events
+    on a local filesystem and polls network or VM-shared mounts. If the
+    native observer can't start (e.g. inotify is out of watches), the
+    watcher logs a warning and polls instead.
+
+    Detected files are handled on a worker pool of max_workers threads,
+    so one file's stability wait and parse overlap with others; the
+    pipeline serializes the database stages.
 
     Args:
         watch_dir: Directory to watch for new files.
         pipeline: ImportPipeline to process files.
         stability_seconds: Seconds of stability before processing.
         check_interval: Seconds between stability checks.
+        max_workers: Files processed concurrently (1 = sequential).
+        observer_mode: "polling", "native", or "auto" (native on a local
+            filesystem, polling otherwise). Native falls back to polling
+            if it can't be set up.
     """
 
     def __init__(
@@ -419,52 +609,99 @@ def __init__(
         pipeline: ImportPipeline,
         stability_seconds: int = DEFAULT_STABILITY_SECONDS,
         check_interval: float = DEFAULT_CHECK_INTERVAL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        observer_mode: str = "polling",
     ):
+        if observer_mode not in OBSERVER_MODES:
+            raise ValueError(
+                f"observer_mode must be one of {OBSERVER_MODES}: {observer_mode!r}"
+            )
         self.watch_dir = Path(watch_dir)
         self.pipeline = pipeline
         self.stability_seconds = stability_seconds
         self.check_interval = check_interval
+        self.max_workers = max_workers
+        self.observer_mode = observer_mode
         self._observer = None
+        self._pool: ThreadPoolExecutor | None = None
 
     def start(self) -> None:
         """Start watching the drop folder."""
-        from watchdog.observers.polling import PollingObserver
-
         if not self.watch_dir.exists():
             self.watch_dir.mkdir(parents=True, exist_ok=True)
 
-        self._observer = PollingObserver(timeout=DEFAULT_POLL_INTERVAL)
-        self._observer.schedule(self, str(self.watch_dir), recursive=False)
-        self._observer.start()
+        self._observer = self._start_observer()
         logger.info("Watching %s for new bank files", self.watch_dir)
 
+    def _start_observer(self):
+        """Create, schedule and start the observer for observer_mode.
+
+        inotify only reserves its watch when the observer starts, so a
+        native observer that fails there (e.g. out of watch slots) is
+        replaced by a polling one.
+        """
+        from watchdog.observers.polling import PollingObserver
+
+        mode = self.observer_mode
+        if mode == "auto":
+            fstype = _filesystem_type(self.watch_dir)
+            mode = "native" if fstype in LOCAL_FILESYSTEMS else "polling"
+
+        if mode == "native":
+            from watchdog.observers import Observer
+
+            try:
+                observer = Observer()
+                observer.schedule(self, str(self.watch_dir), recursive=False)
+                observer.start()
+                logger.info("Using native file system events")
+                return observer
+            except OSError as e:
+                logger.warning("Native observer unavailable, polling instead: %s", e)
+
+        observer = PollingObserver(timeout=DEFAULT_POLL_INTERVAL)
+        observer.schedule(self, str(self.watch_dir), recursive=False)
+        observer.start()
+        return observer
+
     def stop(self) -> None:
-        """Stop watching."""
+        """Stop watching, then wait for in-flight imports to finish."""
         if self._observer is not None:
             self._observer.stop()
             self._observer.join()
             self._observer = None
             logger.info("File watcher stopped")
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def on_created(self, event) -> Future | None:
+        """Handle new file creation events.
 
-    def on_created(self, event) -> None:
-        """Handle new file creation events."""
+        Queues the file on the worker pool and returns its Future
+        (None if the event is ignored).
+        """
         if event.is_directory:
-            return
+            return None
 
         filepath = Path(event.src_path)
 
         # Skip unsupported extensions
         if filepath.suffix.lower() not in SUPPORTED_EXTENSIONS:
-            return
+            return None
 
         logger.info("New file detected: %s", filepath.name)
-        self._process_file(filepath)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="import",
+            )
+        return self._pool.submit(self._process_file, filepath)
 
     def _process_file(self, filepath: Path) -> ImportResult | None:
         """Wait for stability, validate, then import."""
         try:
             # Wait for file to be fully written
-            wait_for_stable(
+            stat = wait_for_stable(
                 filepath,
                 stability_seconds=self.stability_seconds,
                 check_interval=self.check_interval,
@@ -473,8 +710,11 @@ def _process_file(self, filepath: Path) -> ImportResult | None:
             # Validate completeness
             validate_file_completeness(filepath)
 
+            # Read the head once for parser detection
+            head = read_head(filepath)
+
             # Run import pipeline
-            result = self.pipeline.process_file(filepath)
+            result = self.pipeline.process_file(filepath, head=head, stat=stat)
             logger.info(
                 "Import result for %s: %s (new=%d, dup=%d, flagged=%d)",
                 filepath.name, result.status,
@@ -1,6 +1,47 @@
 """Shared test fixtures."""
 
+from functools import lru_cache
 from pathlib import Path
 
+from src.database.repository import Repository
+
 # Test fixture config directory with synthetic data
 FIXTURE_CONFIG_DIR = Path(__file__).parent / "fixtures" / "config"
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "src" / "database" / "migrations"
+
+# Durability settings that only cost time for throwaway test databases.
+# Never applied to the production Repository.
+_TEST_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA locking_mode = EXCLUSIVE",
+)
+
+
+def empty_repo() -> Repository:
+    """Return an in-memory Repository with no schema and relaxed durability."""
+    repo = Repository(":memory:")
+    for pragma in _TEST_PRAGMAS:
+        repo.conn.execute(pragma)
+    return repo
+
+
+@lru_cache(maxsize=1)
+def _migrated_template() -> Repository:
+    """In-memory database with all migrations applied, built once per session."""
+    repo = empty_repo()
+    repo.apply_migrations(MIGRATIONS_DIR)
+    return repo
+
+
+def migrated_repo() -> Repository:
+    """Return a fresh in-memory Repository with the schema applied.
+
+    Copies the migrated template with the SQLite backup API instead of
+    re-running every migration, so each test still gets its own database.
+    """
+    repo = empty_repo()
+    _migrated_template().conn.backup(repo.conn)
+    return repo
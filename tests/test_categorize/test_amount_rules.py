@@ -1,11 +1,15 @@
 """Tests for amount-based and account-based categorization rules."""
 
+from functools import lru_cache
+
 from src.categorize.amount_rules import match_account_rule, match_amount_rule
 from src.config import Config
 from tests.conftest import FIXTURE_CONFIG_DIR
 
 
+@lru_cache(maxsize=1)
 def config():
+    # Read-only in these tests, so one parsed Config serves the module
     return Config(FIXTURE_CONFIG_DIR)
 
 
@@ -2,28 +2,32 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from unittest.mock import MagicMock
-
 import pytest
 
 from src.categorize.claude_ai import (
     MONTHLY_BUDGET_CENTS,
     categorize_single,
     _build_category_list,
+    _get_valid_category_ids,
     _parse_response,
 )
+from src.config import Config
 from src.database.models import Import, Transaction
-from src.database.repository import Repository
+from tests.conftest import FIXTURE_CONFIG_DIR, migrated_repo
+
 
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+# Canned Claude responses
+RESP_GROCERIES = '{"category_id": "groceries", "confidence": 0.85, "reasoning": "Looks like a grocery store"}'
+RESP_GROCERY_PURCHASE = '{"category_id": "groceries", "confidence": 0.75, "reasoning": "Looks like a grocery purchase"}'
+RESP_TRANSPORT = '{"category_id": "transport", "confidence": 0.8, "reasoning": "Gas station"}'
+RESP_UNCATEGORIZED = '{"category_id": "uncategorized", "confidence": 0.0, "reasoning": "Cannot determine"}'
+RESP_EMPTY_CATEGORY = '{"category_id": "", "confidence": 0.5, "reasoning": "Unknown"}'
+RESP_OVERCONFIDENT = '{"category_id": "groceries", "confidence": 1.5, "reasoning": "Very sure"}'
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -43,24 +47,30 @@ def _txn(imp_id, **kw) -> Transaction:
     return Transaction(**defaults)
 
 
-def _mock_config(categories=None):
-    config = MagicMock()
-    if categories is None:
-        categories = [
-            {"id": "groceries", "children": []},
-            {"id": "dining", "children": [
-                {"id": "coffee-d", "children": []},
-                {"id": "restaurants-d", "children": []},
-            ]},
-            {"id": "transport", "children": []},
-        ]
-    config.categories = categories
+DEFAULT_CATEGORIES = [
+    {"id": "groceries", "children": []},
+    {"id": "dining", "children": [
+        {"id": "coffee-d", "children": []},
+        {"id": "restaurants-d", "children": []},
+    ]},
+    {"id": "transport", "children": []},
+]
+
+
+def _config(categories=None):
+    """Fixture Config with its category tree replaced."""
+    config = Config(FIXTURE_CONFIG_DIR)
+    config._categories = DEFAULT_CATEGORIES if categories is None else categories
     return config
 
 
+# Tests without a custom tree share one Config, so its IDs are built once
+_DEFAULT_CONFIG = _config()
+
+
 class TestBuildCategoryList:
     def test_flat_categories(self):
-        config = _mock_config([
+        config = _config([
             {"id": "groceries", "children": []},
             {"id": "transport", "children": []},
         ])
@@ -69,21 +79,33 @@ def test_flat_categories(self):
         assert "transport" in result
 
     def test_nested_categories(self):
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
         result = _build_category_list(config)
         assert "dining" in result
         assert "coffee-d" in result
         assert "restaurants-d" in result
 
+    def test_ids_in_tree_order(self):
+        assert _build_category_list(_DEFAULT_CONFIG) == (
+            "groceries, dining, coffee-d, restaurants-d, transport"
+        )
+
+    def test_valid_ids_precomputed_on_config(self):
+        config = _DEFAULT_CONFIG
+        assert _get_valid_category_ids(config) is config.category_id_set
+        assert "coffee-d" in _get_valid_category_ids(config)
+
+    def test_ids_per_config(self):
+        _build_category_list(_DEFAULT_CONFIG)
+        other = _config([{"id": "rent", "children": []}])
+        assert _build_category_list(other) == "rent"
+        assert _get_valid_category_ids(other) == {"rent"}
+
 
 class TestParseResponse:
     def test_valid_json(self):
-        config = _mock_config()
-        response = json.dumps({
-            "category_id": "groceries",
-            "confidence": 0.85,
-            "reasoning": "Looks like a grocery store",
-        })
+        config = _DEFAULT_CONFIG
+        response = RESP_GROCERIES
         result = _parse_response(response, config)
         assert result is not None
         assert result.category_id == "groceries"
@@ -91,49 +113,44 @@ def test_valid_json(self):
         assert result.reasoning == "Looks like a grocery store"
 
     def test_json_with_code_fences(self):
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
         response = '```json\n{"category_id": "transport", "confidence": 0.9, "reasoning": "Gas station"}\n```'
         result = _parse_response(response, config)
         assert result is not None
         assert result.category_id == "transport"
 
+    def test_json_with_bare_code_fences(self):
+        config = _DEFAULT_CONFIG
+        response = '```\n' + RESP_GROCERIES + '\n```\n'
+        result = _parse_response(response, config)
+        assert result is not None
+        assert result.category_id == "groceries"
+
     def test_uncategorized_returns_none(self):
-        config = _mock_config()
-        response = json.dumps({
-            "category_id": "uncategorized",
-            "confidence": 0.0,
-            "reasoning": "Cannot determine",
-        })
+        config = _DEFAULT_CONFIG
+        response = RESP_UNCATEGORIZED
         result = _parse_response(response, config)
         assert result is None
 
     def test_empty_category_returns_none(self):
-        config = _mock_config()
-        response = json.dumps({
-            "category_id": "",
-            "confidence": 0.5,
-            "reasoning": "Unknown",
-        })
+        config = _DEFAULT_CONFIG
+        response = RESP_EMPTY_CATEGORY
         result = _parse_response(response, config)
         assert result is None
 
     def test_invalid_json_returns_none(self):
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
         result = _parse_response("not valid json", config)
         assert result is None
 
     def test_non_dict_returns_none(self):
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
         result = _parse_response("[1, 2, 3]", config)
         assert result is None
 
     def test_confidence_clamped(self):
-        config = _mock_config()
-        response = json.dumps({
-            "category_id": "groceries",
-            "confidence": 1.5,
-            "reasoning": "Very sure",
-        })
+        config = _DEFAULT_CONFIG
+        response = RESP_OVERCONFIDENT
         result = _parse_response(response, config)
         assert result.confidence == 1.0
 
@@ -142,14 +159,10 @@ class TestCategorizeSingle:
     def test_successful_categorization(self, repo, imp):
         txn = _txn(imp.id)
         repo.insert_transaction(txn)
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
 
         def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "groceries",
-                "confidence": 0.75,
-                "reasoning": "Looks like a grocery purchase",
-            })
+            return RESP_GROCERY_PURCHASE
 
         result = categorize_single(txn, config, mock_claude_fn, repo)
         assert result is not None
@@ -159,18 +172,14 @@ def mock_claude_fn(system, prompt):
     def test_budget_exceeded_returns_none(self, repo, imp):
         txn = _txn(imp.id)
         repo.insert_transaction(txn)
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
 
         # Exhaust the budget
         repo.increment_api_usage("2026-01", "claude_categorize",
                                   requests=1, cost_cents=MONTHLY_BUDGET_CENTS)
 
         def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "groceries",
-                "confidence": 0.75,
-                "reasoning": "test",
-            })
+            return RESP_GROCERY_PURCHASE
 
         result = categorize_single(txn, config, mock_claude_fn, repo)
         assert result is None
@@ -178,7 +187,7 @@ def mock_claude_fn(system, prompt):
     def test_claude_exception_returns_none(self, repo, imp):
         txn = _txn(imp.id)
         repo.insert_transaction(txn)
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
 
         def mock_claude_fn(system, prompt):
             raise RuntimeError("API error")
@@ -189,7 +198,7 @@ def mock_claude_fn(system, prompt):
     def test_no_date_returns_none(self, repo, imp):
         txn = _txn(imp.id, date="")
         repo.insert_transaction(txn)
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
 
         result = categorize_single(txn, config, lambda s, p: "{}", repo)
         assert result is None
@@ -197,14 +206,10 @@ def test_no_date_returns_none(self, repo, imp):
     def test_tracks_api_usage(self, repo, imp):
         txn = _txn(imp.id)
         repo.insert_transaction(txn)
-        config = _mock_config()
+        config = _DEFAULT_CONFIG
 
         def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "transport",
-                "confidence": 0.8,
-                "reasoning": "test",
-            })
+            return RESP_TRANSPORT
 
         categorize_single(txn, config, mock_claude_fn, repo)
         cost = repo.get_monthly_cost("2026-01")
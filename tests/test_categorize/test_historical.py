@@ -1,6 +1,7 @@
 """Tests for historical pattern matching (Step 2.5)."""
 
-from pathlib import Path
+import itertools
+from unittest.mock import patch
 
 from src.categorize.historical import (
     AMOUNT_TOLERANCE,
@@ -13,15 +14,15 @@
 )
 from src.database.models import Allocation, Import, Transaction
 from src.database.repository import Repository
+from tests.conftest import migrated_repo
 
-MIGRATIONS = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+# Unique suffixes for import_hash/dedup_key across all inserted history
+_COUNTER = itertools.count()
 
 
 def _repo() -> Repository:
     """Create an in-memory repo with schema applied."""
-    repo = Repository(":memory:")
-    repo.apply_migrations(MIGRATIONS)
-    return repo
+    return migrated_repo()
 
 
 def _import(repo: Repository) -> str:
@@ -39,9 +40,16 @@ def _add_history(
     category_id: str,
     count: int = 1,
     source: str = "auto",
+    status: str = "categorized",
 ):
-    """Insert `count` categorized transactions with matching allocations."""
+    """Insert `count` transactions with matching allocations.
+
+    Rows are built first, then written with one batch insert per table.
+    """
+    txns = []
+    allocs = []
     for _ in range(count):
+        n = next(_COUNTER)
         txn = Transaction(
             account_id="test-checking",
             date="2024-01-15",
@@ -49,21 +57,19 @@ def _add_history(
             raw_description=normalized_desc,
             normalized_description=normalized_desc,
             import_id=import_id,
-            import_hash=f"hash-{id(txn) if False else _add_history._counter}",
-            dedup_key=f"dk-{_add_history._counter}",
-            status="categorized",
+            import_hash=f"hash-{n}",
+            dedup_key=f"dk-{n}",
+            status=status,
         )
-        _add_history._counter += 1
-        repo.insert_transaction(txn)
-        alloc = Allocation(
+        txns.append(txn)
+        allocs.append(Allocation(
             transaction_id=txn.id,
             category_id=category_id,
             amount=amount,
             source=source,
-        )
-        repo.insert_allocation(alloc)
-
-_add_history._counter = 0
+        ))
+    repo.insert_transactions_batch(txns)
+    repo.insert_allocations_batch(allocs)
 
 
 class TestExactMatch:
@@ -210,7 +216,6 @@ def test_no_repo(self):
 
     def test_no_history(self):
         repo = _repo()
-        _import(repo)
         result = match_historical("UNKNOWN MERCHANT", -50.00, repo)
         assert result is None
 
@@ -218,33 +223,38 @@ def test_pending_txns_ignored(self):
         """Transactions with status='pending' should not be considered."""
         repo = _repo()
         imp_id = _import(repo)
-        # Insert pending transactions (not categorized)
-        for _ in range(5):
-            txn = Transaction(
-                account_id="test-checking",
-                date="2024-01-15",
-                amount=-50.00,
-                raw_description="PENDING MERCHANT",
-                normalized_description="PENDING MERCHANT",
-                import_id=imp_id,
-                import_hash=f"hash-pending-{_add_history._counter}",
-                dedup_key=f"dk-pending-{_add_history._counter}",
-                status="pending",
-            )
-            _add_history._counter += 1
-            repo.insert_transaction(txn)
-            alloc = Allocation(
-                transaction_id=txn.id,
-                category_id="some-cat",
-                amount=-50.00,
-                source="auto",
-            )
-            repo.insert_allocation(alloc)
+        _add_history(
+            repo, imp_id, "PENDING MERCHANT", -50.00, "some-cat",
+            count=5, status="pending",
+        )
 
         result = match_historical("PENDING MERCHANT", -50.00, repo)
         assert result is None
 
 
+class TestHistoryCache:
+    def test_description_queried_once(self):
+        repo = _repo()
+        imp_id = _import(repo)
+        _add_history(repo, imp_id, "CACHED MERCHANT", -20.00, "groceries", count=3)
+        history: dict = {}
+        with patch.object(
+            repo, "get_historical_category_counts",
+            wraps=repo.get_historical_category_counts,
+        ) as spy:
+            first = match_historical("CACHED MERCHANT", -20.00, repo, history=history)
+            second = match_historical("CACHED MERCHANT", -99.00, repo, history=history)
+        assert spy.call_count == 1
+        assert first.match_level == "exact"
+        assert second.match_level == "description"
+
+    def test_empty_result_cached(self):
+        repo = _repo()
+        history: dict = {}
+        assert match_historical("NEVER SEEN", -5.00, repo, history=history) is None
+        assert history == {"NEVER SEEN": []}
+
+
 class TestCsaaMotivatingExample:
     """The CSAA insurance scenario that motivated this feature.
 
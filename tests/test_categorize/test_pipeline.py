@@ -1,6 +1,8 @@
 """Tests for the categorization pipeline orchestrator."""
 
-from pathlib import Path
+import sqlite3
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
@@ -8,26 +10,25 @@
     CategorizeResult,
     _is_compatible,
     apply_categorization,
+    apply_categorizations,
     categorize_pending,
     categorize_transaction,
+    categorize_transactions,
 )
 from src.config import Config
 from src.database.models import Allocation, Import, Transaction
-from src.database.repository import Repository
-from tests.conftest import FIXTURE_CONFIG_DIR
+from tests.conftest import FIXTURE_CONFIG_DIR, migrated_repo
 
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
+    # Read-only for these tests; lazily built indexes are reused
     return Config(FIXTURE_CONFIG_DIR)
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -37,339 +38,332 @@ def imp(repo):
     return repo.insert_import(Import(file_name="test.qfx", file_hash="hash1"))
 
 
-def _txn(imp_id, **kw) -> Transaction:
-    defaults = dict(
-        account_id="wf-checking",
-        date="2026-01-15",
-        amount=-50.00,
-        raw_description="PHILZ COFFEE SF",
-        import_id=imp_id,
-        import_hash="h1",
-        dedup_key="dk1",
-    )
-    defaults.update(kw)
-    return Transaction(**defaults)
-
-
-# ── Step 1: Transfer detection ────────────────────────────
-
-
-class TestStep1Transfers:
-    def test_capital_one_payment(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="CAPITAL ONE MOBILE PMT 240115", amount=-500.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "transfer"
-        assert result.is_transfer is True
-        assert result.category_id == "xfer-cc-payment"
-        assert result.confidence == 1.0
-        assert result.from_account == "wf-checking"
-        assert result.to_account == "cap1-credit"
-
-    def test_mercury_io_autopay(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="IO AUTOPAY", amount=-100.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "transfer"
-        assert result.category_id == "xfer-internal"
-
-    def test_golden1_interest_fitid(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="golden1-auto",
-            raw_description="INTEREST", external_id="66886_84INT",
-            amount=-55.17,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "interest_detection"
-        assert result.category_id == "interest-fees"
-
-    def test_transfer_takes_priority_over_merchant(self, config, repo, imp):
-        """WF HOME MTG matches both transfer and merchant — transfer wins."""
-        txn = _txn(imp.id, raw_description="WF HOME MTG***1668", amount=-1668.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # WF HOME MTG is in merchant auto-match for mortgage,
-        # but NOT in transfer patterns, so it should be merchant_auto
-        assert result.method == "merchant_auto"
-        assert result.category_id == "mortgage"
-
-    def test_transfer_by_txn_type(self, config, repo, imp):
-        """txn_type=TRANSFER + 'Transfer : Capital One' detected via inferred path."""
-        txn = _txn(
-            imp.id, raw_description="Transfer : Capital One",
-            txn_type="TRANSFER", amount=-2700.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.is_transfer is True
-        assert result.category_id == "xfer-cc-payment"
-        assert result.confidence == 1.0
-
-    def test_transfer_by_txn_type_savings(self, config, repo, imp):
-        """txn_type=TRANSFER + 'Transfer : 1234 Joint Savings' → savings."""
-        txn = _txn(
-            imp.id, raw_description="Transfer : 1234 Joint Savings",
-            txn_type="TRANSFER", amount=-75.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.is_transfer is True
-        assert result.category_id == "xfer-savings"
-
-    def test_pattern_priority_over_txn_type(self, config, repo, imp):
-        """Pattern-based detection returns method='transfer', not 'transfer_inferred'."""
-        txn = _txn(
-            imp.id, raw_description="CAPITAL ONE MOBILE PMT 240115",
-            txn_type="TRANSFER", amount=-500.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "transfer"
-        assert result.is_transfer is True
-
-
-# ── Step 2: Merchant auto-match ───────────────────────────
-
+_TXN_DEFAULTS = MappingProxyType(dict(
+    account_id="wf-checking",
+    date="2026-01-15",
+    amount=-50.00,
+    raw_description="PHILZ COFFEE SF",
+    import_hash="h1",
+    dedup_key="dk1",
+))
 
-class TestStep2MerchantAuto:
-    def test_doordash(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="DOORDASH*ORDER 12345", amount=-35.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_auto"
-        assert result.category_id == "meal-delivery"
-        assert result.confidence == 1.0
-
-    def test_netflix(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="Netflix.com", amount=-15.99)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_auto"
-        assert result.category_id == "netflix"
 
-    def test_interest_payment(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="INTEREST PAYMENT", amount=3.50)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_auto"
-        assert result.category_id == "interest"
-
-    def test_employer_payroll_income(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="ACME CORP INC PAYROLL", amount=5500.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_auto"
-        assert result.category_id == "earnings"
-
-
-# ── Step 3: Amount rules ─────────────────────────────────
-
-
-class TestStep3AmountRules:
-    def test_apple_bill_movie_rental(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="APPLE.COM/BILL", amount=-3.99)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "movie-rentals"
-
-    def test_apple_bill_icloud(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="APPLE.COM/BILL", amount=-9.99)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "cloud-storage"
-
-    def test_csaa_car(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="CSAA INSURANCE GROUP", amount=-200.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "car-insurance"
-
-    def test_whole_foods_groceries(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="WHOLEFDS MKT 10294", amount=-75.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "groceries"
-
-
-# ── Step 4: Account rules ────────────────────────────────
-
-
-class TestStep4AccountRules:
-    def test_mercury_checking_default(self, config, repo, imp):
-        """Unknown Mercury merchant → biz-other default."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="RANDOM VENDOR LLC", amount=-150.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "account_rule"
-        assert result.category_id == "biz-other"
-
-    def test_mercury_credit_default(self, config, repo, imp):
-        """Unknown Mercury credit merchant → biz-other default."""
-        txn = _txn(
-            imp.id, account_id="mercury-credit",
-            raw_description="UNKNOWN VENDOR", amount=-75.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "account_rule"
-        assert result.category_id == "biz-other"
-
-    def test_golden1_non_transfer(self, config, repo, imp):
-        """Golden1 without INT FITID → interest-fees (account rule)."""
-        txn = _txn(
-            imp.id, account_id="golden1-auto",
-            raw_description="MISC FEE", external_id="99999",
-            amount=-10.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "account_rule"
-        assert result.category_id == "interest-fees"
-
-
-# ── Step 5: Merchant high-confidence ──────────────────────
-
-
-class TestStep5MerchantHigh:
-    def test_costco_from_wf_checking(self, config, repo, imp):
-        """Costco on wf-checking (no account rule) → high-confidence groceries."""
-        txn = _txn(imp.id, raw_description="COSTCO WHSE #1234", amount=-150.00)
-        repo.insert_transaction(txn)
+def _txn(imp_id, **kw) -> Transaction:
+    return Transaction(**{**_TXN_DEFAULTS, "import_id": imp_id, **kw})
+
+
+# ── Steps 1-5 and 8: rule-based categorization ────────────
+
+
+def _case(case_id, expected, **txn_kw):
+    return pytest.param(txn_kw, expected, id=case_id)
+
+
+# (transaction overrides, expected CategorizeResult fields)
+CATEGORIZE_CASES = [
+    # Step 1: Transfer detection
+    _case(
+        "capital-one-payment",
+        dict(method="transfer", is_transfer=True, category_id="xfer-cc-payment",
+             confidence=1.0, from_account="wf-checking", to_account="cap1-credit"),
+        raw_description="CAPITAL ONE MOBILE PMT 240115", amount=-500.00,
+    ),
+    _case(
+        "mercury-io-autopay",
+        dict(method="transfer", category_id="xfer-internal"),
+        account_id="mercury-checking", raw_description="IO AUTOPAY", amount=-100.00,
+    ),
+    _case(
+        "golden1-interest-fitid",
+        dict(method="interest_detection", category_id="interest-fees"),
+        account_id="golden1-auto", raw_description="INTEREST",
+        external_id="66886_84INT", amount=-55.17,
+    ),
+    # WF HOME MTG is a mortgage merchant, not a transfer pattern
+    _case(
+        "wf-home-mtg-is-merchant",
+        dict(method="merchant_auto", category_id="mortgage"),
+        raw_description="WF HOME MTG***1668", amount=-1668.00,
+    ),
+    _case(
+        "transfer-by-txn-type",
+        dict(method="transfer_inferred", is_transfer=True,
+             category_id="xfer-cc-payment", confidence=1.0),
+        raw_description="Transfer : Capital One", txn_type="TRANSFER", amount=-2700.00,
+    ),
+    _case(
+        "transfer-by-txn-type-savings",
+        dict(method="transfer_inferred", is_transfer=True, category_id="xfer-savings"),
+        raw_description="Transfer : 1234 Joint Savings", txn_type="TRANSFER", amount=-75.00,
+    ),
+    _case(
+        "pattern-priority-over-txn-type",
+        dict(method="transfer", is_transfer=True),
+        raw_description="CAPITAL ONE MOBILE PMT 240115", txn_type="TRANSFER", amount=-500.00,
+    ),
+    # Step 2: Merchant auto-match
+    _case(
+        "doordash",
+        dict(method="merchant_auto", category_id="meal-delivery", confidence=1.0),
+        raw_description="DOORDASH*ORDER 12345", amount=-35.00,
+    ),
+    _case(
+        "netflix",
+        dict(method="merchant_auto", category_id="netflix"),
+        raw_description="Netflix.com", amount=-15.99,
+    ),
+    _case(
+        "interest-payment",
+        dict(method="merchant_auto", category_id="interest"),
+        raw_description="INTEREST PAYMENT", amount=3.50,
+    ),
+    _case(
+        "employer-payroll",
+        dict(method="merchant_auto", category_id="earnings"),
+        raw_description="ACME CORP INC PAYROLL", amount=5500.00,
+    ),
+    # Step 3: Amount rules
+    _case(
+        "apple-bill-movie-rental",
+        dict(method="amount_rule", category_id="movie-rentals"),
+        raw_description="APPLE.COM/BILL", amount=-3.99,
+    ),
+    _case(
+        "apple-bill-icloud",
+        dict(method="amount_rule", category_id="cloud-storage"),
+        raw_description="APPLE.COM/BILL", amount=-9.99,
+    ),
+    _case(
+        "csaa-car",
+        dict(method="amount_rule", category_id="car-insurance"),
+        raw_description="CSAA INSURANCE GROUP", amount=-200.00,
+    ),
+    _case(
+        "whole-foods-groceries",
+        dict(method="amount_rule", category_id="groceries"),
+        raw_description="WHOLEFDS MKT 10294", amount=-75.00,
+    ),
+    # Step 3b: Amazon participant compensation, whole dollars on Mercury only
+    _case(
+        "amazon-whole-dollar-mercury",
+        dict(method="amount_rule", category_id="biz-participant-comp", confidence=0.90),
+        account_id="mercury-checking", raw_description="AMAZON.COM*AB12CD", amount=-25.00,
+    ),
+    _case(
+        "amzn-whole-dollar-mercury",
+        dict(method="amount_rule", category_id="biz-participant-comp"),
+        account_id="mercury-credit", raw_description="AMZN MKTP US*AB1CD2EF3", amount=-50.00,
+    ),
+    # biz- prefix keeps it from being filtered to biz-other
+    _case(
+        "biz-participant-comp-mercury-compatible",
+        dict(method="amount_rule", category_id="biz-participant-comp"),
+        account_id="mercury-checking", raw_description="AMAZON.COM*AB12CD", amount=-100.00,
+    ),
+    _case(
+        "amazon-fractional-mercury-falls-through",
+        dict(method="account_rule", category_id="biz-other"),
+        account_id="mercury-checking", raw_description="AMAZON.COM*AB12CD", amount=-25.99,
+    ),
+    _case(
+        "amazon-whole-dollar-wf",
+        dict(method="manual_review"),
+        account_id="wf-checking", raw_description="AMAZON.COM*AB12CD", amount=-25.00,
+    ),
+    # Step 4: Account rules
+    _case(
+        "mercury-checking-default",
+        dict(method="account_rule", category_id="biz-other"),
+        account_id="mercury-checking", raw_description="RANDOM VENDOR LLC", amount=-150.00,
+    ),
+    _case(
+        "mercury-credit-default",
+        dict(method="account_rule", category_id="biz-other"),
+        account_id="mercury-credit", raw_description="UNKNOWN VENDOR", amount=-75.00,
+    ),
+    # Golden1 without an INT FITID suffix
+    _case(
+        "golden1-non-transfer",
+        dict(method="account_rule", category_id="interest-fees"),
+        account_id="golden1-auto", raw_description="MISC FEE",
+        external_id="99999", amount=-10.00,
+    ),
+    # Step 5: Merchant high-confidence (wf-checking has no account rule)
+    _case(
+        "costco-wf-checking",
+        dict(method="merchant_high", category_id="groceries"),
+        raw_description="COSTCO WHSE #1234", amount=-150.00,
+    ),
+    _case(
+        "safeway",
+        dict(method="merchant_high", category_id="groceries"),
+        raw_description="SAFEWAY STORE #1234", amount=-85.00,
+    ),
+    _case(
+        "target",
+        dict(method="merchant_high", category_id="household-supplies"),
+        raw_description="TARGET T-1234", amount=-45.00,
+    ),
+    # Step 8: Manual review fallback
+    _case(
+        "unknown-merchant",
+        dict(method="manual_review", category_id="uncategorized", confidence=0.0),
+        raw_description="SOME RANDOM PLACE", amount=-25.00,
+    ),
+    # CHECK is ambiguous with <80% consistency
+    _case(
+        "check-payment-ambiguous",
+        dict(method="manual_review"),
+        raw_description="CHECK 1234", amount=-500.00,
+    ),
+    # Amazon is only in the ambiguous tier; its amount rules are Mercury-only
+    _case(
+        "amazon-fractional-wf",
+        dict(method="manual_review"),
+        raw_description="AMAZON.COM*AMZN MKTP", amount=-35.47,
+    ),
+    # Business accounts: personal categories become the account default
+    _case(
+        "starbucks-mercury",
+        dict(method="merchant_auto", category_id="biz-other"),
+        account_id="mercury-checking", raw_description="STARBUCKS STORE 12345", amount=-5.50,
+    ),
+    _case(
+        "starbucks-wf",
+        dict(method="merchant_auto", category_id="coffee-d"),
+        account_id="wf-checking", raw_description="STARBUCKS STORE 12345", amount=-5.50,
+    ),
+    _case(
+        "doordash-mercury",
+        dict(method="merchant_auto", category_id="biz-other"),
+        account_id="mercury-credit", raw_description="DOORDASH*ORDER 12345", amount=-35.00,
+    ),
+    _case(
+        "anthropic-mercury",
+        dict(method="merchant_auto", category_id="biz-saas"),
+        account_id="mercury-checking", raw_description="ANTHROPIC API CHARGE", amount=-20.00,
+    ),
+    _case(
+        "github-mercury",
+        dict(method="merchant_auto", category_id="biz-saas"),
+        account_id="mercury-checking", raw_description="GITHUB INC", amount=-4.00,
+    ),
+    _case(
+        "digitalocean-mercury",
+        dict(method="merchant_auto", category_id="biz-infrastructure"),
+        account_id="mercury-checking", raw_description="DIGITALOCEAN.COM", amount=-12.00,
+    ),
+    _case(
+        "cashback-mercury",
+        dict(method="merchant_auto", category_id="cashback"),
+        account_id="mercury-checking", raw_description="Mercury IO Cashback", amount=5.00,
+    ),
+    _case(
+        "interest-mercury",
+        dict(method="merchant_auto", category_id="interest"),
+        account_id="mercury-checking", raw_description="INTEREST PAYMENT", amount=3.50,
+    ),
+    _case(
+        "transfer-mercury-unfiltered",
+        dict(method="transfer", is_transfer=True, category_id="xfer-internal"),
+        account_id="mercury-checking", raw_description="IO AUTOPAY", amount=-100.00,
+    ),
+    _case(
+        "netflix-mercury-credit",
+        dict(method="merchant_auto", category_id="biz-other"),
+        account_id="mercury-credit", raw_description="Netflix.com", amount=-15.99,
+    ),
+    _case(
+        "interest-mercury-savings",
+        dict(method="merchant_auto", category_id="interest"),
+        account_id="mercury-savings", raw_description="INTEREST PAYMENT", amount=10.00,
+    ),
+    # Costco would be high-confidence groceries, but step 4 runs first
+    _case(
+        "costco-mercury",
+        dict(method="account_rule", category_id="biz-other"),
+        account_id="mercury-checking", raw_description="COSTCO WHSE #1234", amount=-150.00,
+    ),
+    _case(
+        "amount-rule-mercury-filtered",
+        dict(method="amount_rule", category_id="biz-other"),
+        account_id="mercury-checking", raw_description="WHOLEFDS MKT 10294", amount=-75.00,
+    ),
+]
+
+
+class TestRuleSteps:
+    """Steps that need no database: one transaction in, one result out."""
+
+    @pytest.mark.parametrize("txn_kw, expected", CATEGORIZE_CASES)
+    def test_categorize(self, config, txn_kw, expected):
+        result = categorize_transaction(_txn("imp-1", **txn_kw), config)
+        assert {field: getattr(result, field) for field in expected} == expected
+
+    def test_high_confidence_range(self, config):
+        txn = _txn("imp-1", raw_description="COSTCO WHSE #1234", amount=-150.00)
         result = categorize_transaction(txn, config)
-        assert result.method == "merchant_high"
-        assert result.category_id == "groceries"
         assert 0.80 <= result.confidence <= 0.99
 
-    def test_safeway(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="SAFEWAY STORE #1234", amount=-85.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_high"
-        assert result.category_id == "groceries"
-
-    def test_target(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="TARGET T-1234", amount=-45.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "merchant_high"
-        assert result.category_id == "household-supplies"
-
 
 # ── Step 7: Claude AI categorization ──────────────────────
 
 
-class TestStep7ClaudeAI:
-    def test_claude_categorizes_unknown_merchant(self, config, repo, imp):
-        """Step 7: Claude provides a category for an otherwise-unknown merchant."""
-        import json
-
-        txn = _txn(imp.id, raw_description="SOME RANDOM PLACE", amount=-25.00)
-        repo.insert_transaction(txn)
-
-        def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "dining-out",
-                "confidence": 0.7,
-                "reasoning": "Appears to be a restaurant",
-            })
-
-        result = categorize_transaction(
-            txn, config, claude_fn=mock_claude_fn, repo=repo,
-        )
-        assert result.method == "claude_ai"
-        assert result.category_id == "dining-out"
-        assert result.confidence == 0.7
-
-    def test_claude_skipped_when_no_claude_fn(self, config, repo, imp):
-        """Without claude_fn, Step 7 is skipped → manual review."""
-        txn = _txn(imp.id, raw_description="SOME RANDOM PLACE", amount=-25.00)
-        repo.insert_transaction(txn)
-
-        result = categorize_transaction(txn, config, claude_fn=None, repo=repo)
-        assert result.method == "manual_review"
-
-    def test_claude_skipped_when_no_repo(self, config, repo, imp):
-        """Without repo, Step 7 is skipped → manual review."""
-        txn = _txn(imp.id, raw_description="SOME RANDOM PLACE", amount=-25.00)
-        repo.insert_transaction(txn)
-
-        def mock_claude_fn(system, prompt):
-            return '{"category_id": "dining", "confidence": 0.7, "reasoning": "test"}'
-
-        result = categorize_transaction(txn, config, claude_fn=mock_claude_fn, repo=None)
-        assert result.method == "manual_review"
+# Canned Claude responses
+RESP_DINING_OUT = '{"category_id": "dining-out", "confidence": 0.7, "reasoning": "Appears to be a restaurant"}'
+RESP_DINING = '{"category_id": "dining", "confidence": 0.7, "reasoning": "test"}'
+RESP_UNCATEGORIZED = '{"category_id": "uncategorized", "confidence": 0.0, "reasoning": "Cannot determine"}'
+RESP_GROCERIES = '{"category_id": "groceries", "confidence": 0.8, "reasoning": "Grocery store"}'
+
+
+# (Claude reply or None for no claude_fn, pass the repo, expected fields)
+CLAUDE_CASES = [
+    pytest.param(
+        RESP_DINING_OUT, True,
+        dict(method="claude_ai", category_id="dining-out", confidence=0.7),
+        id="categorizes-unknown-merchant",
+    ),
+    pytest.param(None, True, dict(method="manual_review"), id="skipped-without-claude-fn"),
+    pytest.param(RESP_DINING, False, dict(method="manual_review"), id="skipped-without-repo"),
+    pytest.param(
+        RESP_UNCATEGORIZED, True, dict(method="manual_review"),
+        id="uncategorized-falls-through",
+    ),
+    # wf-checking has no category filter (Mercury accounts never reach
+    # Step 7: their account rules fire at Step 4), so the suggestion
+    # passes through unchanged
+    pytest.param(
+        RESP_GROCERIES, True, dict(method="claude_ai", category_id="groceries"),
+        id="unfiltered-account-keeps-category",
+    ),
+]
 
-    def test_claude_fallback_returns_uncategorized(self, config, repo, imp):
-        """When Claude returns uncategorized → falls through to manual review."""
-        import json
 
-        txn = _txn(imp.id, raw_description="SOME RANDOM PLACE", amount=-25.00)
-        repo.insert_transaction(txn)
+class TestStep7ClaudeAI:
+    @pytest.mark.parametrize("response, use_repo, expected", CLAUDE_CASES)
+    def test_claude_step(self, config, repo, response, use_repo, expected):
+        txn = _txn("imp-1", raw_description="SOME RANDOM PLACE", amount=-25.00)
 
         def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "uncategorized",
-                "confidence": 0.0,
-                "reasoning": "Cannot determine",
-            })
+            return response
 
         result = categorize_transaction(
-            txn, config, claude_fn=mock_claude_fn, repo=repo,
+            txn, config,
+            claude_fn=mock_claude_fn if response is not None else None,
+            repo=repo if use_repo else None,
         )
-        assert result.method == "manual_review"
-
-    def test_claude_respects_category_filter(self, config, repo, imp):
-        """Claude result on account with category_filter gets filtered."""
-        import json
-
-        # Use wf-checking (no account_rule, no category_filter) to
-        # confirm category_filter logic. Mercury accounts have account
-        # rules at Step 4 that fire before Step 7 is reached.
-        # So we test the filter by checking that a wf-checking
-        # transaction gets the Claude-suggested category as-is
-        # (wf-checking has no filter).
-        txn = _txn(
-            imp.id, account_id="wf-checking",
-            raw_description="SOME RANDOM PLACE", amount=-25.00,
-        )
-        repo.insert_transaction(txn)
-
-        def mock_claude_fn(system, prompt):
-            return json.dumps({
-                "category_id": "groceries",
-                "confidence": 0.8,
-                "reasoning": "Grocery store",
-            })
+        assert {field: getattr(result, field) for field in expected} == expected
 
-        result = categorize_transaction(
-            txn, config, claude_fn=mock_claude_fn, repo=repo,
-        )
-        # wf-checking has no category filter, so groceries passes through
-        assert result.method == "claude_ai"
-        assert result.category_id == "groceries"
-
-    def test_earlier_steps_take_priority_over_claude(self, config, repo, imp):
+    def test_earlier_steps_take_priority_over_claude(self, config, repo):
         """Known merchants should never reach Step 7."""
-        txn = _txn(imp.id, raw_description="DOORDASH*ORDER 12345", amount=-35.00)
-        repo.insert_transaction(txn)
+        txn = _txn("imp-1", raw_description="DOORDASH*ORDER 12345", amount=-35.00)
 
         call_count = 0
 
         def mock_claude_fn(system, prompt):
             nonlocal call_count
             call_count += 1
-            return '{"category_id": "dining", "confidence": 0.9, "reasoning": "test"}'
+            return RESP_DINING
 
         result = categorize_transaction(
             txn, config, claude_fn=mock_claude_fn, repo=repo,
@@ -378,100 +372,7 @@ def mock_claude_fn(system, prompt):
         assert call_count == 0  # Claude was never called
 
 
-# ── Step 8: Manual review fallback ────────────────────────
-
-
-class TestStep8ManualReview:
-    def test_unknown_merchant(self, config, repo, imp):
-        txn = _txn(imp.id, raw_description="SOME RANDOM PLACE", amount=-25.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "manual_review"
-        assert result.category_id == "uncategorized"
-        assert result.confidence == 0.0
-
-    def test_check_payment_ambiguous(self, config, repo, imp):
-        """CHECK is ambiguous with <80% consistency → manual review."""
-        txn = _txn(imp.id, raw_description="CHECK 1234", amount=-500.00)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "manual_review"
-
-    def test_amazon_no_amount_rule(self, config, repo, imp):
-        """Amazon fractional amount on wf-checking → manual review."""
-        txn = _txn(imp.id, raw_description="AMAZON.COM*AMZN MKTP", amount=-35.47)
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # Amazon is not in auto or high_confidence — it's in ambiguous
-        # Amazon whole-dollar rules only apply to Mercury accounts
-        assert result.method == "manual_review"
-
-
-# ── Step 3b: Amazon participant compensation on Mercury ───
-
-
-class TestStep3AmazonParticipantComp:
-    def test_amazon_whole_dollar_on_mercury(self, config, repo, imp):
-        """Amazon whole-dollar on Mercury → biz-participant-comp."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="AMAZON.COM*AB12CD", amount=-25.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "biz-participant-comp"
-        assert result.confidence == 0.90
-
-    def test_amzn_whole_dollar_on_mercury(self, config, repo, imp):
-        """AMZN variant whole-dollar on Mercury → biz-participant-comp."""
-        txn = _txn(
-            imp.id, account_id="mercury-credit",
-            raw_description="AMZN MKTP US*AB1CD2EF3", amount=-50.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "amount_rule"
-        assert result.category_id == "biz-participant-comp"
-
-    def test_amazon_fractional_on_mercury_falls_through(self, config, repo, imp):
-        """Amazon non-whole-dollar on Mercury → account rule (not amount rule)."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="AMAZON.COM*AB12CD", amount=-25.99,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # Fractional amount doesn't match whole-dollar rule,
-        # falls through to account rule (Mercury → biz-other)
-        assert result.method == "account_rule"
-        assert result.category_id == "biz-other"
-
-    def test_amazon_whole_dollar_on_wf_manual_review(self, config, repo, imp):
-        """Amazon whole-dollar on wf-checking → manual review (rules scoped to Mercury)."""
-        txn = _txn(
-            imp.id, account_id="wf-checking",
-            raw_description="AMAZON.COM*AB12CD", amount=-25.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "manual_review"
-
-    def test_biz_participant_comp_is_mercury_compatible(self, config, repo, imp):
-        """biz-participant-comp passes Mercury compatibility (biz- prefix)."""
-        # Verify the category doesn't get overridden to biz-other
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="AMAZON.COM*AB12CD", amount=-100.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # biz-participant-comp starts with biz-, so it's Mercury-compatible
-        assert result.category_id == "biz-participant-comp"
-        assert result.category_id != "biz-other"
-
-
-# ── Mercury business account priority ─────────────────────
+# ── Category filter ───────────────────────────────────────
 
 
 class TestCategoryFilter:
@@ -511,156 +412,6 @@ def test_no_filter_means_everything_compatible(self):
         assert _apply_filter("coffee-d", None) == "coffee-d"
 
 
-class TestMercuryBusinessPriority:
-    """Business account category filter integration tests.
-    Personal categories should be overridden to the account's default."""
-
-    def test_starbucks_on_mercury_becomes_biz_other(self, config, repo, imp):
-        """Starbucks on Mercury → biz-other (not coffee-d)."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="STARBUCKS STORE 12345", amount=-5.50,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-other"
-        assert result.method == "merchant_auto"
-
-    def test_starbucks_on_wf_stays_coffee(self, config, repo, imp):
-        """Same merchant on wf-checking → coffee-d (personal)."""
-        txn = _txn(
-            imp.id, account_id="wf-checking",
-            raw_description="STARBUCKS STORE 12345", amount=-5.50,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "coffee-d"
-
-    def test_doordash_on_mercury_becomes_biz_other(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="mercury-credit",
-            raw_description="DOORDASH*ORDER 12345", amount=-35.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-other"
-
-    def test_anthropic_on_mercury_stays_biz_saas(self, config, repo, imp):
-        """Biz-compatible merchant on Mercury → keeps biz-saas."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="ANTHROPIC API CHARGE", amount=-20.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-saas"
-        assert result.method == "merchant_auto"
-
-    def test_github_on_mercury_stays_biz_saas(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="GITHUB INC", amount=-4.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-saas"
-
-    def test_digitalocean_on_mercury_stays_biz_infra(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="DIGITALOCEAN.COM", amount=-12.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-infrastructure"
-
-    def test_cashback_on_mercury_stays_income(self, config, repo, imp):
-        """Income categories are Mercury-compatible."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="Mercury IO Cashback", amount=5.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "cashback"
-
-    def test_interest_on_mercury_stays_income(self, config, repo, imp):
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="INTEREST PAYMENT", amount=3.50,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "interest"
-
-    def test_mercury_transfer_unaffected(self, config, repo, imp):
-        """Transfers on Mercury are not subject to category override."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="IO AUTOPAY", amount=-100.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "xfer-internal"
-        assert result.is_transfer is True
-
-    def test_mercury_unknown_vendor_gets_biz_other(self, config, repo, imp):
-        """Unknown merchant on Mercury → account rule → biz-other."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="RANDOM VENDOR LLC", amount=-150.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.method == "account_rule"
-        assert result.category_id == "biz-other"
-
-    def test_mercury_credit_same_logic(self, config, repo, imp):
-        """mercury-credit follows the same business account logic."""
-        txn = _txn(
-            imp.id, account_id="mercury-credit",
-            raw_description="Netflix.com", amount=-15.99,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "biz-other"
-
-    def test_mercury_savings_same_logic(self, config, repo, imp):
-        """mercury-savings follows the same business account logic."""
-        txn = _txn(
-            imp.id, account_id="mercury-savings",
-            raw_description="INTEREST PAYMENT", amount=10.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        assert result.category_id == "interest"  # Income, Mercury-compatible
-
-    def test_high_confidence_on_mercury_overridden(self, config, repo, imp):
-        """High-confidence personal merchants on Mercury → biz-other via account rule."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="COSTCO WHSE #1234", amount=-150.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # Costco would normally be groceries (high_confidence),
-        # but Mercury account rule fires first (step 4 before step 5).
-        assert result.category_id == "biz-other"
-
-    def test_amount_rule_on_mercury_overridden(self, config, repo, imp):
-        """Amount rules that resolve to personal categories → biz-other on Mercury."""
-        txn = _txn(
-            imp.id, account_id="mercury-checking",
-            raw_description="WHOLEFDS MKT 10294", amount=-75.00,
-        )
-        repo.insert_transaction(txn)
-        result = categorize_transaction(txn, config)
-        # Whole Foods $75 would be groceries via amount rule, but
-        # Mercury overrides personal categories to biz-other
-        assert result.category_id == "biz-other"
-        assert result.method == "amount_rule"
-
-
 # ── apply_categorization ──────────────────────────────────
 
 
@@ -698,6 +449,91 @@ def test_manual_review_flags(self, config, repo, imp):
         assert updated.status == "flagged"
 
 
+class TestApplyCategorizations:
+    def test_batch_matches_single_apply(self, config, repo, imp):
+        t1 = _txn(imp.id, raw_description="Netflix.com", amount=-15.99,
+                  import_hash="h1", dedup_key="d1")
+        t2 = _txn(imp.id, raw_description="RANDOM PLACE", amount=-25.00,
+                  import_hash="h2", dedup_key="d2")
+        repo.insert_transactions_batch([t1, t2])
+        results = [(t, categorize_transaction(t, config)) for t in (t1, t2)]
+        written = apply_categorizations(results, repo)
+
+        netflix = repo.get_transaction(t1.id)
+        assert netflix.status == "categorized"
+        assert netflix.categorization_method == "merchant_auto"
+        assert repo.get_allocations_by_transaction(t1.id)[0].category_id == "netflix"
+        assert repo.get_transaction(t2.id).status == "flagged"
+        assert len(repo.get_allocations_by_transaction(t2.id)) == 1
+        stored = repo.get_allocations_by_transaction_ids([t1.id, t2.id])
+        assert {a.id for a in written} == {a.id for al in stored.values() for a in al}
+
+    def test_failed_batch_writes_nothing(self, repo, imp):
+        t1 = _txn(imp.id, import_hash="h1", dedup_key="d1")
+        repo.insert_transaction(t1)
+        missing = _txn(imp.id, import_hash="h2", dedup_key="d2")  # never inserted
+        result = CategorizeResult(
+            category_id="coffee", confidence=1.0, method="merchant_auto",
+        )
+        with pytest.raises(sqlite3.IntegrityError):
+            apply_categorizations([(t1, result), (missing, result)], repo)
+
+        assert repo.get_allocations_by_transaction(t1.id) == []
+        assert repo.get_transaction(t1.id).status == "pending"
+
+    def test_empty_batch(self, repo):
+        assert apply_categorizations([], repo) == []
+
+
+# ── categorize_transactions (memoized batch) ──────────────
+
+
+class TestCategorizeTransactions:
+    def _run(self, txns, config):
+        with patch(
+            "src.categorize.pipeline.categorize_transaction",
+            wraps=categorize_transaction,
+        ) as spy:
+            results = categorize_transactions(txns, config)
+        return results, spy.call_count
+
+    def test_repeated_rule_match_evaluated_once(self, config):
+        txns = [_txn("imp-1", raw_description="Netflix.com", amount=-15.99) for _ in range(3)]
+        results, calls = self._run(txns, config)
+        assert calls == 1
+        assert [t for t, _ in results] == txns
+        assert all(r.method == "merchant_auto" for _, r in results)
+
+    def test_different_amount_or_account_not_shared(self, config):
+        txns = [
+            _txn("imp-1", raw_description="Netflix.com", amount=-15.99),
+            _txn("imp-1", raw_description="Netflix.com", amount=-22.99),
+            _txn("imp-1", raw_description="Netflix.com", amount=-15.99,
+                 account_id="cap1-credit"),
+        ]
+        _, calls = self._run(txns, config)
+        assert calls == 3
+
+    def test_manual_review_not_reused(self, config):
+        txns = [_txn("imp-1", raw_description="RANDOM PLACE") for _ in range(2)]
+        results, calls = self._run(txns, config)
+        assert calls == 2
+        assert all(r.method == "manual_review" for _, r in results)
+
+    def test_history_queried_once_per_description(self, config, repo, imp):
+        txns = [
+            _txn(imp.id, raw_description="RANDOM PLACE", normalized_description="RANDOM PLACE",
+                 amount=-10.0 * (i + 1))
+            for i in range(3)
+        ]
+        with patch.object(
+            repo, "get_historical_category_counts",
+            wraps=repo.get_historical_category_counts,
+        ) as spy:
+            categorize_transactions(txns, config, repo=repo)
+        assert spy.call_count == 1
+
+
 # ── categorize_pending (batch) ────────────────────────────
 
 
@@ -708,8 +544,7 @@ def test_categorizes_batch(self, config, repo, imp):
             _txn(imp.id, raw_description="Netflix.com", amount=-15.99, import_hash="h2", dedup_key="d2"),
             _txn(imp.id, raw_description="RANDOM STORE", amount=-25.00, import_hash="h3", dedup_key="d3"),
         ]
-        for t in txns:
-            repo.insert_transaction(t)
+        repo.insert_transactions_batch(txns)
 
         result = categorize_pending(repo, config)
         assert result.total == 3
@@ -717,17 +552,18 @@ def test_categorizes_batch(self, config, repo, imp):
         assert result.method_counts.get("manual_review", 0) == 1
 
     def test_respects_limit(self, config, repo, imp):
-        for i in range(5):
-            txn = _txn(
+        repo.insert_transactions_batch([
+            _txn(
                 imp.id, raw_description=f"DOORDASH*ORDER {i}",
                 amount=-10.0 * (i + 1), import_hash=f"h{i}", dedup_key=f"d{i}",
             )
-            repo.insert_transaction(txn)
+            for i in range(5)
+        ])
 
         result = categorize_pending(repo, config, limit=3)
         assert result.total == 3
 
-    def test_empty_pending(self, config, repo, imp):
+    def test_empty_pending(self, config, repo):
         result = categorize_pending(repo, config)
         assert result.total == 0
         assert result.method_counts == {}
@@ -1,16 +1,17 @@
 """Tests for transfer detection module."""
 
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
 from src.categorize.transfer_detect import detect_transfer, detect_transfer_by_txn_type
+from src.config import Config
+from tests.conftest import FIXTURE_CONFIG_DIR
 
 
 def _make_config(transfers=None, rules=None):
-    """Create a mock config with test transfer patterns."""
-    config = MagicMock()
+    """Fixture Config with its rules replaced by test transfer patterns."""
+    config = Config(FIXTURE_CONFIG_DIR)
 
     if transfers is None:
         transfers = [
@@ -48,113 +49,102 @@ def _make_config(transfers=None, rules=None):
     else:
         rules.setdefault("transfers", transfers)
 
-    config.rules = rules
+    config._rules = rules
     return config
 
 
-class TestTransferDetection:
-    def test_credit_card_payment(self):
-        result = detect_transfer(
-            "CAPITAL ONE MOBILE PMT 240115", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.from_account == "primary-checking"
-        assert result.to_account == "primary-credit"
-        assert result.transfer_type == "cc-payment"
-
-    def test_second_credit_card_payment(self):
-        result = detect_transfer(
-            "AMERICAN EXPRESS ACH PMT", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.to_account == "secondary-credit"
-        assert result.transfer_type == "cc-payment"
-
-    def test_savings_transfer(self):
-        result = detect_transfer(
-            "TO SAVINGS TRANSFER", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.to_account == "primary-savings"
-        assert result.transfer_type == "savings-transfer"
-
-    def test_online_transfer_ref(self):
-        result = detect_transfer(
-            "ONLINE TRANSFER REF #12345", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.transfer_type == "savings-transfer"
-
-    def test_loan_payment(self):
-        result = detect_transfer(
-            "BANK ETRANSFER", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.to_account == "auto-loan"
-        assert result.transfer_type == "loan-payment"
-
-    def test_credit_union_loan_payment(self):
-        result = detect_transfer(
-            "Credit Union PAYMENT", "primary-checking", _make_config()
-        )
-        assert result is not None
-        assert result.transfer_type == "loan-payment"
-
-    def test_mercury_io_autopay(self):
-        result = detect_transfer(
-            "IO AUTOPAY", "mercury-checking", _make_config()
-        )
-        assert result is not None
-        assert result.from_account == "mercury-checking"
-        assert result.to_account == "mercury-credit"
-        assert result.transfer_type == "internal-transfer"
-
-    def test_mercury_io_payment(self):
-        result = detect_transfer(
-            "IO PAYMENT", "mercury-checking", _make_config()
-        )
-        assert result is not None
-        assert result.transfer_type == "internal-transfer"
-
-    def test_savings_from_business(self):
-        result = detect_transfer(
-            "Capital One - Savings XFER", "mercury-checking", _make_config()
-        )
-        assert result is not None
-        assert result.to_account == "cap1-savings"
-        assert result.transfer_type == "savings-transfer"
+@pytest.fixture(scope="module")
+def config():
+    """Default transfer-pattern config, shared read-only by the module."""
+    return _make_config()
+
+
+# (description, account_id, expected TransferMatch fields)
+MATCH_CASES = [
+    pytest.param(
+        "CAPITAL ONE MOBILE PMT 240115", "primary-checking",
+        dict(from_account="primary-checking", to_account="primary-credit",
+             transfer_type="cc-payment"),
+        id="credit-card-payment",
+    ),
+    pytest.param(
+        "AMERICAN EXPRESS ACH PMT", "primary-checking",
+        dict(to_account="secondary-credit", transfer_type="cc-payment"),
+        id="second-credit-card-payment",
+    ),
+    pytest.param(
+        "TO SAVINGS TRANSFER", "primary-checking",
+        dict(to_account="primary-savings", transfer_type="savings-transfer"),
+        id="savings-transfer",
+    ),
+    pytest.param(
+        "ONLINE TRANSFER REF #12345", "primary-checking",
+        dict(transfer_type="savings-transfer"),
+        id="online-transfer-ref",
+    ),
+    pytest.param(
+        "BANK ETRANSFER", "primary-checking",
+        dict(to_account="auto-loan", transfer_type="loan-payment"),
+        id="loan-payment",
+    ),
+    pytest.param(
+        "Credit Union PAYMENT", "primary-checking",
+        dict(transfer_type="loan-payment"),
+        id="credit-union-loan-payment",
+    ),
+    pytest.param(
+        "IO AUTOPAY", "mercury-checking",
+        dict(from_account="mercury-checking", to_account="mercury-credit",
+             transfer_type="internal-transfer"),
+        id="mercury-io-autopay",
+    ),
+    pytest.param(
+        "IO PAYMENT", "mercury-checking",
+        dict(transfer_type="internal-transfer"),
+        id="mercury-io-payment",
+    ),
+    pytest.param(
+        "Capital One - Savings XFER", "mercury-checking",
+        dict(to_account="cap1-savings", transfer_type="savings-transfer"),
+        id="savings-from-business",
+    ),
+    pytest.param(
+        "capital one mobile pmt", "primary-checking",
+        dict(to_account="primary-credit"),
+        id="case-insensitive",
+    ),
+    # mercury-credit is the to_account, should still match
+    pytest.param(
+        "IO AUTOPAY", "mercury-credit",
+        dict(from_account="mercury-checking", to_account="mercury-credit"),
+        id="io-autopay-from-credit-side",
+    ),
+]
+
+# (description, account_id) pairs that must not match
+NO_MATCH_CASES = [
+    pytest.param("PHILZ COFFEE SF CA", "primary-checking", id="normal-merchant"),
+    # IO AUTOPAY only valid from mercury-checking, not primary-checking
+    pytest.param("IO AUTOPAY", "primary-checking", id="wrong-account"),
+    # An account no transfer rule mentions never matches
+    pytest.param("CAPITAL ONE MOBILE PMT", "amex-blue", id="unknown-account"),
+]
 
-    def test_no_match_normal_merchant(self):
-        result = detect_transfer(
-            "PHILZ COFFEE SF CA", "primary-checking", _make_config()
-        )
-        assert result is None
-
-    def test_no_match_wrong_account(self):
-        """IO AUTOPAY only valid from mercury-checking, not primary-checking."""
-        result = detect_transfer(
-            "IO AUTOPAY", "primary-checking", _make_config()
-        )
-        assert result is None
-
-    def test_case_insensitive(self):
-        result = detect_transfer(
-            "capital one mobile pmt", "primary-checking", _make_config()
-        )
-        assert result is not None
 
-    def test_io_autopay_from_credit_side(self):
-        """mercury-credit is the to_account, should still match."""
-        result = detect_transfer(
-            "IO AUTOPAY", "mercury-credit", _make_config()
-        )
+class TestTransferDetection:
+    @pytest.mark.parametrize("description, account_id, expected", MATCH_CASES)
+    def test_match(self, config, description, account_id, expected):
+        result = detect_transfer(description, account_id, config)
         assert result is not None
+        assert {field: getattr(result, field) for field in expected} == expected
 
+    @pytest.mark.parametrize("description, account_id", NO_MATCH_CASES)
+    def test_no_match(self, config, description, account_id):
+        assert detect_transfer(description, account_id, config) is None
 
-def _make_txn_type_config(accounts=None, name_map=None):
-    """Create a mock config for txn_type detection tests."""
-    config = MagicMock()
 
+def _make_txn_type_config(accounts=None):
+    """Fixture Config with its accounts replaced for txn_type detection tests."""
     if accounts is None:
         accounts = [
             {"id": "primary-checking", "name": "Primary Checking", "account_type": "checking"},
@@ -164,31 +154,19 @@ def _make_txn_type_config(accounts=None, name_map=None):
             {"id": "secondary-credit", "name": "Amex Blue", "account_type": "credit"},
         ]
 
-    config.accounts = accounts
-
-    if name_map is None:
-        name_map = {}
-        for acct in accounts:
-            acct_id = acct.get("id", "")
-            for key in ("name", "budget_app_name"):
-                val = acct.get(key, "")
-                if val:
-                    name_map[val.upper()] = acct_id
-    config.transfer_name_map = name_map
-
-    def _account_by_id(aid):
-        for a in accounts:
-            if a["id"] == aid:
-                return a
-        return None
-
-    config.account_by_id = _account_by_id
+    config = Config(FIXTURE_CONFIG_DIR)
+    config._accounts = accounts
     return config
 
 
 class TestTransferByTxnType:
-    def test_basic_detection(self):
-        config = _make_txn_type_config()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
+        """Default txn_type config, shared read-only by the class."""
+        return _make_txn_type_config()
+
+    def test_basic_detection(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Capital One", -2700.0, "primary-checking", config
         )
@@ -197,31 +175,27 @@ def test_basic_detection(self):
         assert result.to_account == "primary-credit"
         assert result.transfer_type == "cc-payment"
 
-    def test_case_insensitive(self):
-        config = _make_txn_type_config()
+    def test_case_insensitive(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "transfer : capital one", -500.0, "primary-checking", config
         )
         assert result is not None
         assert result.to_account == "primary-credit"
 
-    def test_no_match_without_prefix(self):
-        config = _make_txn_type_config()
+    def test_no_match_without_prefix(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "CAPITAL ONE MOBILE PMT", -500.0, "primary-checking", config
         )
         assert result is None
 
-    def test_no_match_wrong_type(self):
-        config = _make_txn_type_config()
+    def test_no_match_wrong_type(self, config):
         result = detect_transfer_by_txn_type(
             "DEBIT", "Transfer : Capital One", -500.0, "primary-checking", config
         )
         assert result is None
 
-    def test_no_type_with_transfer_prefix(self):
+    def test_no_type_with_transfer_prefix(self, config):
         """Transfer : prefix alone is enough — txn_type=None is OK (e.g. budget app imports)."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             None, "Transfer : Capital One", -500.0, "primary-checking", config
         )
@@ -230,41 +204,36 @@ def test_no_type_with_transfer_prefix(self):
         assert result.to_account == "primary-credit"
         assert result.transfer_type == "cc-payment"
 
-    def test_same_account_skipped(self):
+    def test_same_account_skipped(self, config):
         """Self-referential transfers should be skipped."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Primary Checking", -100.0, "primary-checking", config
         )
         assert result is None
 
-    def test_infers_cc_payment(self):
-        config = _make_txn_type_config()
+    def test_infers_cc_payment(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Capital One", -2700.0, "primary-checking", config
         )
         assert result is not None
         assert result.transfer_type == "cc-payment"
 
-    def test_infers_savings_transfer(self):
-        config = _make_txn_type_config()
+    def test_infers_savings_transfer(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Joint Savings", -75.0, "primary-checking", config
         )
         assert result is not None
         assert result.transfer_type == "savings-transfer"
 
-    def test_infers_loan_payment(self):
-        config = _make_txn_type_config()
+    def test_infers_loan_payment(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Auto Loan", -800.0, "primary-checking", config
         )
         assert result is not None
         assert result.transfer_type == "loan-payment"
 
-    def test_outflow_direction(self):
+    def test_outflow_direction(self, config):
         """Negative amount means money leaves the current account."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Capital One", -2700.0, "primary-checking", config
         )
@@ -272,9 +241,8 @@ def test_outflow_direction(self):
         assert result.from_account == "primary-checking"
         assert result.to_account == "primary-credit"
 
-    def test_inflow_direction(self):
+    def test_inflow_direction(self, config):
         """Positive amount means money enters the current account."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Primary Checking", 2700.0, "primary-credit", config
         )
@@ -282,8 +250,7 @@ def test_inflow_direction(self):
         assert result.from_account == "primary-checking"
         assert result.to_account == "primary-credit"
 
-    def test_unknown_name(self):
-        config = _make_txn_type_config()
+    def test_unknown_name(self, config):
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer : Unknown Account", -100.0, "primary-checking", config
         )
@@ -303,41 +270,29 @@ def test_substring_match(self):
         assert result.to_account == "joint-savings"
         assert result.transfer_type == "savings-transfer"
 
-    def test_colon_without_space(self):
+    def test_colon_without_space(self, config):
         """Handle 'Transfer :Name' without space after colon."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             "TRANSFER", "Transfer :Capital One", -500.0, "primary-checking", config
         )
         assert result is not None
         assert result.to_account == "primary-credit"
 
-    def test_non_transfer_txn_type_rejected(self):
+    def test_non_transfer_txn_type_rejected(self, config):
         """Non-TRANSFER txn_type (e.g. DEBIT) should not match even with Transfer : prefix."""
-        config = _make_txn_type_config()
         result = detect_transfer_by_txn_type(
             "DEBIT", "Transfer : Capital One", -500.0, "primary-checking", config
         )
         assert result is None
 
     def test_transfer_alias_match(self):
-        """transfer_aliases in account config should resolve via name_map."""
+        """transfer_aliases in account config should resolve via transfer_name_map."""
         accounts = [
             {"id": "primary-checking", "name": "Primary Checking", "account_type": "checking"},
             {"id": "wf-savings", "name": "Joint Savings", "account_type": "savings",
              "transfer_aliases": ["9999 Vacation"]},
         ]
-        # Build name_map including aliases (mirrors Config.transfer_name_map)
-        name_map = {}
-        for acct in accounts:
-            for key in ("name", "budget_app_name"):
-                val = acct.get(key, "")
-                if val:
-                    name_map[val.upper()] = acct["id"]
-            for alias in acct.get("transfer_aliases", []):
-                if alias:
-                    name_map[alias.upper()] = acct["id"]
-        config = _make_txn_type_config(accounts=accounts, name_map=name_map)
+        config = _make_txn_type_config(accounts=accounts)
         result = detect_transfer_by_txn_type(
             None, "Transfer : 9999 Vacation", -208.50, "primary-checking", config
         )
@@ -8,13 +8,15 @@
 from __future__ import annotations
 
 import subprocess
-import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
 from src.cli import (
+    _COMMANDS,
+    _build_parser,
     cmd_import,
     cmd_import_budget_app,
     cmd_poll,
@@ -25,6 +27,9 @@
     cmd_watch,
     main,
 )
+from src.database.dedup import BatchResult
+from src.database.models import Transaction
+from src.parsers.base import RawTransaction
 
 
 # ── Helpers ──────────────────────────────────────────────
@@ -36,68 +41,53 @@ def _make_args(**kwargs):
     return argparse.Namespace(**kwargs)
 
 
-def _mock_repo_with_schema():
-    """Create a real in-memory repo with schema applied."""
-    from src.database.repository import Repository
-    repo = Repository(db_path=":memory:")
-    migrations_dir = Path("src/database/migrations")
-    if migrations_dir.exists():
-        repo.apply_migrations(migrations_dir)
-    return repo
+def _run_main(capsys, argv):
+    """Run main(argv) in-process; return (exit code, stdout, stderr)."""
+    with patch("src.cli._setup_logging"):
+        with pytest.raises(SystemExit) as exc:
+            main(argv)
+    captured = capsys.readouterr()
+    return exc.value.code, captured.out, captured.err
 
 
-# ── Argument parsing tests (subprocess) ──────────────────
+# ── Argument parsing tests ───────────────────────────────
 
 
 class TestCliHelp:
-    def test_help_exits_zero(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli", "--help"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        assert "MoMoney personal finance tracker" in result.stdout
+    def test_help_exits_zero(self, capsys):
+        code, out, _ = _run_main(capsys, ["--help"])
+        assert code == 0
+        assert "MoMoney personal finance tracker" in out
 
-    def test_no_args_exits_zero(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        assert "usage:" in result.stdout.lower() or "MoMoney" in result.stdout
+    def test_no_args_exits_zero(self, capsys):
+        code, out, _ = _run_main(capsys, [])
+        assert code == 0
+        assert "usage:" in out.lower() or "MoMoney" in out
 
 
 class TestCliSubcommands:
-    def test_all_subcommands_listed_in_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli", "--help"],
-            capture_output=True, text=True,
-        )
+    def test_all_subcommands_listed_in_help(self, capsys):
+        _, out, _ = _run_main(capsys, ["--help"])
         for cmd in ["import", "watch", "status", "review", "reconcile", "push", "poll", "import-budget-app", "category"]:
-            assert cmd in result.stdout, f"Subcommand '{cmd}' not in help output"
+            assert cmd in out, f"Subcommand '{cmd}' not in help output"
 
-    def test_import_subcommand_help(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli", "import", "--help"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        assert "--file" in result.stdout
+    def test_import_subcommand_help(self, capsys):
+        code, out, _ = _run_main(capsys, ["import", "--help"])
+        assert code == 0
+        assert "--file" in out
 
-    def test_reconcile_accepts_optional_account(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli", "reconcile", "--help"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        assert "account" in result.stdout.lower()
+    def test_reconcile_accepts_optional_account(self, capsys):
+        code, out, _ = _run_main(capsys, ["reconcile", "--help"])
+        assert code == 0
+        assert "account" in out.lower()
+
+    def test_import_budget_app_requires_file_arg(self, capsys):
+        code, _, err = _run_main(capsys, ["import-budget-app"])
+        assert code != 0  # argparse error, missing required arg
+        assert "file" in err
 
-    def test_import_budget_app_requires_file_arg(self):
-        result = subprocess.run(
-            [sys.executable, "-m", "src.cli", "import-budget-app"],
-            capture_output=True, text=True,
-        )
-        assert result.returncode != 0  # argparse error, missing required arg
+
+# ── Installed entry point (subprocess) ───────────────────
 
 
 class TestMoMoneyEntryPoint:
@@ -114,13 +104,16 @@ def test_momoney_command_exists(self):
 
 
 class TestMainDispatch:
-    def test_main_dispatches_to_handler(self):
+    def test_main_dispatches_to_handler(self, monkeypatch):
         """main() dispatches to the correct command handler."""
-        with patch("src.cli._COMMANDS", {"status": MagicMock(return_value=0)}):
-            with patch("src.cli._setup_logging"):
-                with pytest.raises(SystemExit) as exc:
-                    main(["status"])
-                assert exc.value.code == 0
+        handler = MagicMock(return_value=0)
+        monkeypatch.setitem(_COMMANDS, "status", handler)
+        with patch("src.cli._setup_logging"):
+            with pytest.raises(SystemExit) as exc:
+                main(["status"])
+            assert exc.value.code == 0
+        handler.assert_called_once()
+        assert handler.call_args.args[0].command == "status"
 
     def test_main_no_command_shows_help(self, capsys):
         """main() with no command prints help and exits 0."""
@@ -129,104 +122,93 @@ def test_main_no_command_shows_help(self, capsys):
                 main([])
             assert exc.value.code == 0
 
-    def test_main_accepts_argv(self):
+    def test_main_accepts_argv(self, monkeypatch):
         """main() accepts argv parameter for testability."""
-        with patch("src.cli._COMMANDS", {"status": MagicMock(return_value=0)}):
-            with patch("src.cli._setup_logging"):
-                with pytest.raises(SystemExit) as exc:
-                    main(["status"])
-                assert exc.value.code == 0
+        monkeypatch.setitem(_COMMANDS, "status", MagicMock(return_value=0))
+        with patch("src.cli._setup_logging"):
+            with pytest.raises(SystemExit) as exc:
+                main(["status"])
+            assert exc.value.code == 0
+
+    def test_parser_built_once(self):
+        """Repeated main() calls reuse one argument parser."""
+        assert _build_parser() is _build_parser()
 
 
 # ── cmd_import tests ─────────────────────────────────────
 
 
+@pytest.fixture
+def cli_env(monkeypatch):
+    """Replace the import-pipeline factories in src.cli with mocks.
+
+    Returns a namespace with the repo that _get_repo() returns and the
+    pipeline that ImportPipeline() builds, for tests to configure.
+    """
+    env = SimpleNamespace(repo=MagicMock(), pipeline=MagicMock())
+    env.pipeline_cls = MagicMock(return_value=env.pipeline)
+    monkeypatch.setattr("src.cli._get_config", MagicMock())
+    monkeypatch.setattr("src.cli._get_repo", MagicMock(return_value=env.repo))
+    monkeypatch.setattr("src.cli._get_dedup", MagicMock())
+    monkeypatch.setattr("src.cli._get_sheets", MagicMock(return_value=None))
+    monkeypatch.setattr("src.cli._get_migrations_dir", MagicMock())
+    monkeypatch.setattr("src.watcher.observer.ImportPipeline", env.pipeline_cls)
+    return env
+
+
 class TestCmdImport:
-    def test_import_single_file_success(self, tmp_path):
+    def test_import_single_file_success(self, tmp_path, cli_env):
         """Import a single file successfully."""
         f = tmp_path / "test.qfx"
         f.write_text("<OFX>content</OFX>")
 
-        mock_pipeline = MagicMock()
         mock_result = MagicMock()
         mock_result.file_name = "test.qfx"
         mock_result.status = "success"
         mock_result.new_count = 5
         mock_result.duplicate_count = 0
         mock_result.flagged_count = 0
-        mock_pipeline.process_file.return_value = mock_result
+        cli_env.pipeline.process_file.return_value = mock_result
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.watcher.observer.ImportPipeline", return_value=mock_pipeline):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            args = _make_args(file=f, command="import")
-            ret = cmd_import(args)
+        args = _make_args(file=f, command="import")
+        ret = cmd_import(args)
 
         assert ret == 0
-        mock_pipeline.process_file.assert_called_once()
-        mock_repo.close.assert_called_once()
+        cli_env.pipeline.process_file.assert_called_once()
+        cli_env.repo.close.assert_called_once()
 
-    def test_import_file_not_found(self, tmp_path, capsys):
+    def test_import_file_not_found(self, tmp_path, capsys, cli_env):
         """Import of nonexistent file returns error."""
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.watcher.observer.ImportPipeline"):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            args = _make_args(file=tmp_path / "nonexistent.qfx", command="import")
-            ret = cmd_import(args)
+        args = _make_args(file=tmp_path / "nonexistent.qfx", command="import")
+        ret = cmd_import(args)
 
         assert ret == 1
         assert "not found" in capsys.readouterr().out.lower()
 
-    def test_import_unsupported_extension(self, tmp_path, capsys):
+    def test_import_unsupported_extension(self, tmp_path, capsys, cli_env):
         """Import of unsupported file type returns error."""
         f = tmp_path / "data.pdf"
         f.write_text("PDF content")
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.watcher.observer.ImportPipeline"):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            args = _make_args(file=f, command="import")
-            ret = cmd_import(args)
+        args = _make_args(file=f, command="import")
+        ret = cmd_import(args)
 
         assert ret == 1
         assert "unsupported" in capsys.readouterr().out.lower()
 
-    def test_import_batch_no_files(self, tmp_path, capsys):
+    def test_import_batch_no_files(self, tmp_path, capsys, cli_env):
         """Batch import with no files returns 0."""
         watch_dir = tmp_path / "import"
         watch_dir.mkdir()
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.cli._get_watch_dir", return_value=watch_dir), \
-             patch("src.watcher.observer.ImportPipeline"):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
+        with patch("src.cli._get_watch_dir", return_value=watch_dir):
             args = _make_args(file=None, command="import")
             ret = cmd_import(args)
 
         assert ret == 0
         assert "no pending" in capsys.readouterr().out.lower()
 
-    def test_import_batch_processes_files(self, tmp_path, capsys):
+    def test_import_batch_processes_files(self, tmp_path, capsys, cli_env):
         """Batch import processes all supported files in watch dir."""
         watch_dir = tmp_path / "import"
         watch_dir.mkdir()
@@ -234,38 +216,28 @@ def test_import_batch_processes_files(self, tmp_path, capsys):
         (watch_dir / "b.csv").write_text("data\n")
         (watch_dir / "readme.txt").write_text("ignore")
 
-        mock_pipeline = MagicMock()
         mock_result = MagicMock()
         mock_result.file_name = "test"
         mock_result.status = "success"
         mock_result.new_count = 3
         mock_result.duplicate_count = 0
-        mock_pipeline.process_file.return_value = mock_result
+        cli_env.pipeline.process_file.return_value = mock_result
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.cli._get_watch_dir", return_value=watch_dir), \
-             patch("src.watcher.observer.ImportPipeline", return_value=mock_pipeline):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
+        with patch("src.cli._get_watch_dir", return_value=watch_dir):
             args = _make_args(file=None, command="import")
             ret = cmd_import(args)
 
         assert ret == 0
         # Should process 2 files (a.qfx, b.csv) but not readme.txt
-        assert mock_pipeline.process_file.call_count == 2
+        assert cli_env.pipeline.process_file.call_count == 2
         output = capsys.readouterr().out
         assert "Processed 2 files" in output
 
-    def test_import_error_result_returns_nonzero(self, tmp_path):
+    def test_import_error_result_returns_nonzero(self, tmp_path, cli_env):
         """Single file import with error result returns 1."""
         f = tmp_path / "bad.qfx"
         f.write_text("<OFX></OFX>")
 
-        mock_pipeline = MagicMock()
         mock_result = MagicMock()
         mock_result.file_name = "bad.qfx"
         mock_result.status = "error"
@@ -273,18 +245,10 @@ def test_import_error_result_returns_nonzero(self, tmp_path):
         mock_result.duplicate_count = 0
         mock_result.flagged_count = 0
         mock_result.error_message = "Parse failed"
-        mock_pipeline.process_file.return_value = mock_result
+        cli_env.pipeline.process_file.return_value = mock_result
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.watcher.observer.ImportPipeline", return_value=mock_pipeline):
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            args = _make_args(file=f, command="import")
-            ret = cmd_import(args)
+        args = _make_args(file=f, command="import")
+        ret = cmd_import(args)
 
         assert ret == 1
 
@@ -293,29 +257,64 @@ def test_import_error_result_returns_nonzero(self, tmp_path):
 
 
 class TestCmdWatch:
-    def test_watch_starts_and_stops(self):
+    def test_watch_starts_and_stops(self, cli_env):
         """Watch command starts watcher and handles KeyboardInterrupt."""
         mock_watcher = MagicMock()
         mock_watcher.watch_dir = Path("/tmp/import")
 
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_dedup"), \
-             patch("src.cli._get_sheets", return_value=None), \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.cli._get_watch_dir"), \
-             patch("src.watcher.observer.ImportPipeline"), \
+        with patch("src.cli._get_watch_dir"), \
              patch("src.watcher.observer.FileWatcher", return_value=mock_watcher), \
-             patch("src.cli.time.sleep", side_effect=KeyboardInterrupt()) as mock_sleep:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
+             patch("src.cli.time.sleep", side_effect=KeyboardInterrupt()):
             args = _make_args(command="watch")
             ret = cmd_watch(args)
 
         assert ret == 0
         mock_watcher.start.assert_called_once()
         mock_watcher.stop.assert_called_once()
-        mock_repo.close.assert_called_once()
+        cli_env.repo.close.assert_called_once()
+
+    def test_watch_one_watcher_per_dir(self, cli_env):
+        """Each watch dir gets its own watcher, all sharing one pipeline."""
+        dirs = [Path("/tmp/small"), Path("/tmp/large")]
+        watchers = [MagicMock(watch_dir=d) for d in dirs]
+
+        with patch("src.cli._get_watch_dirs", return_value=dirs), \
+             patch("src.watcher.observer.FileWatcher", side_effect=watchers) as mock_fw, \
+             patch("src.cli.time.sleep", side_effect=KeyboardInterrupt()):
+            ret = cmd_watch(_make_args(command="watch"))
+
+        assert ret == 0
+        assert [c.kwargs["watch_dir"] for c in mock_fw.call_args_list] == dirs
+        pipeline = cli_env.pipeline_cls.return_value
+        assert all(c.kwargs["pipeline"] is pipeline for c in mock_fw.call_args_list)
+        for w in watchers:
+            w.start.assert_called_once()
+            w.stop.assert_called_once()
+
+    def test_watch_invalid_observer_mode(self, capsys, cli_env, monkeypatch):
+        """A bad FINANCE_WATCH_OBSERVER is reported before opening the repo."""
+        monkeypatch.setenv("FINANCE_WATCH_OBSERVER", "inotify")
+        ret = cmd_watch(_make_args(command="watch"))
+
+        assert ret == 1
+        assert "FINANCE_WATCH_OBSERVER" in capsys.readouterr().out
+        cli_env.pipeline_cls.assert_not_called()
+        cli_env.repo.close.assert_not_called()
+
+    def test_watch_stops_only_started_watchers(self, cli_env):
+        """If a watcher fails to start, only the started ones are stopped."""
+        dirs = [Path("/tmp/small"), Path("/tmp/large")]
+        watchers = [MagicMock(watch_dir=d) for d in dirs]
+        watchers[1].start.side_effect = OSError("no such device")
+
+        with patch("src.cli._get_watch_dirs", return_value=dirs), \
+             patch("src.watcher.observer.FileWatcher", side_effect=watchers):
+            with pytest.raises(OSError):
+                cmd_watch(_make_args(command="watch"))
+
+        watchers[0].stop.assert_called_once()
+        watchers[1].stop.assert_not_called()
+        cli_env.repo.close.assert_called_once()
 
 
 # ── cmd_status tests ─────────────────────────────────────
@@ -423,84 +422,63 @@ def test_review_with_items(self, capsys):
 # ── cmd_reconcile tests ──────────────────────────────────
 
 
-class TestCmdReconcile:
-    def test_reconcile_single_account_balanced(self, capsys):
-        """Reconcile single account that's balanced."""
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.database.queries.get_reconciliation_data") as mock_recon:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_recon.return_value = {
-                "status": "balanced",
-                "date": "2025-01-31",
-                "statement_balance": 5000.00,
-                "computed_balance": 5000.00,
-                "difference": 0.00,
-            }
-            args = _make_args(command="reconcile", account="wf-checking")
-            ret = cmd_reconcile(args)
-
-        assert ret == 0
-        output = capsys.readouterr().out
-        assert "OK" in output
-        assert "wf-checking" in output
+# (account arg, reconciliation data, expected exit code, expected output)
+RECONCILE_CASES = [
+    pytest.param(
+        "wf-checking",
+        {"status": "balanced", "date": "2025-01-31", "statement_balance": 5000.00,
+         "computed_balance": 5000.00, "difference": 0.00},
+        0, ["OK", "wf-checking"],
+        id="single-account-balanced",
+    ),
+    pytest.param(
+        "wf-checking",
+        {"status": "discrepancy", "date": "2025-01-31", "statement_balance": 5000.00,
+         "computed_balance": 4950.00, "difference": 50.00},
+        1, ["MISMATCH"],
+        id="discrepancy-returns-nonzero",
+    ),
+    pytest.param(
+        "mercury-checking", {"status": "no_balance_data"}, 0, ["No balance data"],
+        id="no-balance-data",
+    ),
+]
 
-    def test_reconcile_discrepancy_returns_nonzero(self, capsys):
-        """Reconcile with discrepancy returns exit code 1."""
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.database.queries.get_reconciliation_data") as mock_recon:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_recon.return_value = {
-                "status": "discrepancy",
-                "date": "2025-01-31",
-                "statement_balance": 5000.00,
-                "computed_balance": 4950.00,
-                "difference": 50.00,
-            }
-            args = _make_args(command="reconcile", account="wf-checking")
-            ret = cmd_reconcile(args)
 
-        assert ret == 1
+class TestCmdReconcile:
+    @pytest.fixture
+    def mock_recon(self, monkeypatch):
+        """Patch the reconcile dependencies; return the data-query mock."""
+        recon = MagicMock()
+        monkeypatch.setattr("src.cli._get_config", MagicMock())
+        monkeypatch.setattr("src.cli._get_repo", MagicMock())
+        monkeypatch.setattr("src.cli._get_migrations_dir", MagicMock())
+        monkeypatch.setattr("src.database.queries.get_reconciliation_data", recon)
+        return recon
+
+    @pytest.mark.parametrize("account, recon, expected_ret, expected_out", RECONCILE_CASES)
+    def test_reconcile_single_account(
+        self, capsys, mock_recon, account, recon, expected_ret, expected_out,
+    ):
+        mock_recon.return_value = recon
+        ret = cmd_reconcile(_make_args(command="reconcile", account=account))
+
+        assert ret == expected_ret
         output = capsys.readouterr().out
-        assert "MISMATCH" in output
-
-    def test_reconcile_no_balance_data(self, capsys):
-        """Reconcile when account has no balance data."""
-        with patch("src.cli._get_config"), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.database.queries.get_reconciliation_data") as mock_recon:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_recon.return_value = {"status": "no_balance_data"}
-            args = _make_args(command="reconcile", account="mercury-checking")
-            ret = cmd_reconcile(args)
-
-        assert ret == 0
-        assert "no balance data" in capsys.readouterr().out.lower()
+        for text in expected_out:
+            assert text in output
 
-    def test_reconcile_all_accounts(self, capsys):
+    def test_reconcile_all_accounts(self, capsys, mock_recon, monkeypatch):
         """Reconcile all accounts when no specific account given."""
         mock_config = MagicMock()
         mock_config.accounts = [
             {"id": "wf-checking"},
             {"id": "cap1-credit"},
         ]
+        monkeypatch.setattr("src.cli._get_config", MagicMock(return_value=mock_config))
+        mock_recon.return_value = {"status": "no_balance_data"}
 
-        with patch("src.cli._get_config", return_value=mock_config), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.database.queries.get_reconciliation_data") as mock_recon:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_recon.return_value = {"status": "no_balance_data"}
-            args = _make_args(command="reconcile", account=None)
-            ret = cmd_reconcile(args)
+        ret = cmd_reconcile(_make_args(command="reconcile", account=None))
 
         assert ret == 0
         assert mock_recon.call_count == 2
@@ -545,6 +523,31 @@ def test_push_calls_full_rebuild(self, capsys):
 # ── cmd_poll tests ───────────────────────────────────────
 
 
+_ACTION = SimpleNamespace(
+    sheet="Transactions", row_index=5, column="Override: Category",
+    new_value="coffee-d", entity_id="alloc-123",
+)
+
+# (poll result, expected exit code, expected output)
+POLL_CASES = [
+    pytest.param(
+        SimpleNamespace(overrides_applied=0, errors=0, actions=[]),
+        0, ["No overrides"],
+        id="no-overrides",
+    ),
+    pytest.param(
+        SimpleNamespace(overrides_applied=1, errors=0, actions=[_ACTION]),
+        0, ["1 override", "coffee-d"],
+        id="with-overrides",
+    ),
+    pytest.param(
+        SimpleNamespace(overrides_applied=0, errors=2, actions=[]),
+        1, ["2 error"],
+        id="errors-return-nonzero",
+    ),
+]
+
+
 class TestCmdPoll:
     def test_poll_no_sheets_configured(self, capsys):
         """Poll without sheets configured returns error."""
@@ -555,96 +558,35 @@ def test_poll_no_sheets_configured(self, capsys):
         assert ret == 1
         assert "not configured" in capsys.readouterr().out.lower()
 
-    def test_poll_no_overrides(self, capsys):
-        """Poll with no overrides found."""
-        mock_ss = MagicMock()
-        mock_result = MagicMock()
-        mock_result.overrides_applied = 0
-        mock_result.errors = 0
-        mock_result.actions = []
-
-        with patch("src.cli._get_spreadsheet", return_value=mock_ss), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_config") as mock_config_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.sheets.overrides.OverridePoller") as mock_poller_cls:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_config_fn.return_value = MagicMock()
-            mock_poller = MagicMock()
-            mock_poller.poll.return_value = mock_result
-            mock_poller_cls.return_value = mock_poller
-
-            args = _make_args(command="poll")
-            ret = cmd_poll(args)
-
-        assert ret == 0
-        assert "no overrides" in capsys.readouterr().out.lower()
-        mock_repo.close.assert_called_once()
-
-    def test_poll_with_overrides(self, capsys):
-        """Poll applies overrides and prints summary."""
-        mock_ss = MagicMock()
-        mock_action = MagicMock()
-        mock_action.sheet = "Transactions"
-        mock_action.row_index = 5
-        mock_action.column = "Override: Category"
-        mock_action.new_value = "coffee-d"
-        mock_action.entity_id = "alloc-123"
-
-        mock_result = MagicMock()
-        mock_result.overrides_applied = 1
-        mock_result.errors = 0
-        mock_result.actions = [mock_action]
-
-        with patch("src.cli._get_spreadsheet", return_value=mock_ss), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_config") as mock_config_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.sheets.overrides.OverridePoller") as mock_poller_cls:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_config_fn.return_value = MagicMock()
-            mock_poller = MagicMock()
-            mock_poller.poll.return_value = mock_result
-            mock_poller_cls.return_value = mock_poller
+    @pytest.mark.parametrize("result, expected_ret, expected_out", POLL_CASES)
+    def test_poll(self, capsys, monkeypatch, result, expected_ret, expected_out):
+        mock_repo = MagicMock()
+        mock_poller_cls = MagicMock()
+        mock_poller_cls.return_value.poll.return_value = result
+        monkeypatch.setattr("src.cli._get_spreadsheet", MagicMock())
+        monkeypatch.setattr("src.cli._get_repo", MagicMock(return_value=mock_repo))
+        monkeypatch.setattr("src.cli._get_config", MagicMock())
+        monkeypatch.setattr("src.cli._get_migrations_dir", MagicMock())
+        monkeypatch.setattr("src.sheets.overrides.OverridePoller", mock_poller_cls)
 
-            args = _make_args(command="poll")
-            ret = cmd_poll(args)
+        ret = cmd_poll(_make_args(command="poll"))
 
-        assert ret == 0
+        assert ret == expected_ret
         output = capsys.readouterr().out
-        assert "1 override" in output
-        assert "coffee-d" in output
-
-    def test_poll_with_errors_returns_nonzero(self, capsys):
-        """Poll with errors returns exit code 1."""
-        mock_ss = MagicMock()
-        mock_result = MagicMock()
-        mock_result.overrides_applied = 0
-        mock_result.errors = 2
-        mock_result.actions = []
+        for text in expected_out:
+            assert text in output
+        mock_repo.close.assert_called_once()
 
-        with patch("src.cli._get_spreadsheet", return_value=mock_ss), \
-             patch("src.cli._get_repo") as mock_repo_fn, \
-             patch("src.cli._get_config") as mock_config_fn, \
-             patch("src.cli._get_migrations_dir"), \
-             patch("src.sheets.overrides.OverridePoller") as mock_poller_cls:
-            mock_repo = MagicMock()
-            mock_repo_fn.return_value = mock_repo
-            mock_config_fn.return_value = MagicMock()
-            mock_poller = MagicMock()
-            mock_poller.poll.return_value = mock_result
-            mock_poller_cls.return_value = mock_poller
 
-            args = _make_args(command="poll")
-            ret = cmd_poll(args)
-
-        assert ret == 1
-        assert "2 error" in capsys.readouterr().out
+# ── cmd_import_budget_app tests ────────────────────────────
 
 
-# ── cmd_import_budget_app tests ────────────────────────────
+def _raw_txn():
+    """One parsed budget app row with no pre-mapped category."""
+    return RawTransaction(
+        date="2025-01-15", amount=-12.34,
+        raw_description="SAMPLE MERCHANT", account_id="wf-checking",
+    )
 
 
 class TestCmdImportBudgetApp:
@@ -674,7 +616,7 @@ def test_import_budget_app_duplicate_file(self, tmp_path, capsys):
             mock_repo = MagicMock()
             mock_repo_fn.return_value = mock_repo
             mock_parser = MagicMock()
-            mock_parser.parse.return_value = [MagicMock()]
+            mock_parser.parse.return_value = [_raw_txn()]
             mock_parser_cls.return_value = mock_parser
 
             args = _make_args(file=f, command="import-budget-app")
@@ -691,16 +633,15 @@ def test_import_budget_app_success(self, tmp_path, capsys):
         mock_dedup = MagicMock()
         mock_dedup.check_file_duplicate.return_value = False
 
-        mock_txn = MagicMock()
-        mock_txn.status = "pending"
-        mock_txn.id = "txn-1"
-
-        mock_batch = MagicMock()
-        mock_batch.new_count = 10
-        mock_batch.duplicate_count = 0
-        mock_batch.flagged_count = 0
-        mock_batch.transactions = [mock_txn]
-        mock_dedup.process_batch.return_value = mock_batch
+        raw = _raw_txn()
+        txn = Transaction(
+            account_id=raw.account_id, date=raw.date, amount=raw.amount,
+            raw_description=raw.raw_description, import_id="imp-1",
+            import_hash="hash-1", dedup_key="key-1", id="txn-1",
+        )
+        mock_dedup.process_batch.return_value = BatchResult(
+            new_count=10, duplicate_count=0, flagged_count=0, transactions=[txn],
+        )
 
         with patch("src.cli._get_config") as mock_config_fn, \
              patch("src.cli._get_repo") as mock_repo_fn, \
@@ -717,7 +658,7 @@ def test_import_budget_app_success(self, tmp_path, capsys):
             mock_repo = MagicMock()
             mock_repo_fn.return_value = mock_repo
             mock_parser = MagicMock()
-            mock_parser.parse.return_value = [MagicMock()]  # 1 raw txn
+            mock_parser.parse.return_value = [raw]
             mock_parser_cls.return_value = mock_parser
             mock_cat.return_value = MagicMock(method="transfer")
 
@@ -727,6 +668,9 @@ def test_import_budget_app_success(self, tmp_path, capsys):
         assert ret == 0
         output = capsys.readouterr().out
         assert "10 new" in output
+        # No budget app category, so the transaction goes through the pipeline
+        mock_cat.assert_called_once()
+        assert mock_cat.call_args.args[0] is txn
         mock_repo.close.assert_called_once()
 
     def test_import_budget_app_empty_file(self, tmp_path, capsys):
@@ -771,6 +715,20 @@ def test_get_watch_dir_from_env(self):
         with patch.dict("os.environ", {"FINANCE_WATCH_DIR": "/data/drop"}):
             assert _get_watch_dir() == Path("/data/drop")
 
+    def test_get_watch_dirs_defaults_to_watch_dir(self):
+        """Without FINANCE_WATCH_DIRS, the single watch dir is used."""
+        from src.cli import _get_watch_dirs
+        with patch.dict("os.environ", {"FINANCE_WATCH_DIR": "/data/drop"}, clear=True):
+            assert _get_watch_dirs() == [Path("/data/drop")]
+
+    def test_get_watch_dirs_from_env(self):
+        """FINANCE_WATCH_DIRS lists several dirs, separated by os.pathsep."""
+        import os
+        from src.cli import _get_watch_dirs
+        value = os.pathsep.join(["/data/small", "/data/large", ""])
+        with patch.dict("os.environ", {"FINANCE_WATCH_DIRS": value}):
+            assert _get_watch_dirs() == [Path("/data/small"), Path("/data/large")]
+
     def test_get_sheets_not_configured(self):
         """_get_sheets returns None when env vars not set."""
         from src.cli import _get_sheets
@@ -1,5 +1,7 @@
 """Tests for src.config — YAML configuration loader."""
 
+import sys
+
 import pytest
 from pathlib import Path
 from src.config import Config
@@ -135,6 +137,206 @@ def test_finds_mercury_credit(self):
         assert acct["account_type"] == "credit"
         assert acct["import_format"] == "mercury_csv"
 
+    def test_returns_same_dict_as_accounts(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        for acct in config.accounts:
+            assert config.account_by_id(acct["id"]) is acct
+
+
+class TestQfxAcctidIndex:
+    def test_maps_acctid_to_account_id(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        index = config.qfx_acctid_index
+        assert index["1234567890"] == "wf-checking"
+        assert index["9999999=1"] == "golden1-auto"
+
+    def test_skips_accounts_without_acctid(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        with_acctid = [a for a in config.accounts if a.get("qfx_acctid")]
+        assert len(config.qfx_acctid_index) == len(with_acctid)
+
+    def test_built_once(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        assert config.qfx_acctid_index is config.qfx_acctid_index
+
+    def test_duplicate_acctid_first_entry_wins(self, tmp_path):
+        (tmp_path / "accounts.yaml").write_text(
+            "accounts:\n"
+            "  - id: acct-first\n"
+            "    qfx_acctid: '0000000001'\n"
+            "  - id: acct-second\n"
+            "    qfx_acctid: '0000000001'\n"
+        )
+        config = Config(tmp_path)
+        assert config.qfx_acctid_index == {"0000000001": "acct-first"}
+
+
+class TestAmountRuleIndex:
+    def test_sets_in_file_order_uppercased(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        patterns = [p for p, _, _ in config.amount_rule_sets]
+        assert patterns[0] == "APPLE.COM/BILL"
+        assert all(p == p.upper() for p in patterns)
+        assert len(patterns) == len(config.rules["amount_rules"])
+
+    def test_prefilter_matches_any_pattern(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        prefilter = config.amount_rule_prefilter
+        assert prefilter.search("WHOLEFDS MKT #123")
+        assert prefilter.search("PURCHASE AMZNMKTP US")
+        assert prefilter.search("PHILZ COFFEE") is None
+
+    def test_empty_patterns_dropped(self, tmp_path):
+        (tmp_path / "rules.yaml").write_text(
+            "amount_rules:\n"
+            "  - merchant_pattern: ''\n"
+            "    rules: []\n"
+        )
+        config = Config(tmp_path)
+        assert config.amount_rule_sets == []
+        assert config.amount_rule_prefilter is None
+
+
+class TestMerchantRuleIndex:
+    def test_tiers_in_file_order(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        index = config.merchant_rule_index
+        for tier in ("auto", "high_confidence"):
+            rules, _ = index[tier]
+            assert [r for _, _, r in rules] == config.merchants[tier]
+
+    def test_prefilter_contains_and_exact(self, tmp_path):
+        (tmp_path / "merchants.yaml").write_text(
+            "auto:\n"
+            "  - pattern: 'DoorDash'\n"
+            "    category_id: meal-delivery\n"
+            "  - pattern: 'Lyft'\n"
+            "    match: exact\n"
+            "    category_id: rideshare\n"
+            "  - pattern: 'ignored'\n"
+            "    match: regex\n"
+            "    category_id: other\n"
+        )
+        rules, prefilter = Config(tmp_path).merchant_rule_index["auto"]
+        assert [(t, p) for t, p, _ in rules] == [("contains", "DOORDASH"), ("exact", "LYFT")]
+        assert prefilter.search("DOORDASH*ORDER 1")
+        assert prefilter.search("LYFT")
+        assert prefilter.search("LYFT RIDE 123") is None
+        assert prefilter.search("IGNORED") is None
+
+    def test_empty_contains_pattern_disables_prefilter(self, tmp_path):
+        (tmp_path / "merchants.yaml").write_text(
+            "auto:\n"
+            "  - pattern: ''\n"
+            "    category_id: other\n"
+        )
+        _, prefilter = Config(tmp_path).merchant_rule_index["auto"]
+        assert prefilter is None
+
+
+class TestTransferRuleIndex:
+    def test_skips_unmatchable_rules(self, tmp_path):
+        (tmp_path / "rules.yaml").write_text(
+            "transfers:\n"
+            "  - pattern: 'Online Transfer'\n"
+            "    from_account: checking\n"
+            "    to_account: savings\n"
+            "  - pattern: ''\n"
+            "    from_account: checking\n"
+            "    to_account: savings\n"
+            "  - pattern: 'No Accounts'\n"
+            "    from_account: checking\n"
+            "  - pattern_fitid_suffix: 'INT'\n"
+            "    from_account: loan\n"
+            "    to_account: loan\n"
+        )
+        config = Config(tmp_path)
+        assert [p for p, _ in config.transfer_rule_sets] == ["ONLINE TRANSFER"]
+        assert set(config.transfer_rule_index) == {"checking", "savings"}
+
+    def test_grouped_by_either_account(self, tmp_path):
+        (tmp_path / "rules.yaml").write_text(
+            "transfers:\n"
+            "  - pattern: 'Card Pmt'\n"
+            "    from_account: checking\n"
+            "    to_account: credit\n"
+            "  - pattern: 'To Savings'\n"
+            "    from_account: checking\n"
+            "    to_account: savings\n"
+        )
+        index = Config(tmp_path).transfer_rule_index
+        assert [p for p, _ in index["checking"][0]] == ["CARD PMT", "TO SAVINGS"]
+        assert [p for p, _ in index["credit"][0]] == ["CARD PMT"]
+        prefilter = index["savings"][1]
+        assert prefilter.search("ONLINE TO SAVINGS")
+        assert prefilter.search("CARD PMT") is None
+
+    def test_no_rules_empty_index(self, tmp_path):
+        (tmp_path / "rules.yaml").write_text("transfers: []\n")
+        config = Config(tmp_path)
+        assert config.transfer_rule_sets == []
+        assert config.transfer_rule_index == {}
+
+
+class TestTransferNameMap:
+    def test_uppercased_names_and_aliases(self, tmp_path):
+        (tmp_path / "accounts.yaml").write_text(
+            "accounts:\n"
+            "  - id: joint-savings\n"
+            "    name: Joint Savings\n"
+            "    budget_app_name: Savings (Joint)\n"
+            "    transfer_aliases: ['360 Savings']\n"
+        )
+        assert Config(tmp_path).transfer_name_map == {
+            "JOINT SAVINGS": "joint-savings",
+            "SAVINGS (JOINT)": "joint-savings",
+            "360 SAVINGS": "joint-savings",
+        }
+
+    def test_built_once(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        assert config.transfer_name_map is config.transfer_name_map
+
+
+class TestCategoryIds:
+    def test_matches_flattened_tree(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        assert config.category_ids == tuple(config.flatten_category_tree())
+        assert config.category_id_set == set(config.category_ids)
+
+    def test_built_once(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        assert config.category_ids is config.category_ids
+        assert config.category_id_set is config.category_id_set
+
+
+class TestInternedIds:
+    def test_ids_shared_across_files(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        tree = config.flatten_category_tree()
+        for rule in config.merchants["auto"]:
+            cat_id = rule["category_id"]
+            if cat_id in tree:
+                assert next(k for k in tree if k == cat_id) is cat_id
+
+    def test_transfer_accounts_share_account_ids(self):
+        config = Config(FIXTURE_CONFIG_DIR)
+        for _, rule in config.transfer_rule_sets:
+            for key in ("from_account", "to_account"):
+                acct = config.account_by_id(rule[key])
+                assert acct is not None
+                assert acct["id"] is rule[key]
+
+    def test_id_values_interned(self, tmp_path):
+        (tmp_path / "merchants.yaml").write_text(
+            "auto:\n"
+            "  - pattern: 'DoorDash'\n"
+            "    category_id: meal-delivery\n"
+        )
+        rule = Config(tmp_path).merchants["auto"][0]
+        assert rule["category_id"] is sys.intern("meal-delivery")
+        assert rule["pattern"] == "DoorDash"
+
 
 class TestMissingConfigFile:
     def test_raises_on_missing_yaml(self, tmp_path):
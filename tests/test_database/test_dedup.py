@@ -1,7 +1,5 @@
 """Tests for the 6-tier deduplication engine."""
 
-from pathlib import Path
-
 import pytest
 
 from src.database.dedup import (
@@ -13,21 +11,18 @@
     description_similarity,
 )
 from src.database.models import Import, Transaction
-from src.database.repository import Repository
 from src.parsers.base import (
     RawTransaction,
     compute_dedup_key,
     compute_file_hash,
     compute_import_hash,
 )
-
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -121,6 +116,12 @@ def test_different_content_same_name(self, engine, repo, tmp_path):
         f.write_text("different content")
         assert engine.check_file_duplicate(f) is False
 
+    def test_precomputed_hash_used(self, engine, repo, tmp_path):
+        repo.insert_import(Import(file_name="a.qfx", file_hash="knownhash"))
+        f = tmp_path / "a.qfx"
+        f.write_text("content that hashes to something else")
+        assert engine.check_file_duplicate(f, file_hash="knownhash") is True
+
 
 # ── Tier 2: External ID ───────────────────────────────────
 
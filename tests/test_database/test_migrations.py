@@ -5,14 +5,15 @@
 
 import pytest
 
-from src.database.repository import Repository
+from src.database.repository import HISTORICAL_CATEGORY_COUNTS_SQL
+from tests.conftest import empty_repo, migrated_repo
 
 MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
+    r = empty_repo()
     yield r
     r.close()
 
@@ -37,7 +38,7 @@ def test_tracks_version(self, repo):
         row = repo.conn.execute(
             "SELECT MAX(version) FROM schema_version"
         ).fetchone()
-        assert row[0] == 3
+        assert row[0] == 4
 
     def test_idempotent(self, repo):
         repo.apply_migrations(MIGRATIONS_DIR)
@@ -45,7 +46,7 @@ def test_idempotent(self, repo):
         row = repo.conn.execute(
             "SELECT COUNT(*) FROM schema_version"
         ).fetchone()
-        assert row[0] == 3  # one record per migration
+        assert row[0] == 4  # one record per migration
 
     def test_receipt_lookup_status_column_exists(self, repo):
         repo.apply_migrations(MIGRATIONS_DIR)
@@ -76,9 +77,21 @@ def test_creates_indexes(self, repo):
             "idx_xfer_from",
             "idx_xfer_to",
             "idx_txn_normalized_desc",
+            "idx_txn_normdesc_status",
+            "idx_alloc_txn_category",
         }
         assert expected_indexes.issubset(indexes)
 
+    def test_historical_lookup_uses_covering_indexes(self, repo):
+        repo.apply_migrations(MIGRATIONS_DIR)
+        plan = " ".join(
+            row[3] for row in repo.conn.execute(
+                "EXPLAIN QUERY PLAN " + HISTORICAL_CATEGORY_COUNTS_SQL, ("NETFLIX",),
+            ).fetchall()
+        )
+        assert "COVERING INDEX idx_txn_normdesc_status" in plan
+        assert "COVERING INDEX idx_alloc_txn_category" in plan
+
 
 class TestForeignKeys:
     def test_foreign_keys_enabled(self, repo):
@@ -160,3 +173,26 @@ def test_transfer_pair_unique(self, repo):
                 "  transfer_type, match_method)"
                 " VALUES ('x2','t1','t2','cc-payment','known_pattern')"
             )
+
+
+class TestMigratedRepo:
+    def test_matches_fresh_migration(self, repo):
+        repo.apply_migrations(MIGRATIONS_DIR)
+        copy = migrated_repo()
+        schema = "SELECT type, name, sql FROM sqlite_master ORDER BY name"
+        assert copy.conn.execute(schema).fetchall() == repo.conn.execute(schema).fetchall()
+        assert copy.conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_copies_are_independent(self):
+        first, second = migrated_repo(), migrated_repo()
+        first.conn.execute(
+            "INSERT INTO imports (id, file_name, file_hash) VALUES ('i1', 'a.qfx', 'h1')"
+        )
+        first.conn.commit()
+        assert second.conn.execute("SELECT COUNT(*) FROM imports").fetchone()[0] == 0
+        assert migrated_repo().conn.execute("SELECT COUNT(*) FROM imports").fetchone()[0] == 0
+
+    def test_durability_relaxed(self):
+        conn = migrated_repo().conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
@@ -1,27 +1,23 @@
 """Tests for complex queries in queries.py."""
 
-from pathlib import Path
-
 import pytest
 
 from src.database.models import Allocation, Import, Transaction, Transfer
-from src.database.repository import Repository
 from src.database.queries import (
     batch_is_transfer,
+    get_all_category_summaries,
     get_category_summary,
     get_reconciliation_data,
     get_status_counts,
     get_transactions_with_transfer_flag,
     is_transfer,
 )
-
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -200,6 +196,34 @@ def test_excludes_other_months(self, repo, imp):
         assert summary[0]["total"] == -50.0
 
 
+class TestAllCategorySummaries:
+    def test_empty_db(self, repo):
+        assert get_all_category_summaries(repo.conn) == {}
+
+    def test_matches_per_month_summary(self, repo, imp):
+        t1 = _txn(imp.id, date="2026-01-15", amount=-50.0,
+                   import_hash="h1", dedup_key="k1")
+        t2 = _txn(imp.id, date="2026-01-20", amount=-20.0,
+                   import_hash="h2", dedup_key="k2")
+        t3 = _txn(imp.id, date="2026-02-15", amount=-30.0,
+                   import_hash="h3", dedup_key="k3")
+        for t in (t1, t2, t3):
+            repo.insert_transaction(t)
+        repo.insert_allocation(Allocation(
+            transaction_id=t1.id, category_id="groceries", amount=-50.0,
+        ))
+        repo.insert_allocation(Allocation(
+            transaction_id=t2.id, category_id="coffee-d", amount=-20.0,
+        ))
+        repo.insert_allocation(Allocation(
+            transaction_id=t3.id, category_id="groceries", amount=-30.0,
+        ))
+        summaries = get_all_category_summaries(repo.conn)
+        assert list(summaries) == ["2026-01", "2026-02"]
+        for month, rows in summaries.items():
+            assert rows == get_category_summary(repo.conn, month)
+
+
 # ── get_reconciliation_data ────────────────────────────────
 
 
@@ -12,14 +12,14 @@
     Transfer,
 )
 from src.database.repository import Repository
+from tests.conftest import migrated_repo
 
 MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -264,6 +264,28 @@ def test_get_transactions_by_import_id(self, repo, sample_import_inserted):
         assert t1.id in ids
         assert t2.id in ids
 
+    def test_apply_categorizations_bulk(self, repo, sample_import_inserted):
+        t1 = _make_txn(sample_import_inserted.id, import_hash="h1", dedup_key="k1")
+        t2 = _make_txn(sample_import_inserted.id, import_hash="h2", dedup_key="k2")
+        repo.insert_transaction(t1)
+        repo.insert_transaction(t2)
+        repo.apply_categorizations_bulk(
+            [
+                Allocation(transaction_id=t1.id, category_id="groceries", amount=-50.00),
+                Allocation(transaction_id=t2.id, category_id="uncategorized", amount=-50.00),
+            ],
+            [
+                (t1.id, "categorized", 1.0, "merchant_auto"),
+                (t2.id, "flagged", 0.0, "manual_review"),
+            ],
+        )
+        cat = repo.get_transaction(t1.id)
+        assert cat.status == "categorized"
+        assert cat.confidence == 1.0
+        assert cat.categorization_method == "merchant_auto"
+        assert repo.get_transaction(t2.id).status == "flagged"
+        assert repo.get_allocations_by_transaction(t1.id)[0].category_id == "groceries"
+
 
 # ── Transfer CRUD ──────────────────────────────────────────
 
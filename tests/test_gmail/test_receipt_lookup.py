@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -22,9 +21,7 @@
     _parse_claude_response,
 )
 from src.database.models import Allocation, Import, Transaction
-from src.database.repository import Repository
-
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
 # ── Fixtures ──────────────────────────────────────────────
@@ -32,8 +29,7 @@
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -602,11 +598,12 @@ def test_creates_allocations_and_receipt_match(self, repo, imp):
             match_type="apple_subset_sum",
             confidence=0.85,
         )
-        lookup.apply_result(txn, result)
+        returned = lookup.apply_result(txn, result)
 
         # Check allocations created
         allocs = repo.get_allocations_by_transaction(txn.id)
         assert len(allocs) == 3
+        assert {a.id for a in returned} == {a.id for a in allocs}
         cats = {a.category_id for a in allocs}
         assert "youtube-premium" in cats
         assert "cloud-storage" in cats
@@ -639,7 +636,7 @@ def test_unmatched_result_is_noop(self, repo, imp):
         lookup = ReceiptLookup(gmail, repo)
 
         result = ReceiptResult(matched=False)
-        lookup.apply_result(txn, result)
+        assert lookup.apply_result(txn, result) == []
 
         allocs = repo.get_allocations_by_transaction(txn.id)
         assert len(allocs) == 0
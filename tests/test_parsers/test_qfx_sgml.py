@@ -93,6 +93,9 @@ def test_rejects_nonexistent(self):
         parser = QfxSgmlParser("wf-checking")
         assert parser.detect(Path("/nonexistent/file.qfx")) is False
 
+    def test_sniff_rejects_uppercase_xml_declaration(self):
+        assert QfxSgmlParser.sniff(b'OFXHEADER:100\n<?XML version="1.0"?>') is False
+
 
 class TestWellsFargoChecking:
     @pytest.fixture
@@ -153,6 +153,10 @@ def test_rejects_nonexistent(self):
         parser = QfxXmlParser("cap1-credit")
         assert parser.detect(Path("/nonexistent/file.qfx")) is False
 
+    def test_sniff_tolerates_non_utf8_bytes(self):
+        head = b'<?xml version="1.0" encoding="ISO-8859-1"?>\n<!-- \xe9 -->\n<OFX>'
+        assert QfxXmlParser.sniff(head) is True
+
 
 class TestCapOneCredit:
     @pytest.fixture
@@ -14,8 +14,6 @@
   - Mercury business logic applies to refunds the same as charges
 """
 
-from pathlib import Path
-
 import pytest
 
 from src.categorize.amount_rules import match_amount_rule
@@ -29,26 +27,24 @@
 from src.categorize.transfer_detect import detect_transfer
 from src.config import Config
 from src.database.models import Allocation, Import, Transaction
-from src.database.repository import Repository
 from src.parsers.base import (
     RawTransaction,
     compute_dedup_key,
     compute_import_hash,
 )
-
-MIGRATIONS_DIR = Path(__file__).parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def config():
+    # Read-only for these tests; lazily built indexes are reused
     from tests.conftest import FIXTURE_CONFIG_DIR
     return Config(FIXTURE_CONFIG_DIR)
 
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
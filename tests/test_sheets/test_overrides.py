@@ -5,13 +5,11 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.database.models import Allocation, Import, Transaction, Transfer
-from src.database.repository import Repository
 from src.sheets.overrides import (
     ALLOC_OVERRIDE_START,
     REVIEW_OVERRIDE_START,
@@ -20,8 +18,7 @@
     PollResult,
     _cell_label,
 )
-
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
 # ── Fixtures ──────────────────────────────────────────────
@@ -29,8 +26,7 @@
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -6,19 +6,18 @@
 from __future__ import annotations
 
 import time
-from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from src.database.models import Allocation, Import, Transaction, Transfer
-from src.database.repository import Repository
 from src.sheets.push import (
     ALLOC_DATA_HEADERS,
     ALLOC_HEADERS,
     BATCH_SIZE,
     CATEGORY_HEADERS,
     MAX_WRITES_PER_MINUTE,
+    REPLACE_BATCH_SIZE,
     REVIEW_DATA_HEADERS,
     REVIEW_HEADERS,
     SHEET_ALLOCATIONS,
@@ -40,8 +39,7 @@
     transfer_to_row,
     txn_to_row,
 )
-
-MIGRATIONS_DIR = Path(__file__).parent.parent.parent / "src" / "database" / "migrations"
+from tests.conftest import migrated_repo
 
 
 # ── Fixtures ──────────────────────────────────────────────
@@ -59,6 +57,7 @@ def get_worksheet(name):
             ws.append_rows = MagicMock()
             ws.clear = MagicMock()
             ws.update = MagicMock()
+            ws.row_count = 1000  # A new sheet's default grid size
             worksheets[name] = ws
         return worksheets[name]
 
@@ -73,8 +72,7 @@ def push(mock_spreadsheet):
 
 @pytest.fixture
 def repo():
-    r = Repository(":memory:")
-    r.apply_migrations(MIGRATIONS_DIR)
+    r = migrated_repo()
     yield r
     r.close()
 
@@ -233,6 +231,21 @@ def test_formats_correctly_without_lookup(self):
         })
         assert row == ["2026-01", "groceries", "", "", "", "", -450.00, 12]
 
+    def test_hierarchy_from_lookup(self):
+        lookup = {"groceries": {
+            "name": "Groceries", "level_0": "Food", "level_1": "Groceries", "level_2": "",
+        }}
+        row = summary_to_row("2026-01", {
+            "category_id": "groceries", "total": -450.00, "txn_count": 12
+        }, lookup)
+        assert row == ["2026-01", "groceries", "Groceries", "Food", "Groceries", "", -450.00, 12]
+
+    def test_unknown_category_in_lookup(self):
+        row = summary_to_row("2026-01", {
+            "category_id": "missing", "total": -1.00, "txn_count": 1
+        }, {"groceries": {"name": "Groceries"}})
+        assert row == ["2026-01", "missing", "", "", "", "", -1.00, 1]
+
     def test_row_length_matches_headers(self):
         row = summary_to_row("2026-01", {
             "category_id": "c1", "total": 0, "txn_count": 0
@@ -249,6 +262,13 @@ def test_queue_append_accumulates(self, push):
         push.queue_append("Transactions", [["row2"]])
         assert len(push.pending_appends["Transactions"]) == 2
 
+    def test_queue_append_keeps_first_buffer(self, push):
+        rows = [["row1"]]
+        push.queue_append("Transactions", rows)
+        push.queue_append("Transactions", [["row2"]])
+        assert push.pending_appends["Transactions"] is rows
+        assert rows == [["row1"], ["row2"]]
+
     def test_queue_append_multiple_sheets(self, push):
         push.queue_append("Transactions", [["t1"]])
         push.queue_append("Allocations", [["a1"]])
@@ -279,6 +299,104 @@ def test_queue_clear_and_flush(self, push, mock_spreadsheet):
         ws = mock_spreadsheet.worksheet("Transactions")
         ws.clear.assert_called_once()
 
+    def test_worksheet_looked_up_once(self, push, mock_spreadsheet):
+        push.queue_append("Transactions", [["row1"]])
+        push.flush()
+        push.queue_append("Transactions", [["row2"]])
+        push.flush()
+        assert mock_spreadsheet.worksheet.call_count == 1
+
+    def test_worksheet_lookup_retried_after_failure(self, push, mock_spreadsheet):
+        ws = mock_spreadsheet.worksheet("Transactions")
+        mock_spreadsheet.worksheet.reset_mock()
+        ws.append_rows.side_effect = [Exception("API error"), None]
+        push.queue_append("Transactions", [["row1"]])
+        push.flush()
+        push.flush()
+        assert mock_spreadsheet.worksheet.call_count == 2
+        assert push.pending_appends == {}
+
+    def test_failed_clear_stays_queued(self, push, mock_spreadsheet):
+        mock_spreadsheet.worksheet("Transactions").clear.side_effect = Exception("API error")
+        push.queue_clear("Transactions")
+        push.queue_clear("Allocations")
+        push.flush()
+        assert push.pending_clears == {"Transactions"}
+
+    def test_flush_multiple_sheets_in_queue_order(self, push, mock_spreadsheet):
+        push.queue_append("Transactions", [["t1"]])
+        push.queue_append("Allocations", [["a1"], ["a2"]])
+        push.queue_append("Transfers", [["x1"]])
+        results = push.flush()
+        assert [r.sheet for r in results] == ["Transactions", "Allocations", "Transfers"]
+        assert [r.rows_pushed for r in results] == [1, 2, 1]
+        assert push.pending_appends == {}
+        assert push._writes_in_flight == 0
+
+    def test_queue_replace_absorbs_appends(self, push, mock_spreadsheet):
+        push.queue_replace("Transactions", [["header"]])
+        push.queue_append("Transactions", [["row1"], ["row2"]])
+        assert "Transactions" not in push.pending_appends
+        results = push.flush()
+        ws = mock_spreadsheet.worksheet("Transactions")
+        ws.clear.assert_called_once()
+        ws.update.assert_called_once_with(
+            values=[["header"], ["row1"], ["row2"]],
+            range_name="A1", value_input_option="RAW",
+        )
+        ws.append_rows.assert_not_called()
+        assert results[0].rows_pushed == 3
+        assert push.pending_replaces == {}
+
+    def test_queue_replace_supersedes_appends(self, push, mock_spreadsheet):
+        push.queue_append("Transactions", [["stale"]])
+        push.queue_replace("Transactions", [["header"], ["row1"]])
+        assert "Transactions" not in push.pending_appends
+        push.flush()
+        ws = mock_spreadsheet.worksheet("Transactions")
+        ws.clear.assert_called_once()
+        ws.update.assert_called_once_with(
+            values=[["header"], ["row1"]],
+            range_name="A1", value_input_option="RAW",
+        )
+        ws.append_rows.assert_not_called()
+
+    def test_flush_never_appends_alongside_replace(self, push, mock_spreadsheet):
+        push.pending_replaces["Transactions"] = [["header"]]
+        push.pending_appends["Transactions"] = [["row1"]]
+        results = push.flush()
+        ws = mock_spreadsheet.worksheet("Transactions")
+        ws.append_rows.assert_not_called()
+        assert [r.sheet for r in results] == ["Transactions"]
+        assert push.pending_appends == {}
+
+    def test_replace_grows_grid_before_writing(self, push, mock_spreadsheet):
+        ws = mock_spreadsheet.worksheet("Transactions")
+        rows = [[f"row{i}"] for i in range(REPLACE_BATCH_SIZE + 1)]
+        push.queue_replace("Transactions", rows)
+        results = push.flush()
+        assert ws.method_calls[:2] == [call.clear(), call.resize(rows=len(rows))]
+        assert [c.kwargs["range_name"] for c in ws.update.call_args_list] == [
+            "A1", f"A{REPLACE_BATCH_SIZE + 1}",
+        ]
+        assert results[0].api_calls == 4
+
+    def test_replace_within_grid_skips_resize(self, push, mock_spreadsheet):
+        push.queue_replace("Transactions", [["header"], ["row1"]])
+        push.flush()
+        mock_spreadsheet.worksheet("Transactions").resize.assert_not_called()
+
+    def test_failed_sheet_does_not_block_others(self, push, mock_spreadsheet):
+        mock_spreadsheet.worksheet("Allocations").append_rows.side_effect = Exception("API error")
+        push.queue_append("Transactions", [["t1"]])
+        push.queue_append("Allocations", [["a1"]])
+        results = push.flush()
+        assert [r.sheet for r in results] == ["Transactions"]
+        # Failed sheet stays queued for the next flush
+        assert push.pending_appends == {"Allocations": [["a1"]]}
+        assert push._writes_in_flight == 0
+        assert len(push._write_times) == 2
+
 
 # ── Batching tests ────────────────────────────────────────
 
@@ -434,11 +552,11 @@ def test_pushes_headers(self, push, mock_spreadsheet, repo):
         push.full_rebuild(repo)
         # With empty DB, only headers should be pushed
         ws = mock_spreadsheet.worksheet(SHEET_TRANSACTIONS)
-        # Headers are the first append_rows call
-        calls = ws.append_rows.call_args_list
-        assert len(calls) >= 1
-        first_call_rows = calls[0][0][0]
-        assert first_call_rows[0] == TXN_HEADERS
+        # Headers are the first row of the update written at A1
+        ws.update.assert_called_once_with(
+            values=[TXN_HEADERS], range_name="A1", value_input_option="RAW",
+        )
+        ws.append_rows.assert_not_called()
 
     def test_pushes_existing_data(self, push, mock_spreadsheet, repo, imp):
         txn = _txn(imp.id)
@@ -450,10 +568,9 @@ def test_pushes_existing_data(self, push, mock_spreadsheet, repo, imp):
 
         # Transactions sheet should have header + 1 data row
         ws_txn = mock_spreadsheet.worksheet(SHEET_TRANSACTIONS)
-        total_rows = sum(
-            len(c[0][0]) for c in ws_txn.append_rows.call_args_list
-        )
-        assert total_rows >= 2  # header + 1 txn
+        rows = ws_txn.update.call_args.kwargs["values"]
+        assert len(rows) == 2  # header + 1 txn
+        assert rows[1][0] == txn.id
 
     def test_pushes_summary_data(self, push, mock_spreadsheet, repo, imp):
         txn = _txn(imp.id, date="2026-01-15")
@@ -465,10 +582,71 @@ def test_pushes_summary_data(self, push, mock_spreadsheet, repo, imp):
 
         # Summary sheet should have header + at least 1 summary row
         ws_sum = mock_spreadsheet.worksheet(SHEET_SUMMARY)
-        total_rows = sum(
-            len(c[0][0]) for c in ws_sum.append_rows.call_args_list
-        )
-        assert total_rows >= 2  # header + summary
+        rows = ws_sum.update.call_args.kwargs["values"]
+        assert rows[0] == SUMMARY_HEADERS
+        assert rows[1] == ["2026-01", "groceries", "", "", "", "", -50.00, 1]
+
+    def test_skips_clear_on_empty_sheets(self, push, mock_spreadsheet, repo):
+        # Only Transactions already has content at A1
+        mock_spreadsheet.values_batch_get.return_value = {"valueRanges": [
+            {"range": "Transactions!A1", "values": [["id"]]},
+            {"range": "Allocations!A1"},
+            {"range": "Transfers!A1"},
+            {"range": "Summary!A1"},
+            {"range": "Review!A1"},
+            {"range": "Categories!A1"},
+        ]}
+        results = push.full_rebuild(repo)
+
+        mock_spreadsheet.values_batch_get.assert_called_once()
+        mock_spreadsheet.worksheet(SHEET_TRANSACTIONS).clear.assert_called_once()
+        for name in [SHEET_ALLOCATIONS, SHEET_TRANSFERS, SHEET_SUMMARY,
+                     SHEET_REVIEW, SHEET_CATEGORIES]:
+            ws = mock_spreadsheet.worksheet(name)
+            ws.clear.assert_not_called()
+            ws.update.assert_called_once()
+        assert sum(r.api_calls for r in results) == 7
+        assert push._empty_sheets == set()
+
+    def test_empty_check_failure_clears_all(self, push, mock_spreadsheet, repo):
+        mock_spreadsheet.values_batch_get.side_effect = Exception("API error")
+        push.full_rebuild(repo)
+        for name in [SHEET_TRANSACTIONS, SHEET_ALLOCATIONS, SHEET_TRANSFERS,
+                     SHEET_SUMMARY, SHEET_REVIEW, SHEET_CATEGORIES]:
+            mock_spreadsheet.worksheet(name).clear.assert_called_once()
+
+    def test_transfer_flag_from_select(self, push, mock_spreadsheet, repo, imp):
+        t1 = _txn(imp.id, amount=-100.00, import_hash="h1", dedup_key="dk1")
+        t2 = _txn(imp.id, account_id="cap1-credit", amount=100.00,
+                  import_hash="h2", dedup_key="dk2")
+        t3 = _txn(imp.id, import_hash="h3", dedup_key="dk3")
+        for t in (t1, t2, t3):
+            repo.insert_transaction(t)
+        repo.insert_transfer(Transfer(
+            from_transaction_id=t1.id, to_transaction_id=t2.id,
+            transfer_type="cc-payment", match_method="pattern",
+        ))
+
+        push.full_rebuild(repo)
+
+        rows = mock_spreadsheet.worksheet(SHEET_TRANSACTIONS).update.call_args.kwargs["values"]
+        flags = {r[0]: r[12] for r in rows[1:]}
+        assert flags == {t1.id: True, t2.id: True, t3.id: False}
+
+    def test_one_clear_and_update_per_sheet(self, push, mock_spreadsheet, repo, imp):
+        for i in range(BATCH_SIZE + 50):
+            repo.insert_transaction(_txn(
+                imp.id, import_hash=f"h{i}", dedup_key=f"dk{i}",
+            ))
+
+        results = push.full_rebuild(repo)
+
+        assert len(results) == 6
+        assert all(r.api_calls == 2 for r in results)
+        ws_txn = mock_spreadsheet.worksheet(SHEET_TRANSACTIONS)
+        ws_txn.clear.assert_called_once()
+        ws_txn.update.assert_called_once()
+        assert len(ws_txn.update.call_args.kwargs["values"]) == BATCH_SIZE + 51
 
 
 # ── Header schema tests ──────────────────────────────────
@@ -592,6 +770,41 @@ def test_push_review_no_allocation(self, push, mock_spreadsheet, repo, imp):
         assert result.rows_pushed == 1  # Still produces a row
 
 
+class TestPushBulk:
+    def test_pushes_all_three_sheets_in_one_flush(self, push, mock_spreadsheet, repo, imp):
+        txn = _txn(imp.id, amount=-100.00)
+        repo.insert_transaction(txn)
+        allocs = [
+            Allocation(transaction_id=txn.id, category_id="groceries", amount=-60.00),
+            Allocation(transaction_id=txn.id, category_id="household", amount=-40.00),
+        ]
+        with patch.object(push, "flush", wraps=push.flush) as flush:
+            results = push.push_bulk([txn], allocs, repo)
+        flush.assert_called_once()
+        pushed = {r.sheet: r.rows_pushed for r in results}
+        assert pushed == {
+            SHEET_TRANSACTIONS: 1, SHEET_ALLOCATIONS: 2, SHEET_REVIEW: 2,
+        }
+
+    def test_category_taken_from_given_allocations(self, push, mock_spreadsheet, repo, imp):
+        txn = _txn(imp.id)
+        repo.insert_transaction(txn)
+        alloc = Allocation(transaction_id=txn.id, category_id="groceries", amount=-50.00)
+        push.push_bulk([txn], [alloc], repo)
+        ws = mock_spreadsheet.worksheet(SHEET_TRANSACTIONS)
+        row = ws.append_rows.call_args_list[0][0][0][0]
+        assert row[TXN_DATA_HEADERS.index("category_id")] == "groceries"
+
+    def test_no_allocations_skips_allocations_sheet(self, push, mock_spreadsheet, repo, imp):
+        txn = _txn(imp.id)
+        repo.insert_transaction(txn)
+        results = push.push_bulk([txn], [], repo)
+        assert {r.sheet for r in results} == {SHEET_TRANSACTIONS, SHEET_REVIEW}
+
+    def test_empty(self, push, repo):
+        assert push.push_bulk([], [], repo) == []
+
+
 class TestFullRebuildReview:
     def test_review_sheet_included(self, push, mock_spreadsheet, repo, imp):
         txn = _txn(imp.id)
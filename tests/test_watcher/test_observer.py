@@ -12,6 +12,8 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -27,6 +29,8 @@
     ImportResult,
     SUPPORTED_EXTENSIONS,
     _extract_acctid,
+    _filesystem_type,
+    _read_tail,
     _resolve_account_id,
     detect_parser,
     validate_file_completeness,
@@ -151,6 +155,9 @@ def _make_config(accounts=None):
         {"id": "amex-blue", "qfx_acctid": "TESTACCTID12345|99999"},
         {"id": "golden1-auto", "qfx_acctid": "9999999=1"},
     ]
+    config.qfx_acctid_index = {
+        a["qfx_acctid"]: a["id"] for a in config.accounts if a.get("qfx_acctid")
+    }
     config.budget_app_category_map = {}
     return config
 
@@ -158,6 +165,10 @@ def _make_config(accounts=None):
 # ── wait_for_stable() tests ──────────────────────────────
 
 
+class _StopPolling(Exception):
+    """Raised from a patched sleep to end a wait_for_stable loop."""
+
+
 class TestWaitForStable:
     """Tests for wait_for_stable() file stability monitor."""
 
@@ -168,8 +179,8 @@ def test_stable_file_returns_quickly(self, tmp_path):
 
         # Use very short stability/check intervals for fast test
         with patch("src.watcher.observer.time.sleep"):
-            wait_for_stable(f, stability_seconds=0, check_interval=0.01)
-        # No exception = success
+            stat = wait_for_stable(f, stability_seconds=0, check_interval=0.01)
+        assert stat.st_size == len("stable content")
 
     def test_timeout_when_max_wait_exceeded(self, tmp_path):
         """A file that hasn't been stable long enough times out at max_wait."""
@@ -193,6 +204,44 @@ def test_timeout_raises_with_filepath(self, tmp_path):
             with pytest.raises(TimeoutError, match="growing.csv"):
                 wait_for_stable(f, stability_seconds=100, max_wait=0.001)
 
+    def _record_sleeps(self, f, calls, on_call=None):
+        """Run wait_for_stable, recording sleep intervals for `calls` polls."""
+        intervals = []
+
+        def fake_sleep(seconds):
+            intervals.append(seconds)
+            if on_call:
+                on_call(len(intervals))
+            if len(intervals) == calls:
+                raise _StopPolling
+
+        with patch("src.watcher.observer.time.sleep", side_effect=fake_sleep):
+            with pytest.raises(_StopPolling):
+                wait_for_stable(f, stability_seconds=100, check_interval=2.0)
+        return intervals
+
+    def test_poll_interval_backs_off_to_check_interval(self, tmp_path):
+        """Polling starts at 0.25s and grows by 1.5x up to check_interval."""
+        f = tmp_path / "test.qfx"
+        f.write_text("stable content")
+        intervals = self._record_sleeps(f, 8)
+        assert intervals[:3] == [0.25, 0.375, 0.5625]
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == 2.0
+
+    def test_poll_interval_resets_when_file_changes(self, tmp_path):
+        """A size change restarts the backoff at the initial interval."""
+        f = tmp_path / "test.qfx"
+        f.write_text("initial")
+
+        def grow(n):
+            if n == 4:
+                f.write_text("initial plus more data")
+
+        intervals = self._record_sleeps(f, 6, on_call=grow)
+        assert intervals[4] == 0.25
+        assert intervals[5] == 0.375
+
 
 # ── validate_file_completeness() tests ───────────────────
 
@@ -252,12 +301,32 @@ def test_ofx_missing_tag_fails(self, tmp_path):
         with pytest.raises(FileStabilityError, match="missing closing </OFX>"):
             validate_file_completeness(f)
 
+    def test_large_qfx_closing_tag_in_tail(self, tmp_path):
+        """Closing tag after a large body is found (lowercase too)."""
+        f = tmp_path / "large.qfx"
+        f.write_text("<OFX>" + "<STMTTRN>x</STMTTRN>\n" * 5000 + "</ofx>\n")
+        validate_file_completeness(f)  # No exception
+
+    def test_closing_tag_only_at_head_fails(self, tmp_path):
+        """A </OFX> outside the scanned tail doesn't count as complete."""
+        f = tmp_path / "truncated.qfx"
+        f.write_text("<OFX></OFX>" + "x" * 10000)
+        with pytest.raises(FileStabilityError, match="missing closing </OFX>"):
+            validate_file_completeness(f)
+
     def test_unknown_extension_passes(self, tmp_path):
         """Files with unknown extensions are not validated (no error)."""
         f = tmp_path / "data.txt"
         f.write_text("any content")
         validate_file_completeness(f)  # No exception
 
+    def test_read_tail(self, tmp_path):
+        """_read_tail returns the size and at most the last nbytes."""
+        f = tmp_path / "data.csv"
+        f.write_bytes(b"abc\n")
+        assert _read_tail(f, 1) == (4, b"\n")
+        assert _read_tail(f, 100) == (4, b"abc\n")
+
 
 # ── _extract_acctid() tests ──────────────────────────────
 
@@ -295,6 +364,18 @@ def test_no_acctid_returns_none(self, tmp_path):
         f.write_text("<OFX>no account id here</OFX>")
         assert _extract_acctid(f) is None
 
+    def test_only_file_head_searched(self, tmp_path):
+        """ACCTID is looked up in the first 64KB, not the whole file."""
+        f = tmp_path / "test.qfx"
+        f.write_bytes(b"x" * 70000 + b"<ACCTID>1234567890\n</OFX>")
+        assert _extract_acctid(f) is None
+
+    def test_non_utf8_header_bytes(self, tmp_path):
+        """Undecodable bytes elsewhere in the header don't break lookup."""
+        f = tmp_path / "test.qfx"
+        f.write_bytes(b"<NAME>CAF\xc9\n<ACCTID>0217\n</OFX>")
+        assert _extract_acctid(f) == "0217"
+
     def test_unreadable_file_returns_none(self, tmp_path):
         """Unreadable files return None gracefully."""
         f = tmp_path / "nonexistent.qfx"
@@ -365,6 +446,18 @@ def test_budget_app_csv_detected(self, tmp_path):
         from src.parsers.budget_app import BudgetAppCsvParser
         assert isinstance(parser, BudgetAppCsvParser)
 
+    def test_only_matching_parser_constructed(self, tmp_path):
+        """A budget app CSV never builds the Mercury parser."""
+        f = tmp_path / "register.csv"
+        _write_budget_app_csv(f)
+        from src.parsers.budget_app import BudgetAppCsvParser
+        from src.parsers.csv_parser import MercuryCsvParser
+        with patch.object(
+            MercuryCsvParser, "__init__", side_effect=AssertionError("built"),
+        ):
+            parser = detect_parser(f)
+        assert isinstance(parser, BudgetAppCsvParser)
+
     def test_unknown_file_raises(self, tmp_path):
         """Unknown files raise ValueError."""
         f = tmp_path / "random.csv"
@@ -398,6 +491,29 @@ def test_qfx_without_acctid_uses_unknown(self, tmp_path):
         assert isinstance(parser, QfxSgmlParser)
         assert parser.account_id == "unknown"
 
+    def test_pre_read_head_used_without_reading_file(self, tmp_path):
+        """A passed-in head is enough for detection and ACCTID lookup."""
+        src = tmp_path / "source.qfx"
+        _write_sgml_qfx(src, acctid="0987654321")
+        head = src.read_bytes()
+        missing = tmp_path / "not-on-disk.qfx"
+        parser = detect_parser(missing, _make_config(), head=head)
+        from src.parsers.qfx_sgml import QfxSgmlParser
+        assert isinstance(parser, QfxSgmlParser)
+        assert parser.account_id == "wf-savings"
+
+    def test_unmapped_acctid_warned_every_time(self, tmp_path, caplog):
+        """Each detection of an unmapped ACCTID logs its own warning."""
+        f = tmp_path / "other.qfx"
+        _write_sgml_qfx(f, acctid="5555555555")
+        config = _make_config()
+        with caplog.at_level("WARNING", logger="src.watcher.observer"):
+            first = detect_parser(f, config)
+            second = detect_parser(f, config)
+        assert first is not second
+        warnings = [r for r in caplog.records if "No account mapping" in r.getMessage()]
+        assert len(warnings) == 2
+
 
 # ── ImportResult tests ───────────────────────────────────
 
@@ -450,6 +566,20 @@ def test_unsupported_extension(self, tmp_path):
         assert result.status == "error"
         assert "Unsupported file extension" in result.error_message
 
+    def test_passed_stat_used_for_file_size(self, tmp_path):
+        """A stat result from the caller sets file_size without re-stat."""
+        pipeline, repo, dedup = self._make_pipeline()
+        dedup.check_file_duplicate.return_value = False
+        f = tmp_path / "test.qfx"
+        _write_sgml_qfx(f)
+
+        with patch("src.watcher.observer.detect_parser") as mock_detect:
+            mock_detect.return_value.parse.return_value = []
+            mock_detect.return_value.skipped_count = 0
+            pipeline.process_file(f, stat=MagicMock(st_size=1234))
+
+        assert repo.insert_import.call_args[0][0].file_size == 1234
+
     def test_duplicate_file_skipped(self, tmp_path):
         """Duplicate files (Tier 1 dedup) are skipped."""
         pipeline, _, dedup = self._make_pipeline()
@@ -460,6 +590,42 @@ def test_duplicate_file_skipped(self, tmp_path):
         result = pipeline.process_file(f)
         assert result.status == "duplicate"
 
+    def test_duplicate_file_cancels_queued_parse(self, tmp_path):
+        """A duplicate's parse is cancelled while still queued."""
+        pipeline, _, dedup = self._make_pipeline()
+        pipeline.parse_workers = 1
+        dedup.check_file_duplicate.return_value = True
+
+        f = tmp_path / "dup.qfx"
+        _write_sgml_qfx(f)
+        release = threading.Event()
+        with patch.object(
+            pipeline, "_detect_and_parse", side_effect=lambda *a: release.wait(),
+        ) as parse:
+            # Occupy the single parse worker so the duplicate's parse queues
+            pipeline._submit_parse(f, None)
+            result = pipeline.process_file(f)
+            release.set()
+            pipeline.close()
+        assert result.status == "duplicate"
+        assert parse.call_count == 1
+
+    def test_parse_pool_shared_across_files(self, tmp_path):
+        """One bounded parse pool serves every file until close()."""
+        pipeline, _, dedup = self._make_pipeline()
+        dedup.check_file_duplicate.return_value = True
+
+        f = tmp_path / "dup.qfx"
+        _write_sgml_qfx(f)
+        pipeline.process_file(f)
+        pool = pipeline._parse_pool
+        pipeline.process_file(f)
+        assert pipeline._parse_pool is pool
+        assert pool._max_workers == pipeline.parse_workers
+
+        pipeline.close()
+        assert pipeline._parse_pool is None
+
     def test_successful_import(self, tmp_path):
         """Full successful import: parse, dedup, categorize."""
         pipeline, repo, dedup = self._make_pipeline()
@@ -480,8 +646,8 @@ def test_successful_import(self, tmp_path):
         f = tmp_path / "test.qfx"
         _write_sgml_qfx(f, acctid="1234567890")
 
-        with patch("src.watcher.observer.categorize_transaction") as mock_cat, \
-             patch("src.watcher.observer.apply_categorization"):
+        with patch("src.categorize.pipeline.categorize_transaction") as mock_cat, \
+             patch("src.watcher.observer.apply_categorizations"):
             mock_cat.return_value = MagicMock(method="merchant_auto")
             result = pipeline.process_file(f)
 
@@ -527,8 +693,26 @@ def test_parse_error_records_error(self, tmp_path):
         call_args = repo.update_import_status.call_args
         assert call_args[0][1] == "error"
 
+    def test_failed_error_status_write_keeps_original_error(self, tmp_path):
+        """If recording the error fails too, the original error is returned."""
+        pipeline, repo, dedup = self._make_pipeline()
+        dedup.check_file_duplicate.return_value = False
+        repo.update_import_status.side_effect = sqlite3.OperationalError("database is locked")
+
+        f = tmp_path / "bad.qfx"
+        _write_sgml_qfx(f)
+
+        with patch("src.watcher.observer.detect_parser") as mock_detect:
+            mock_detect.side_effect = ValueError("No parser found")
+            result = pipeline.process_file(f)
+
+        assert result.status == "error"
+        assert "No parser found" in result.error_message
+        repo.update_import_status.assert_called_once()
+        assert not pipeline._db_lock.locked()
+
     def test_sheets_push_called(self, tmp_path):
-        """When sheets is configured, push_transactions is called."""
+        """When sheets is configured, push_bulk is called once."""
         mock_sheets = MagicMock()
         pipeline, repo, dedup = self._make_pipeline(sheets=mock_sheets)
         dedup.check_file_duplicate.return_value = False
@@ -548,18 +732,23 @@ def test_sheets_push_called(self, tmp_path):
         f = tmp_path / "test.qfx"
         _write_sgml_qfx(f)
 
-        with patch("src.watcher.observer.categorize_transaction") as mock_cat, \
-             patch("src.watcher.observer.apply_categorization"):
+        allocs = [MagicMock(transaction_id="txn-1")]
+        with patch("src.categorize.pipeline.categorize_transaction") as mock_cat, \
+             patch("src.watcher.observer.apply_categorizations", return_value=allocs):
             mock_cat.return_value = MagicMock(method="merchant_auto")
             result = pipeline.process_file(f)
 
         assert result.status == "success"
-        mock_sheets.push_transactions.assert_called_once()
+        mock_sheets.push_bulk.assert_called_once()
+        mock_sheets.push_transactions.assert_not_called()
+        # Allocations come from categorization, not a read-back query
+        assert mock_sheets.push_bulk.call_args[0][1] is allocs
+        repo.get_allocations_by_transaction_ids.assert_not_called()
 
     def test_sheets_error_does_not_fail_import(self, tmp_path):
         """Sheets push errors don't cause the import to fail."""
         mock_sheets = MagicMock()
-        mock_sheets.push_transactions.side_effect = Exception("Sheets API error")
+        mock_sheets.push_bulk.side_effect = Exception("Sheets API error")
         pipeline, repo, dedup = self._make_pipeline(sheets=mock_sheets)
         dedup.check_file_duplicate.return_value = False
 
@@ -577,8 +766,8 @@ def test_sheets_error_does_not_fail_import(self, tmp_path):
         f = tmp_path / "test.qfx"
         _write_sgml_qfx(f)
 
-        with patch("src.watcher.observer.categorize_transaction") as mock_cat, \
-             patch("src.watcher.observer.apply_categorization"):
+        with patch("src.categorize.pipeline.categorize_transaction") as mock_cat, \
+             patch("src.watcher.observer.apply_categorizations"):
             mock_cat.return_value = MagicMock(method="merchant_auto")
             result = pipeline.process_file(f)
 
@@ -609,14 +798,70 @@ def test_only_pending_transactions_categorized(self, tmp_path):
         f = tmp_path / "test.qfx"
         _write_sgml_qfx(f)
 
-        with patch("src.watcher.observer.categorize_transaction") as mock_cat, \
-             patch("src.watcher.observer.apply_categorization"):
+        with patch("src.categorize.pipeline.categorize_transaction") as mock_cat, \
+             patch("src.watcher.observer.apply_categorizations"):
             mock_cat.return_value = MagicMock(method="merchant_auto")
             result = pipeline.process_file(f)
 
         assert result.categorized_count == 1
         assert mock_cat.call_count == 1
 
+    def test_db_stage_runs_under_lock(self, tmp_path):
+        """Dedup + insert run inside the DB lock; parsing runs off-thread."""
+        pipeline, repo, dedup = self._make_pipeline()
+        dedup.check_file_duplicate.return_value = False
+        lock_held = {}
+
+        def parse(path):
+            lock_held["parse_on_main"] = threading.current_thread() is threading.main_thread()
+            return [MagicMock()]
+
+        def process_batch(*args, **kwargs):
+            lock_held["dedup"] = pipeline._db_lock.locked()
+            return MagicMock(
+                new_count=0, duplicate_count=1, flagged_count=0, transactions=[],
+            )
+
+        dedup.process_batch.side_effect = process_batch
+        f = tmp_path / "test.qfx"
+        _write_sgml_qfx(f)
+
+        with patch("src.watcher.observer.detect_parser") as mock_detect:
+            mock_detect.return_value.parse.side_effect = parse
+            mock_detect.return_value.skipped_count = 0
+            result = pipeline.process_file(f)
+
+        assert result.status == "success"
+        assert lock_held == {"parse_on_main": False, "dedup": True}
+        assert not pipeline._db_lock.locked()
+
+    def test_parse_overlaps_file_hash(self, tmp_path):
+        """The file is parsed while its hash is being computed."""
+        pipeline, repo, dedup = self._make_pipeline()
+        dedup.check_file_duplicate.return_value = False
+        parse_started = threading.Event()
+
+        def slow_hash(path):
+            # Only returns once parsing has begun on the other thread
+            assert parse_started.wait(timeout=5)
+            return "hash"
+
+        def parse(path):
+            parse_started.set()
+            return []
+
+        f = tmp_path / "test.qfx"
+        _write_sgml_qfx(f)
+
+        with patch("src.watcher.observer.compute_file_hash", side_effect=slow_hash), \
+             patch("src.watcher.observer.detect_parser") as mock_detect:
+            mock_detect.return_value.parse.side_effect = parse
+            mock_detect.return_value.skipped_count = 0
+            result = pipeline.process_file(f)
+
+        assert result.status == "success"
+        dedup.check_file_duplicate.assert_called_once_with(f, "hash")
+
 
 # ── FileWatcher tests ────────────────────────────────────
 
@@ -654,7 +899,7 @@ def test_on_created_processes_qfx(self, tmp_path):
 
         with patch("src.watcher.observer.wait_for_stable"), \
              patch("src.watcher.observer.validate_file_completeness"):
-            watcher.on_created(event)
+            watcher.on_created(event).result(timeout=5)
 
         pipeline.process_file.assert_called_once()
 
@@ -698,7 +943,7 @@ def test_on_created_processes_csv(self, tmp_path):
 
         with patch("src.watcher.observer.wait_for_stable"), \
              patch("src.watcher.observer.validate_file_completeness"):
-            watcher.on_created(event)
+            watcher.on_created(event).result(timeout=5)
 
         pipeline.process_file.assert_called_once()
 
@@ -721,6 +966,24 @@ def test_process_file_handles_stability_error(self, tmp_path):
         assert result.status == "error"
         assert "missing </OFX>" in result.error_message
 
+    def test_process_file_passes_stable_stat(self, tmp_path):
+        """The stat from wait_for_stable is handed to the pipeline."""
+        watcher, pipeline = self._make_watcher(tmp_path)
+        pipeline.process_file.return_value = ImportResult(
+            file_name="test.qfx", status="success",
+        )
+        drop = tmp_path / "drop"
+        drop.mkdir()
+        f = drop / "test.qfx"
+        _write_sgml_qfx(f)
+        stable = os.stat(f)
+
+        with patch("src.watcher.observer.wait_for_stable", return_value=stable), \
+             patch("src.watcher.observer.validate_file_completeness"):
+            watcher._process_file(f)
+
+        assert pipeline.process_file.call_args.kwargs["stat"] is stable
+
     def test_process_file_handles_timeout(self, tmp_path):
         """_process_file catches TimeoutError and returns error result."""
         watcher, pipeline = self._make_watcher(tmp_path)
@@ -762,6 +1025,119 @@ def test_stop_without_start(self, tmp_path):
         watcher, _ = self._make_watcher(tmp_path)
         watcher.stop()  # No exception
 
+    def test_files_processed_concurrently(self, tmp_path):
+        """Several dropped files are in flight on the pool at once."""
+        watcher, pipeline = self._make_watcher(tmp_path)
+        watcher.max_workers = 2
+        both_running = threading.Barrier(2, timeout=5)
+
+        def process(filepath, **kwargs):
+            both_running.wait()  # Deadlocks (times out) if run sequentially
+            return ImportResult(file_name=filepath.name, status="success")
+
+        pipeline.process_file.side_effect = process
+
+        drop = tmp_path / "drop"
+        drop.mkdir()
+        futures = []
+        with patch("src.watcher.observer.wait_for_stable"), \
+             patch("src.watcher.observer.validate_file_completeness"):
+            for name in ("a.qfx", "b.qfx"):
+                f = drop / name
+                _write_sgml_qfx(f)
+                event = MagicMock(is_directory=False, src_path=str(f))
+                futures.append(watcher.on_created(event))
+            results = [fut.result(timeout=5) for fut in futures]
+
+        assert [r.status for r in results] == ["success", "success"]
+        watcher.stop()
+
+    def test_stop_waits_for_in_flight_imports(self, tmp_path):
+        """stop() shuts down the worker pool after queued files finish."""
+        watcher, pipeline = self._make_watcher(tmp_path)
+        pipeline.process_file.return_value = ImportResult(
+            file_name="test.qfx", status="success",
+        )
+        drop = tmp_path / "drop"
+        drop.mkdir()
+        f = drop / "test.qfx"
+        _write_sgml_qfx(f)
+        event = MagicMock(is_directory=False, src_path=str(f))
+
+        with patch("src.watcher.observer.wait_for_stable"), \
+             patch("src.watcher.observer.validate_file_completeness"):
+            future = watcher.on_created(event)
+            watcher.stop()
+
+        assert future.done()
+        assert watcher._pool is None
+
+
+# ── Observer selection tests ─────────────────────────────
+
+
+class TestObserverMode:
+    """Tests for choosing the native vs polling observer."""
+
+    MOUNTS = (
+        "/dev/sda1 / ext4 rw 0 0\n"
+        "nas:/volume1 /mnt/nas nfs4 rw 0 0\n"
+        "drop /mnt/my\\040drop virtiofs rw 0 0\n"
+    )
+
+    def test_filesystem_type_longest_mount_wins(self, tmp_path):
+        mounts = tmp_path / "mounts"
+        mounts.write_text(self.MOUNTS)
+        assert _filesystem_type(Path("/home/user/import"), mounts) == "ext4"
+        assert _filesystem_type(Path("/mnt/nas/import"), mounts) == "nfs4"
+        assert _filesystem_type(Path("/mnt/nasty"), mounts) == "ext4"
+        assert _filesystem_type(Path("/mnt/my drop/x"), mounts) == "virtiofs"
+
+    def test_filesystem_type_without_mount_table(self, tmp_path):
+        assert _filesystem_type(tmp_path, tmp_path / "missing") is None
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="observer_mode"):
+            FileWatcher(tmp_path, MagicMock(), observer_mode="inotify")
+
+    def _observer_for(self, tmp_path, mode, fstype="ext4"):
+        watcher = FileWatcher(tmp_path, MagicMock(), observer_mode=mode)
+        with patch("src.watcher.observer._filesystem_type", return_value=fstype), \
+             patch("watchdog.observers.Observer") as native, \
+             patch("watchdog.observers.polling.PollingObserver") as polling:
+            observer = watcher._start_observer()
+        observer.start.assert_called_once()
+        return observer, native, polling
+
+    def test_polling_mode_always_polls(self, tmp_path):
+        observer, native, polling = self._observer_for(tmp_path, "polling")
+        assert observer is polling.return_value
+        native.assert_not_called()
+
+    def test_auto_uses_native_on_local_fs(self, tmp_path):
+        observer, native, polling = self._observer_for(tmp_path, "auto", "ext4")
+        assert observer is native.return_value
+        polling.assert_not_called()
+
+    def test_auto_polls_on_network_fs(self, tmp_path):
+        observer, native, polling = self._observer_for(tmp_path, "auto", "nfs4")
+        assert observer is polling.return_value
+        native.assert_not_called()
+
+    def test_native_falls_back_to_polling_on_error(self, tmp_path):
+        """inotify running out of watches at start() falls back to polling."""
+        from watchdog.observers.polling import PollingObserver
+
+        watcher = FileWatcher(tmp_path, MagicMock(), observer_mode="native")
+        limit = OSError(28, "inotify watch limit reached")
+        with patch("watchdog.observers.inotify.InotifyBuffer", side_effect=limit):
+            watcher.start()
+        try:
+            assert isinstance(watcher._observer, PollingObserver)
+            assert watcher._observer.is_alive()
+        finally:
+            watcher.stop()
+
 
 # ── SUPPORTED_EXTENSIONS tests ───────────────────────────
 